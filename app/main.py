@@ -1,9 +1,13 @@
 import os
 import logging
-from fastapi import FastAPI, Body
-from fastapi.responses import JSONResponse, FileResponse
+import sqlite3
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable, Iterable, Iterator, Literal
+from fastapi import FastAPI, Body, Query
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 # 로깅 설정
 logging.basicConfig(
@@ -21,22 +25,226 @@ try:
 except Exception:
 	NaverScraper = None  # type: ignore
 
-from app.utils.csv_writer import append_article_bundle_row
-
-app = FastAPI(title="CafeScraper", version="0.1.0")
+from app.scraper.html_parser import shutdown_parse_pool
+from app.scraper.images import download_stats, shutdown_image_pool
+from app.scraper.lean import LeanSettings
+from app.scraper.pool import BrowserPool
+from app.scraper.transcode import shutdown_transcode_pool
+from app.utils.checkpoint import CheckpointStore, RunCheckpoint
+from app.utils.csv_writer import CsvSink, WriteBehindWriter, append_article_bundle_row, shutdown_writers
+from app.utils.event_stream import MEDIA_TYPES, STREAM_FORMATS, stream_events
+from app.utils.image_store import ImageStore
+from app.utils.jobs import Job, JobManager
+from app.utils.seen_index import DedupPolicy, close_seen_indexes, get_seen_index
 
 SESSIONS_DIR = os.path.abspath(os.path.join(os.getcwd(), "sessions"))
 OUTPUTS_DIR = os.path.abspath(os.path.join(os.getcwd(), "outputs"))
 SNAPSHOTS_DIR = os.path.abspath(os.path.join(os.getcwd(), "snapshots"))
 STATIC_DIR = os.path.abspath(os.path.join(os.getcwd(), "app", "static"))
+# image_processing="server" 이미지 저장소 (내용 해시 기준)
+IMAGES_DIR = os.path.join(OUTPUTS_DIR, "images")
 
-for _d in (SESSIONS_DIR, OUTPUTS_DIR, SNAPSHOTS_DIR, STATIC_DIR):
+for _d in (SESSIONS_DIR, OUTPUTS_DIR, SNAPSHOTS_DIR, STATIC_DIR, IMAGES_DIR):
 	os.makedirs(_d, exist_ok=True)
 
+# 브라우저 풀 설정 (환경 변수로 조정)
+POOL_SIZE = int(os.getenv("CAFESCRAPER_POOL_SIZE", "2"))
+POOL_PREWARM = int(os.getenv("CAFESCRAPER_POOL_PREWARM", "1"))
+POOL_CHECKOUT_TIMEOUT = float(os.getenv("CAFESCRAPER_POOL_TIMEOUT", "300"))
+# 게시글 추출 방식: js, selenium, html, network
+EXTRACTION_MODE = os.getenv("CAFESCRAPER_EXTRACTION", "js")
+# 경량 페이지 모드 (헤드리스 + 광고/분석/폰트/동영상 요청 차단)
+LEAN_SETTINGS = LeanSettings.from_env() if os.getenv("CAFESCRAPER_LEAN", "0") == "1" else None
+# 수집 경로: browser, hybrid (로그인 쿠키를 공유하는 HTTP 세션 우선)
+FETCH_MODE = os.getenv("CAFESCRAPER_FETCH", "browser")
+# 실행 간 중복 수집 방지 - CSV에 기록한 게시글 이력과 기본 정책 (요청의 dedup 필드로 변경 가능)
+SEEN_INDEX_DB = os.getenv("CAFESCRAPER_SEEN_DB", os.path.join(OUTPUTS_DIR, "seen.sqlite3"))
+DEDUP_POLICY = DedupPolicy.from_env()
+# 증분 크롤링 - 게시판별로 이전 실행에서 본 가장 큰 article_id 이후 게시글만 목록에서 수집 (요청의 incremental 필드로 변경 가능)
+INCREMENTAL = os.getenv("CAFESCRAPER_INCREMENTAL", "0") == "1"
+
+browser_pool = BrowserPool(
+	lambda: NaverScraper(SESSIONS_DIR, SNAPSHOTS_DIR, extraction_mode=EXTRACTION_MODE, lean=LEAN_SETTINGS, fetch_mode=FETCH_MODE, images_dir=IMAGES_DIR, seen_index_path=SEEN_INDEX_DB, dedup=DEDUP_POLICY, incremental=INCREMENTAL),
+	size=POOL_SIZE,
+	checkout_timeout=POOL_CHECKOUT_TIMEOUT,
+)
+image_store = ImageStore(IMAGES_DIR)
+seen_index = get_seen_index(SEEN_INDEX_DB)
+# 백그라운드 작업 실행 스레드 수 (기본: 브라우저 풀 크기)
+job_manager = JobManager(max_workers=int(os.getenv("CAFESCRAPER_JOB_WORKERS", str(POOL_SIZE))))
+# 배치 크롤링 체크포인트 (중단된 배치를 이어서 수집)
+CHECKPOINT_DB = os.getenv("CAFESCRAPER_CHECKPOINT_DB", os.path.join(OUTPUTS_DIR, "checkpoints.sqlite3"))
+checkpoint_store = CheckpointStore(CHECKPOINT_DB)
+# 이 프로세스에서 실행 중인 배치 (같은 배치를 동시에 재개하지 않도록)
+_active_runs: set[str] = set()
+
+
+def _consume_results(results: Iterable[dict], writer: WriteBehindWriter, keep_results: bool, skip_errors: bool = True) -> tuple[list[dict], int, int]:
+	"""스크래퍼 제너레이터를 소비하며 끝난 게시글부터 CSV에 기록
+
+	keep_results가 False면 응답용 목록을 만들지 않으므로 게시글 수와 관계없이 메모리 사용량이 일정하다.
+	반환값: (응답용 결과 목록, 성공 수, 실패 수)
+	"""
+	kept = []
+	save = writer.writer_for(skip_errors=skip_errors)
+	success_count = 0
+	error_count = 0
+	for result in results:
+		if "error" in result:
+			error_count += 1
+		else:
+			success_count += 1
+		save(result)
+		if keep_results:
+			kept.append(result)
+	return kept, success_count, error_count
+
+
+def _start_batch_run(payload: BaseModel) -> tuple[int, RunCheckpoint]:
+	"""배치 ID를 정하고 체크포인트를 생성 (같은 초에 시작한 배치는 다음 ID 사용)"""
+	batch_id = int(time.time())
+	while True:
+		try:
+			return batch_id, checkpoint_store.create_run(str(batch_id), "batch", payload.model_dump())
+		except sqlite3.IntegrityError:
+			batch_id += 1
+
+
+def _csv_writer(batch_id: int | None = None, checkpoint: RunCheckpoint | None = None) -> WriteBehindWriter:
+	"""CSV 쓰기 스레드 - 디스크에 기록된 게시글을 수집 이력에 남기고, checkpoint가 있으면 CSV 위치까지 체크포인트에 확정"""
+	def on_written(bundles: list[dict], path: str, offset: int) -> None:
+		if checkpoint is not None:
+			checkpoint.record_written(bundles, path, offset)
+		try:
+			seen_index.mark_bundles(bundles)
+		except sqlite3.Error as e:
+			print(f"⚠️ 수집 이력 기록 실패: {e}")
+	
+	path = checkpoint.info()["csv_path"] if checkpoint is not None else None
+	return WriteBehindWriter(CsvSink(OUTPUTS_DIR, batch_id, path=path), on_written=on_written)
+
+
+def _dedup_policy(payload: BaseModel) -> DedupPolicy:
+	"""요청의 dedup/dedup_max_age_hours (없으면 서버 기본 정책)"""
+	mode = getattr(payload, "dedup", None)
+	if mode is None:
+		return DEDUP_POLICY
+	max_age_hours = getattr(payload, "dedup_max_age_hours", None)
+	return DedupPolicy(mode, DEDUP_POLICY.max_age_hours if max_age_hours is None else max_age_hours)
+
+
+def _apply_crawl_options(scraper: Any, payload: BaseModel) -> None:
+	"""빌린 스크래퍼에 요청별 수집 옵션(중복 정책, 증분 크롤링, 필드 프로젝션) 적용 - 반납 시 reset_state에서 복원"""
+	scraper.dedup = _dedup_policy(payload)
+	incremental = getattr(payload, "incremental", None)
+	if incremental is not None:
+		scraper.incremental = incremental
+	fields = getattr(payload, "fields", None)
+	if fields is not None:
+		scraper.fields = scraper.parse_fields(fields)
+
+
+@contextmanager
+def _tracked_run(checkpoint: RunCheckpoint | None):
+	"""체크포인트 실행 구간 - 시작 시 CSV를 확정된 위치까지 정리하고, 끝나면 done, 중단되면 interrupted로 표시"""
+	if checkpoint is None:
+		yield
+		return
+	if checkpoint.run_id in _active_runs:
+		raise RuntimeError(f"이미 실행 중인 배치입니다: {checkpoint.run_id}")
+	_active_runs.add(checkpoint.run_id)
+	try:
+		checkpoint.prepare_output()
+		checkpoint.set_status("running")
+		yield
+	except BaseException:
+		checkpoint.set_status("interrupted")
+		raise
+	else:
+		if checkpoint.status == "running":
+			checkpoint.set_status("done")
+	finally:
+		_active_runs.discard(checkpoint.run_id)
+
+
+def _scrape_events(start: Callable[[Any], Iterator[dict]], batch_id: int | None = None, checkpoint: RunCheckpoint | None = None, options: BaseModel | None = None) -> Iterator[dict]:
+	"""브라우저를 빌려 스크래핑하면서 start/article/done 이벤트를 차례로 반환 (스트리밍 엔드포인트용)
+
+	start는 빌린 스크래퍼를 받아 게시글 제너레이터(iter_cafe, iter_batch 등)를 돌려주는 함수.
+	"""
+	started = time.monotonic()
+	success_count = 0
+	error_count = 0
+	with _tracked_run(checkpoint), browser_pool.borrow() as scraper, _csv_writer(batch_id, checkpoint) as writer:
+		if options is not None:
+			_apply_crawl_options(scraper, options)
+		yield {"event": "start", "batch_id": batch_id}
+		save = writer.writer_for(skip_errors=True)
+		for result in start(scraper):
+			if "error" in result:
+				error_count += 1
+			else:
+				success_count += 1
+			save(result)
+			yield {
+				"event": "article",
+				"index": success_count + error_count - 1,
+				"articles_scraped": success_count,
+				"articles_failed": error_count,
+				"elapsed_seconds": round(time.monotonic() - started, 1),
+				"article": result
+			}
+
+	yield {
+		"event": "done",
+		"status": "success",
+		"message": f"스크래핑 완료: {success_count}개 게시글 처리 성공, {error_count}개 실패",
+		"articles_scraped": success_count,
+		"articles_failed": error_count,
+		"saved_csvs": writer.saved_paths,
+		"elapsed_seconds": round(time.monotonic() - started, 1)
+	}
+
+
+def _stream_response(events: Iterator[dict], stream_format: str, omit_fields: list[str]):
+	if stream_format not in STREAM_FORMATS:
+		return JSONResponse({
+			"status": "error",
+			"message": f"지원하지 않는 스트리밍 형식입니다: {stream_format} (ndjson, sse)",
+		}, status_code=400)
+	return StreamingResponse(
+		stream_events(events, stream_format, omit_fields),
+		media_type=MEDIA_TYPES[stream_format],
+		headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+	)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+	"""앱 시작 시 브라우저 풀을 예열하고 종료 시 정리"""
+	if NaverScraper is not None:
+		browser_pool.start(prewarm=POOL_PREWARM)
+	yield
+	job_manager.shutdown()
+	browser_pool.shutdown()
+	shutdown_parse_pool()
+	shutdown_image_pool()
+	shutdown_transcode_pool()
+	shutdown_writers()
+	checkpoint_store.close()
+	close_seen_indexes()
+
+
+app = FastAPI(title="CafeScraper", version="0.1.0", lifespan=lifespan)
+
 # 정적 파일 서빙
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
 
+# 요청의 fields로 고를 수 있는 게시글 필드 (NaverScraper.ARTICLE_FIELDS와 같음 - 모르는 이름은 요청 검증에서 422)
+ArticleField = Literal["title", "author_nickname", "posted_at", "content_text", "content_html", "images_base64", "comments"]
+
+
 class CommentFilter(BaseModel):
 	include: list[str] | None = None
 	exclude: list[str] | None = None
@@ -46,17 +254,27 @@ class ScrapeArticlePayload(BaseModel):
 	url: str
 	cafe_id: str | None = None
 	comment_filter: CommentFilter | None = None
+	fields: list[ArticleField] | None = None  # 수집할 게시글 필드 (예: ["title", "comments"]) - 고르지 않은 필드의 추출 단계와 이미지 다운로드, 스크린샷 생략
 
 
 class ScrapeBoardPayload(BaseModel):
 	board_url: str
 	max_pages: int = 5
 	comment_filter: CommentFilter | None = None
+	max_concurrent: int = 3  # 동시에 로딩할 탭 수 (1이면 순차 처리, 탭 수와 관계없이 게시글 이동 간 대기는 같음)
+	include_results: bool = True  # False면 응답에 게시글 목록을 싣지 않음 (CSV에만 저장, 메모리 절약)
+	dedup: Literal["always", "skip", "refresh"] | None = None  # always, skip(수집한 적 있는 게시글 건너뜀), refresh(dedup_max_age_hours보다 오래된 것만 다시 수집)
+	dedup_max_age_hours: float | None = None
+	incremental: bool | None = None  # True면 이전 실행 이후 새로 올라온 게시글만 목록에서 수집 (생략 시 서버 설정)
+	fields: list[ArticleField] | None = None  # 수집할 게시글 필드 (예: ["title", "comments"]) - 고르지 않은 필드의 추출 단계와 이미지 다운로드, 스크린샷 생략
 
 
 class ScrapeMultipleArticlesPayload(BaseModel):
 	article_urls: list[str]
 	comment_filter: CommentFilter | None = None
+	max_concurrent: int = 3  # 동시에 로딩할 탭 수 (1이면 순차 처리, 탭 수와 관계없이 게시글 이동 간 대기는 같음)
+	include_results: bool = True  # False면 응답에 게시글 목록을 싣지 않음 (CSV에만 저장, 메모리 절약)
+	fields: list[ArticleField] | None = None  # 수집할 게시글 필드 (예: ["title", "comments"]) - 고르지 않은 필드의 추출 단계와 이미지 다운로드, 스크린샷 생략
 
 
 class CafeBoardsPayload(BaseModel):
@@ -70,6 +288,13 @@ class CafeScrapingPayload(BaseModel):
 	all_boards: bool = True
 	selected_boards: list[str] = []
 	comment_filter: CommentFilter | None = None
+	workers: int = 1  # 게시판을 나눠 처리할 워커 프로세스(Chrome) 수
+	include_results: bool = True  # False면 응답에 게시글 목록을 싣지 않음 (CSV에만 저장, 메모리 절약)
+	omit_fields: list[str] = []  # 스트리밍 응답에서 뺄 필드 (예: images_base64, content_html)
+	dedup: Literal["always", "skip", "refresh"] | None = None  # always, skip(수집한 적 있는 게시글 건너뜀), refresh(dedup_max_age_hours보다 오래된 것만 다시 수집)
+	dedup_max_age_hours: float | None = None
+	incremental: bool | None = None  # True면 이전 실행 이후 새로 올라온 게시글만 목록에서 수집 (생략 시 서버 설정)
+	fields: list[ArticleField] | None = None  # 수집할 게시글 필드 (예: ["title", "comments"]) - 고르지 않은 필드의 추출 단계와 이미지 다운로드, 스크린샷 생략
 
 
 class BatchScrapingPayload(BaseModel):
@@ -83,7 +308,30 @@ class BatchScrapingPayload(BaseModel):
 	max_articles: int = 1000
 	image_processing: str = "base64"  # none, base64, server
 	period: str = "all"  # all, 1month, 6months, 1year, custom
+	period_start: str | None = None  # period가 custom일 때 시작일 (예: 2025-09-01)
+	period_end: str | None = None  # period가 custom일 때 종료일 (그날 끝까지 포함)
 	delay_between_requests: int = 3
+	workers: int = 1  # 게시판을 나눠 처리할 워커 프로세스(Chrome) 수
+	include_results: bool = True  # False면 응답에 게시글 목록을 싣지 않음 (CSV에만 저장, 메모리 절약)
+	omit_fields: list[str] = []  # 스트리밍 응답에서 뺄 필드 (예: images_base64, content_html)
+	dedup: Literal["always", "skip", "refresh"] | None = None  # always, skip(수집한 적 있는 게시글 건너뜀), refresh(dedup_max_age_hours보다 오래된 것만 다시 수집)
+	dedup_max_age_hours: float | None = None
+	incremental: bool | None = None  # True면 이전 실행 이후 새로 올라온 게시글만 목록에서 수집 (생략 시 서버 설정)
+	fields: list[ArticleField] | None = None  # 수집할 게시글 필드 (예: ["title", "comments"]) - 고르지 않은 필드의 추출 단계와 이미지 다운로드, 스크린샷 생략
+
+
+class JobPayload(BaseModel):
+	type: str  # board, multiple, cafe, batch
+	params: dict = {}  # 각 /scrape/<type> 엔드포인트의 요청 본문과 같은 형식
+
+
+# 작업 종류별 요청 본문 형식
+JOB_PAYLOADS = {
+	"board": ScrapeBoardPayload,
+	"multiple": ScrapeMultipleArticlesPayload,
+	"cafe": CafeScrapingPayload,
+	"batch": BatchScrapingPayload,
+}
 
 
 @app.get("/")
@@ -109,6 +357,12 @@ async def health() -> dict:
 	return {"ok": True}
 
 
+@app.get("/pool/status")
+async def pool_status() -> dict:
+	"""브라우저 풀 상태 조회"""
+	return browser_pool.status()
+
+
 @app.get("/session/status")
 async def check_session_status() -> JSONResponse:
 	"""세션 상태 확인 - 쿠키 파일 존재 및 유효성 검사"""
@@ -197,7 +451,7 @@ async def check_session_status() -> JSONResponse:
 
 
 @app.post("/login/start")
-async def login_start() -> JSONResponse:
+def login_start() -> JSONResponse:
 	"""Start manual login process with browser window."""
 	try:
 		scraper = NaverScraper(SESSIONS_DIR, SNAPSHOTS_DIR)
@@ -225,24 +479,24 @@ async def login_start() -> JSONResponse:
 
 
 @app.post("/scrape/article")
-async def scrape_single_article(payload: ScrapeArticlePayload) -> JSONResponse:
+def scrape_single_article(payload: ScrapeArticlePayload) -> JSONResponse:
 	"""Scrape a single article with comments and images."""
 	try:
-		scraper = NaverScraper(SESSIONS_DIR, SNAPSHOTS_DIR)
-		
 		# Extract comment filters
 		include_nicks = payload.comment_filter.include if payload.comment_filter else None
 		exclude_nicks = payload.comment_filter.exclude if payload.comment_filter else None
 		
 		# Perform actual scraping
-		result = scraper.scrape_article(
-			payload.url, 
-			include_nicks, 
-			exclude_nicks
-		)
+		with browser_pool.borrow() as scraper:
+			_apply_crawl_options(scraper, payload)
+			result = scraper.scrape_article(
+				payload.url, 
+				include_nicks, 
+				exclude_nicks
+			)
 
 		csv_path = append_article_bundle_row(OUTPUTS_DIR, result)
-		scraper.close()
+		seen_index.mark_bundles([result])
 		
 		return JSONResponse({
 			"status": "success",
@@ -259,11 +513,9 @@ async def scrape_single_article(payload: ScrapeArticlePayload) -> JSONResponse:
 
 
 @app.post("/scrape/board")
-async def scrape_board_articles(payload: ScrapeBoardPayload) -> JSONResponse:
+def scrape_board_articles(payload: ScrapeBoardPayload) -> JSONResponse:
 	"""Scrape articles from a board page with pagination."""
 	try:
-		scraper = NaverScraper(SESSIONS_DIR, SNAPSHOTS_DIR)
-		
 		# Extract comment filters
 		include_nicks = payload.comment_filter.include if payload.comment_filter else None
 		exclude_nicks = payload.comment_filter.exclude if payload.comment_filter else None
@@ -271,42 +523,33 @@ async def scrape_board_articles(payload: ScrapeBoardPayload) -> JSONResponse:
 		print(f"📊 게시판 스크래핑 시작: {payload.board_url}")
 		print(f"📄 최대 페이지: {payload.max_pages}")
 		
-		# Get article list from board
-		articles = scraper.scrape_board_articles(payload.board_url, payload.max_pages)
-		
-		if not articles:
-			scraper.close()
-			return JSONResponse({
-				"status": "warning",
-				"message": "No articles found on the board",
-				"articles_found": 0,
-				"articles_scraped": 0,
-				"saved_csvs": [],
-				"results": []
-			})
-		
-		# Extract URLs for detailed scraping
-		article_urls = [article["article_url"] for article in articles]
-		
-		print(f"📊 발견된 게시글: {len(article_urls)}개")
-		
-		# Scrape detailed information for each article
-		detailed_results = scraper.scrape_multiple_articles(article_urls, include_nicks, exclude_nicks)
-		
-		# Save to CSV
-		csv_paths = []
-		successful_results = []
-		
-		for result in detailed_results:
-			if "error" not in result:
-				csv_path = append_article_bundle_row(OUTPUTS_DIR, result)
-				csv_paths.append(csv_path)
-				successful_results.append(result)
-		
-		scraper.close()
-		
-		success_count = len(successful_results)
-		error_count = len(detailed_results) - success_count
+		with browser_pool.borrow() as scraper:
+			_apply_crawl_options(scraper, payload)
+			# Get article list from board
+			articles = scraper.scrape_board_articles(payload.board_url, payload.max_pages)
+			
+			if not articles:
+				return JSONResponse({
+					"status": "warning",
+					"message": "No articles found on the board",
+					"articles_found": 0,
+					"articles_scraped": 0,
+					"saved_csvs": [],
+					"results": []
+				})
+			
+			# Extract URLs for detailed scraping
+			article_urls = [article["article_url"] for article in articles]
+			
+			print(f"📊 발견된 게시글: {len(article_urls)}개")
+			
+			# Scrape detailed information for each article (끝난 게시글부터 작업당 CSV 파일 하나에 기록)
+			with _csv_writer() as writer:
+				detailed_results, success_count, error_count = _consume_results(
+					scraper.iter_multiple_articles(article_urls, include_nicks, exclude_nicks, payload.max_concurrent),
+					writer,
+					payload.include_results
+				)
 		
 		return JSONResponse({
 			"status": "success",
@@ -314,7 +557,7 @@ async def scrape_board_articles(payload: ScrapeBoardPayload) -> JSONResponse:
 			"articles_found": len(articles),
 			"articles_scraped": success_count,
 			"articles_failed": error_count,
-			"saved_csvs": csv_paths,
+			"saved_csvs": writer.saved_paths,
 			"results": detailed_results
 		})
 		
@@ -326,30 +569,29 @@ async def scrape_board_articles(payload: ScrapeBoardPayload) -> JSONResponse:
 
 
 @app.post("/scrape/multiple")
-async def scrape_multiple_articles(payload: ScrapeMultipleArticlesPayload) -> JSONResponse:
+def scrape_multiple_articles(payload: ScrapeMultipleArticlesPayload) -> JSONResponse:
 	"""Scrape multiple articles from a list of URLs."""
 	try:
-		scraper = NaverScraper(SESSIONS_DIR, SNAPSHOTS_DIR)
-		
 		# Extract comment filters
 		include_nicks = payload.comment_filter.include if payload.comment_filter else None
 		exclude_nicks = payload.comment_filter.exclude if payload.comment_filter else None
 		
-		# Scrape multiple articles
-		results = scraper.scrape_multiple_articles(payload.article_urls, include_nicks, exclude_nicks)
-		
-		# Save to CSV
-		csv_paths = []
-		for result in results:
-			csv_path = append_article_bundle_row(OUTPUTS_DIR, result)
-			csv_paths.append(csv_path)
-		
-		scraper.close()
+		# Scrape multiple articles (끝난 게시글부터 작업당 CSV 파일 하나에 기록)
+		with browser_pool.borrow() as scraper, _csv_writer() as writer:
+			_apply_crawl_options(scraper, payload)
+			results, success_count, error_count = _consume_results(
+				scraper.iter_multiple_articles(payload.article_urls, include_nicks, exclude_nicks, payload.max_concurrent),
+				writer,
+				payload.include_results,
+				skip_errors=False
+			)
 		
 		return JSONResponse({
 			"status": "success",
-			"message": f"Multiple articles scraped: {len(results)} articles processed",
-			"saved_csvs": csv_paths,
+			"message": f"Multiple articles scraped: {success_count + error_count} articles processed",
+			"articles_scraped": success_count,
+			"articles_failed": error_count,
+			"saved_csvs": writer.saved_paths,
 			"results": results
 		})
 		
@@ -361,16 +603,14 @@ async def scrape_multiple_articles(payload: ScrapeMultipleArticlesPayload) -> JS
 
 
 @app.post("/cafe/boards")
-async def get_cafe_boards(payload: CafeBoardsPayload) -> JSONResponse:
+def get_cafe_boards(payload: CafeBoardsPayload) -> JSONResponse:
 	"""카페의 게시판 목록 조회"""
 	try:
 		print(f"🔄 게시판 목록 조회 시작: {payload.cafe_url}")
-		scraper = NaverScraper(SESSIONS_DIR, SNAPSHOTS_DIR)
 		
 		# 카페 게시판 목록 조회
-		boards = scraper.get_cafe_boards(payload.cafe_url)
-		
-		scraper.close()
+		with browser_pool.borrow() as scraper:
+			boards = scraper.get_cafe_boards(payload.cafe_url)
 		
 		if not boards:
 			return JSONResponse({
@@ -404,11 +644,9 @@ async def get_cafe_boards(payload: CafeBoardsPayload) -> JSONResponse:
 
 
 @app.post("/scrape/cafe")
-async def scrape_cafe(payload: CafeScrapingPayload) -> JSONResponse:
+def scrape_cafe(payload: CafeScrapingPayload) -> JSONResponse:
 	"""카페 전체 또는 특정 게시판 스크래핑"""
 	try:
-		scraper = NaverScraper(SESSIONS_DIR, SNAPSHOTS_DIR)
-		
 		# Extract comment filters
 		include_nicks = payload.comment_filter.include if payload.comment_filter else None
 		exclude_nicks = payload.comment_filter.exclude if payload.comment_filter else None
@@ -418,37 +656,29 @@ async def scrape_cafe(payload: CafeScrapingPayload) -> JSONResponse:
 		if not payload.all_boards:
 			print(f"📄 선택된 게시판: {payload.selected_boards}")
 		
-		# 카페 스크래핑 실행
-		results = scraper.scrape_cafe(
-			payload.cafe_url,
-			payload.max_pages,
-			payload.all_boards,
-			payload.selected_boards,
-			include_nicks,
-			exclude_nicks
-		)
-		
-		# Save to CSV
-		csv_paths = []
-		successful_results = []
-		
-		for result in results:
-			if "error" not in result:
-				csv_path = append_article_bundle_row(OUTPUTS_DIR, result)
-				csv_paths.append(csv_path)
-				successful_results.append(result)
-		
-		scraper.close()
-		
-		success_count = len(successful_results)
-		error_count = len(results) - success_count
+		# 카페 스크래핑 실행 (끝난 게시글부터 작업당 CSV 파일 하나에 기록)
+		with browser_pool.borrow() as scraper, _csv_writer() as writer:
+			_apply_crawl_options(scraper, payload)
+			results, success_count, error_count = _consume_results(
+				scraper.iter_cafe(
+					payload.cafe_url,
+					payload.max_pages,
+					payload.all_boards,
+					payload.selected_boards,
+					include_nicks,
+					exclude_nicks,
+					payload.workers
+				),
+				writer,
+				payload.include_results
+			)
 		
 		return JSONResponse({
 			"status": "success",
 			"message": f"카페 스크래핑 완료: {success_count}개 게시글 처리 성공, {error_count}개 실패",
 			"articles_scraped": success_count,
 			"articles_failed": error_count,
-			"saved_csvs": csv_paths,
+			"saved_csvs": writer.saved_paths,
 			"results": results
 		})
 		
@@ -460,55 +690,49 @@ async def scrape_cafe(payload: CafeScrapingPayload) -> JSONResponse:
 
 
 @app.post("/scrape/batch")
-async def batch_scraping(payload: BatchScrapingPayload) -> JSONResponse:
+def batch_scraping(payload: BatchScrapingPayload) -> JSONResponse:
 	"""배치 크롤링 - 키워드 검색 및 작성자 필터링 포함"""
 	try:
-		scraper = NaverScraper(SESSIONS_DIR, SNAPSHOTS_DIR)
-		
 		print(f"🔄 배치 크롤링 시작: {payload.cafe_url}")
 		print(f"🔍 키워드: {payload.search_keywords}")
 		print(f"👤 게시글 작성자: {payload.post_authors}")
 		print(f"💬 댓글 작성자: {payload.comment_authors}")
 		print(f"📊 최대 게시글 수: {payload.max_articles}")
 		
-		# 배치 크롤링 실행
-		results = scraper.batch_scraping(
-			payload.cafe_url,
-			payload.max_pages,
-			payload.all_boards,
-			payload.selected_boards,
-			payload.search_keywords,
-			payload.post_authors,
-			payload.comment_authors,
-			payload.max_articles,
-			payload.image_processing,
-			payload.period,
-			payload.delay_between_requests
-		)
-		
-		# Save to CSV (배치 스크래핑 시 하나의 파일로 통합)
-		import time
-		batch_id = int(time.time())  # 배치 ID 생성
-		csv_paths = []
-		successful_results = []
-		
-		for result in results:
-			if "error" not in result:
-				csv_path = append_article_bundle_row(OUTPUTS_DIR, result, batch_id)
-				csv_paths.append(csv_path)
-				successful_results.append(result)
-		
-		scraper.close()
-		
-		success_count = len(successful_results)
-		error_count = len(results) - success_count
+		# 배치 크롤링 실행 (배치 스크래핑 시 하나의 파일로 통합, 끝난 게시글부터 기록)
+		# 진행 상황은 체크포인트에 남아 중단되어도 POST /checkpoints/{batch_id}/resume으로 이어서 수집
+		batch_id, checkpoint = _start_batch_run(payload)
+		with _tracked_run(checkpoint), browser_pool.borrow() as scraper, _csv_writer(batch_id, checkpoint) as writer:
+			_apply_crawl_options(scraper, payload)
+			results, success_count, error_count = _consume_results(
+				scraper.iter_batch(
+					payload.cafe_url,
+					payload.max_pages,
+					payload.all_boards,
+					payload.selected_boards,
+					payload.search_keywords,
+					payload.post_authors,
+					payload.comment_authors,
+					payload.max_articles,
+					payload.image_processing,
+					payload.period,
+					payload.delay_between_requests,
+					payload.workers,
+					checkpoint,
+					period_start=payload.period_start,
+					period_end=payload.period_end
+				),
+				writer,
+				payload.include_results
+			)
 		
 		return JSONResponse({
 			"status": "success",
 			"message": f"배치 크롤링 완료: {success_count}개 게시글 처리 성공, {error_count}개 실패",
 			"articles_scraped": success_count,
 			"articles_failed": error_count,
-			"saved_csvs": csv_paths,
+			"saved_csvs": writer.saved_paths,
+			"batch_id": batch_id,
 			"results": results
 		})
 		
@@ -519,12 +743,262 @@ async def batch_scraping(payload: BatchScrapingPayload) -> JSONResponse:
 		}, status_code=500)
 
 
+@app.post("/scrape/cafe/stream")
+async def scrape_cafe_stream(payload: CafeScrapingPayload, stream_format: str = Query("ndjson", alias="format")):
+	"""카페 스크래핑 스트리밍 - 게시글이 끝날 때마다 NDJSON(기본) 또는 SSE(?format=sse) 이벤트로 전송"""
+	include_nicks = payload.comment_filter.include if payload.comment_filter else None
+	exclude_nicks = payload.comment_filter.exclude if payload.comment_filter else None
+	print(f"📊 카페 스크래핑 스트리밍 시작: {payload.cafe_url}")
+	
+	events = _scrape_events(lambda scraper: scraper.iter_cafe(
+		payload.cafe_url,
+		payload.max_pages,
+		payload.all_boards,
+		payload.selected_boards,
+		include_nicks,
+		exclude_nicks,
+		payload.workers
+	), options=payload)
+	return _stream_response(events, stream_format, payload.omit_fields)
+
+
+@app.post("/scrape/batch/stream")
+async def batch_scraping_stream(payload: BatchScrapingPayload, stream_format: str = Query("ndjson", alias="format")):
+	"""배치 크롤링 스트리밍 - 게시글이 끝날 때마다 NDJSON(기본) 또는 SSE(?format=sse) 이벤트로 전송"""
+	print(f"🔄 배치 크롤링 스트리밍 시작: {payload.cafe_url}")
+	
+	batch_id, checkpoint = _start_batch_run(payload)
+	events = _scrape_events(lambda scraper: scraper.iter_batch(
+		payload.cafe_url,
+		payload.max_pages,
+		payload.all_boards,
+		payload.selected_boards,
+		payload.search_keywords,
+		payload.post_authors,
+		payload.comment_authors,
+		payload.max_articles,
+		payload.image_processing,
+		payload.period,
+		payload.delay_between_requests,
+		payload.workers,
+		checkpoint,
+		period_start=payload.period_start,
+		period_end=payload.period_end
+	), batch_id, checkpoint, payload)
+	return _stream_response(events, stream_format, payload.omit_fields)
+
+
+def _job_articles(scraper: Any, kind: str, payload: Any, checkpoint: RunCheckpoint | None = None) -> Iterator[dict]:
+	"""작업 종류에 맞는 스크래퍼 제너레이터"""
+	comment_filter = getattr(payload, "comment_filter", None)
+	include_nicks = comment_filter.include if comment_filter else None
+	exclude_nicks = comment_filter.exclude if comment_filter else None
+	if kind == "board":
+		articles = scraper.scrape_board_articles(payload.board_url, payload.max_pages)
+		article_urls = [article["article_url"] for article in articles]
+		return scraper.iter_multiple_articles(article_urls, include_nicks, exclude_nicks, payload.max_concurrent)
+	if kind == "multiple":
+		return scraper.iter_multiple_articles(payload.article_urls, include_nicks, exclude_nicks, payload.max_concurrent)
+	if kind == "cafe":
+		return scraper.iter_cafe(
+			payload.cafe_url,
+			payload.max_pages,
+			payload.all_boards,
+			payload.selected_boards,
+			include_nicks,
+			exclude_nicks,
+			payload.workers
+		)
+	return scraper.iter_batch(
+		payload.cafe_url,
+		payload.max_pages,
+		payload.all_boards,
+		payload.selected_boards,
+		payload.search_keywords,
+		payload.post_authors,
+		payload.comment_authors,
+		payload.max_articles,
+		payload.image_processing,
+		payload.period,
+		payload.delay_between_requests,
+		payload.workers,
+		checkpoint,
+		period_start=payload.period_start,
+		period_end=payload.period_end
+	)
+
+
+def _run_job(job: Job, payload: Any, checkpoint: RunCheckpoint | None = None) -> dict:
+	"""작업 스레드에서 실행 - 게시글마다 진행 상황을 기록하고 취소 요청을 확인
+
+	배치 작업은 체크포인트를 남기며, checkpoint를 넘기면 그 배치를 이어서 수집한다.
+	"""
+	batch_id = None
+	if job.kind == "batch":
+		if checkpoint is None:
+			batch_id, checkpoint = _start_batch_run(payload)
+		else:
+			batch_id = int(checkpoint.run_id)
+	with _tracked_run(checkpoint), browser_pool.borrow() as scraper, _csv_writer(batch_id, checkpoint) as writer:
+		if job.cancel_requested:
+			if checkpoint is not None:
+				checkpoint.set_status("interrupted")
+			return {"saved_csvs": []}
+		_apply_crawl_options(scraper, payload)
+		save = writer.writer_for(skip_errors=job.kind != "multiple")
+		articles = _job_articles(scraper, job.kind, payload, checkpoint)
+		try:
+			for result in articles:
+				save(result)
+				job.record(result)
+				if job.cancel_requested:
+					print(f"🛑 작업 {job.id} 취소 요청 - {job.processed}개 처리 후 중단")
+					if checkpoint is not None:
+						checkpoint.set_status("interrupted")
+					break
+		finally:
+			# 중단된 경우에도 스크래퍼 정리(탭 닫기 등)를 여기서 실행
+			articles.close()
+	return {"saved_csvs": writer.saved_paths, "batch_id": batch_id}
+
+
+@app.post("/jobs")
+async def create_job(payload: JobPayload) -> JSONResponse:
+	"""스크래핑 작업 등록 - 바로 작업 ID를 반환하고 실행은 작업 스레드에서 진행"""
+	payload_model = JOB_PAYLOADS.get(payload.type)
+	if payload_model is None:
+		return JSONResponse({
+			"status": "error",
+			"message": f"알 수 없는 작업 종류입니다: {payload.type} ({', '.join(JOB_PAYLOADS)})",
+		}, status_code=400)
+	try:
+		params = payload_model(**payload.params)
+	except ValidationError as e:
+		return JSONResponse({
+			"status": "error",
+			"message": f"작업 파라미터 오류: {e}",
+		}, status_code=400)
+	
+	# 처리할 게시글 수를 미리 알 수 있는 작업만 진행률/남은 시간 계산
+	total = None
+	if payload.type == "multiple":
+		total = len(params.article_urls)
+	elif payload.type == "batch":
+		total = params.max_articles
+	
+	job = job_manager.submit(payload.type, payload.params, lambda job: _run_job(job, params), total=total)
+	return JSONResponse({
+		"status": "success",
+		"message": f"작업이 등록되었습니다: {job.id}",
+		"job": job_manager.snapshot(job)
+	}, status_code=202)
+
+
+@app.get("/jobs")
+async def list_jobs() -> JSONResponse:
+	"""작업 목록 (최근 작업 포함)"""
+	return JSONResponse({
+		"status": "success",
+		"summary": job_manager.status(),
+		"jobs": [job_manager.snapshot(job) for job in job_manager.list()]
+	})
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str) -> JSONResponse:
+	"""작업 진행 상황 - 처리 수, 처리 속도(게시글/분), 남은 시간 추정"""
+	job = job_manager.get(job_id)
+	if job is None:
+		return JSONResponse({
+			"status": "error",
+			"message": f"작업을 찾을 수 없습니다: {job_id}"
+		}, status_code=404)
+	return JSONResponse({"status": "success", "job": job_manager.snapshot(job)})
+
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str) -> JSONResponse:
+	"""작업 취소 - 실행 중인 작업은 현재 게시글을 마친 뒤 멈춤"""
+	job = job_manager.cancel(job_id)
+	if job is None:
+		return JSONResponse({
+			"status": "error",
+			"message": f"작업을 찾을 수 없습니다: {job_id}"
+		}, status_code=404)
+	message = "이미 끝난 작업입니다" if job.finished and not job.cancel_requested else "작업 취소를 요청했습니다"
+	return JSONResponse({"status": "success", "message": message, "job": job_manager.snapshot(job)})
+
+
+@app.get("/checkpoints")
+async def list_checkpoints() -> JSONResponse:
+	"""배치 체크포인트 목록 (최근 순) - 게시글 상태별 개수와 CSV 확정 위치 포함"""
+	runs = checkpoint_store.list_runs()
+	for run in runs:
+		run["active"] = run["run_id"] in _active_runs
+	return JSONResponse({"status": "success", "checkpoints": runs})
+
+
+@app.get("/checkpoints/{run_id}")
+async def get_checkpoint(run_id: str) -> JSONResponse:
+	checkpoint = checkpoint_store.open_run(run_id)
+	if checkpoint is None:
+		return JSONResponse({
+			"status": "error",
+			"message": f"체크포인트를 찾을 수 없습니다: {run_id}"
+		}, status_code=404)
+	return JSONResponse({"status": "success", "checkpoint": {**checkpoint.info(), "active": run_id in _active_runs}})
+
+
+@app.post("/checkpoints/{run_id}/resume")
+async def resume_checkpoint(run_id: str) -> JSONResponse:
+	"""중단된 배치를 작업으로 재개 - 읽은 페이지와 CSV에 기록된 게시글은 건너뛰고 같은 CSV에 이어서 기록"""
+	checkpoint = checkpoint_store.open_run(run_id)
+	if checkpoint is None:
+		return JSONResponse({
+			"status": "error",
+			"message": f"체크포인트를 찾을 수 없습니다: {run_id}"
+		}, status_code=404)
+	info = checkpoint.info()
+	if info["status"] == "done":
+		return JSONResponse({
+			"status": "error",
+			"message": f"이미 완료된 배치입니다: {run_id}"
+		}, status_code=400)
+	if run_id in _active_runs:
+		return JSONResponse({
+			"status": "error",
+			"message": f"이미 실행 중인 배치입니다: {run_id}"
+		}, status_code=409)
+	
+	params = BatchScrapingPayload(**info["spec"])
+	job = job_manager.submit("batch", {**info["spec"], "resume": run_id}, lambda job: _run_job(job, params, checkpoint), total=max(0, params.max_articles - info["articles"]["scraped"]))
+	return JSONResponse({
+		"status": "success",
+		"message": f"배치 {run_id} 재개 작업이 등록되었습니다: {job.id}",
+		"job": job_manager.snapshot(job)
+	}, status_code=202)
+
+
+@app.get("/images/{image_hash}")
+async def get_image(image_hash: str):
+	"""image_processing="server"로 저장된 이미지 제공 (sha256 해시)"""
+	path = image_store.find(image_hash)
+	if path is None:
+		return JSONResponse({
+			"status": "error",
+			"message": f"이미지를 찾을 수 없습니다: {image_hash}"
+		}, status_code=404)
+	return FileResponse(str(path), media_type=ImageStore.mime_of(path), headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+
 @app.get("/monitor/status")
 async def get_system_status() -> JSONResponse:
 	"""시스템 상태 조회"""
 	try:
 		from app.utils.monitor import performance_monitor
 		status = performance_monitor.get_system_status()
+		status["image_downloads"] = download_stats()
+		status["seen_index"] = {**seen_index.stats(), "default_policy": DEDUP_POLICY.mode}
 		return JSONResponse({
 			"status": "success",
 			"data": status
@@ -0,0 +1,133 @@
+"""
+게시글 날짜 파싱 - 네이버 카페 게시판/본문의 날짜 표기를 datetime으로 바꾸고 수집 기간(period)을 계산
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterable, Optional
+
+# 수집 기간별 일수 (custom은 period_start/period_end로 지정)
+PERIOD_DAYS = {
+    "1month": 30,
+    "6months": 182,
+    "1year": 365,
+}
+PERIODS = ("all", *PERIOD_DAYS, "custom")
+
+# 2025.09.24. / 2025-09-24 14:32 / 2025-09-24T14:32:00 / 25.09.24.
+_FULL_DATE = re.compile(r"^(\d{4}|\d{2})[.\-/]\s*(\d{1,2})[.\-/]\s*(\d{1,2})\.?(?:[T\s]+(\d{1,2}):(\d{2})(?::\d{2})?)?")
+# 09.24. (올해)
+_MONTH_DAY = re.compile(r"^(\d{1,2})\.\s*(\d{1,2})\.?$")
+# 14:32 (오늘)
+_TIME = re.compile(r"^(\d{1,2}):(\d{2})(?::\d{2})?$")
+# 3시간 전 / 5분 전 / 2일 전
+_AGO = re.compile(r"^(\d+)\s*(초|분|시간|일|주|개월|달|년)\s*전$")
+_AGO_SECONDS = {
+    "초": 1,
+    "분": 60,
+    "시간": 3600,
+    "일": 86400,
+    "주": 7 * 86400,
+    "개월": 30 * 86400,
+    "달": 30 * 86400,
+    "년": 365 * 86400,
+}
+_YESTERDAY = re.compile(r"^어제(?:\s+(\d{1,2}):(\d{2}))?$")
+
+
+@lru_cache(maxsize=8192)
+def _parse_shape(text: str) -> Optional[tuple]:
+    """현재 시각과 무관한 형태로 파싱 - 같은 표기는 캐시에서 바로 반환
+
+    ("date", y, m, d, H, M) / ("month_day", m, d) / ("today", H, M) / ("ago", 초) / ("yesterday", H, M)
+    """
+    text = text.strip()
+    match = _FULL_DATE.match(text)
+    if match:
+        year, month, day, hour, minute = match.groups()
+        year = int(year) + (2000 if len(year) == 2 else 0)
+        return ("date", year, int(month), int(day), int(hour or 0), int(minute or 0))
+    match = _TIME.match(text)
+    if match:
+        return ("today", int(match.group(1)), int(match.group(2)))
+    match = _MONTH_DAY.match(text)
+    if match:
+        return ("month_day", int(match.group(1)), int(match.group(2)))
+    if text.startswith("방금"):
+        return ("ago", 0)
+    match = _AGO.match(text)
+    if match:
+        return ("ago", int(match.group(1)) * _AGO_SECONDS[match.group(2)])
+    match = _YESTERDAY.match(text)
+    if match:
+        return ("yesterday", int(match.group(1) or 0), int(match.group(2) or 0))
+    return None
+
+
+def _resolve(shape: tuple, now: datetime) -> Optional[datetime]:
+    kind = shape[0]
+    try:
+        if kind == "date":
+            return datetime(*shape[1:])
+        if kind == "today":
+            # 시각만 표시된 글은 최근 24시간 안의 글 - 아직 오지 않은 시각이면 어제
+            resolved = now.replace(hour=shape[1], minute=shape[2], second=0, microsecond=0)
+            return resolved - timedelta(days=1) if resolved > now else resolved
+        if kind == "month_day":
+            # 연도 없는 날짜는 최근 1년 안의 글 - 올해로 보면 미래인 날짜(연초의 12.28. 등)는 작년
+            resolved = datetime(now.year, shape[1], shape[2])
+            return resolved.replace(year=now.year - 1) if resolved > now else resolved
+        if kind == "ago":
+            return now - timedelta(seconds=shape[1])
+        if kind == "yesterday":
+            return (now - timedelta(days=1)).replace(hour=shape[1], minute=shape[2], second=0, microsecond=0)
+    except ValueError:
+        # 2025.13.40 같은 잘못된 날짜
+        return None
+    return None
+
+
+def parse_naver_date(text: Optional[str], now: Optional[datetime] = None) -> Optional[datetime]:
+    """게시판/본문의 날짜 표기 하나를 datetime으로 변환 (알 수 없는 형식은 None)"""
+    if not text:
+        return None
+    shape = _parse_shape(text)
+    return _resolve(shape, now or datetime.now()) if shape else None
+
+
+def parse_naver_dates(texts: Iterable[Optional[str]], now: Optional[datetime] = None) -> list[Optional[datetime]]:
+    """게시판 한 페이지의 날짜를 묶어서 변환 - 같은 기준 시각을 쓰고, 페이지 안에서 같은 표기는 한 번만 파싱/계산"""
+    now = now or datetime.now()
+    texts = list(texts)
+    # 한 페이지의 날짜는 대부분 몇 가지 표기(같은 날짜, 오늘 글의 시각 등)로 겹치므로 고유한 표기만 계산
+    resolved = {}
+    for text in dict.fromkeys(texts):
+        shape = _parse_shape(text) if text else None
+        resolved[text] = _resolve(shape, now) if shape else None
+    return [resolved[text] for text in texts]
+
+
+def _parse_bound(value: Optional[str], end: bool) -> Optional[datetime]:
+    if not value:
+        return None
+    parsed = parse_naver_date(value)
+    if parsed is None:
+        raise ValueError(f"Invalid period date: {value}")
+    # 날짜만 지정한 종료일은 그날 끝까지 포함
+    if end and parsed.hour == 0 and parsed.minute == 0:
+        parsed += timedelta(days=1) - timedelta(microseconds=1)
+    return parsed
+
+
+def period_bounds(period: str, start: Optional[str] = None, end: Optional[str] = None, now: Optional[datetime] = None) -> tuple[Optional[datetime], Optional[datetime]]:
+    """수집 기간을 (시작, 끝) datetime으로 변환 - 제한이 없는 쪽은 None"""
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period: {period}")
+    if period == "all":
+        return None, None
+    if period == "custom":
+        return _parse_bound(start, end=False), _parse_bound(end, end=True)
+    return (now or datetime.now()) - timedelta(days=PERIOD_DAYS[period]), None
@@ -0,0 +1,195 @@
+"""
+브라우저 없는 HTML 파서 - 캡처한 page_source를 lxml로 파싱 (프로세스 풀에서 실행)
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+from lxml.etree import ParserError, XPathEvalError
+
+from app.scraper.selectors import (
+    AUTHOR_SELECTORS,
+    COMMENT_AUTHOR_SELECTOR,
+    COMMENT_DATE_SELECTOR,
+    COMMENT_SELECTORS,
+    COMMENT_TEXT_SELECTOR,
+    CONTENT_SELECTORS,
+    DATE_SELECTORS,
+    TITLE_SELECTORS,
+)
+
+# 렌더링되지 않는 요소 (Selenium .text / innerText에 포함되지 않음)
+_SKIP_TAGS = {"script", "style", "noscript", "template"}
+_SPACES = re.compile(r"[ \t\r\f\v\u00a0]+")
+
+
+def _compile(selectors: list[str]) -> list[CSSSelector]:
+    """CSS 셀렉터를 XPath로 미리 컴파일 (lxml이 지원하지 않는 셀렉터는 제외)"""
+    compiled = []
+    for selector in selectors:
+        try:
+            compiled.append(CSSSelector(selector))
+        except Exception:
+            continue
+    return compiled
+
+
+# 모듈 로드 시 한 번만 컴파일 - 워커 프로세스마다 재사용
+_TITLE = _compile(TITLE_SELECTORS)
+_AUTHOR = _compile(AUTHOR_SELECTORS)
+_CONTENT = _compile(CONTENT_SELECTORS)
+_DATE = _compile(DATE_SELECTORS)
+_COMMENT = _compile(COMMENT_SELECTORS)
+_COMMENT_TEXT = CSSSelector(COMMENT_TEXT_SELECTOR)
+_COMMENT_AUTHOR = CSSSelector(COMMENT_AUTHOR_SELECTOR)
+_COMMENT_DATE = CSSSelector(COMMENT_DATE_SELECTOR)
+
+
+def _element_text(element) -> str:
+    """innerText에 가깝게 텍스트 추출 (스크립트/스타일 제외, 공백 정리)"""
+    parts = []
+
+    def walk(node) -> None:
+        if not isinstance(node.tag, str) or node.tag.lower() in _SKIP_TAGS:
+            return
+        if node.tag.lower() == "br":
+            parts.append("\n")
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if node.tag.lower() in ("p", "div", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6"):
+            parts.append("\n")
+
+    walk(element)
+    lines = (_SPACES.sub(" ", line).strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def html_to_text(html: str) -> str:
+    """HTML 조각을 innerText에 가까운 텍스트로 변환 (API로 받은 본문 HTML 등)"""
+    if not html or not html.strip():
+        return ""
+    try:
+        root = lxml.html.fragment_fromstring(html, create_parent="div")
+    except (ParserError, ValueError):
+        return ""
+    return _element_text(root)
+
+
+def _inner_html(element) -> str:
+    html = element.text or ""
+    for child in element:
+        html += lxml.html.tostring(child, encoding="unicode")
+    return html
+
+
+def _first(root, compiled: list[CSSSelector]):
+    for selector in compiled:
+        try:
+            found = selector(root)
+        except XPathEvalError:
+            continue
+        if found:
+            yield found[0]
+
+
+def _cascade_text(root, compiled: list[CSSSelector]) -> Optional[str]:
+    for element in _first(root, compiled):
+        text = _element_text(element)
+        if text:
+            return text
+    return None
+
+
+def _cascade_html(root, compiled: list[CSSSelector]) -> Optional[str]:
+    for element in _first(root, compiled):
+        html = _inner_html(element).strip()
+        if html:
+            return html
+    return None
+
+
+def parse_article_html(html: str, base_url: str = "", max_images: int = 10, comments: bool = True, content: bool = True) -> dict:
+    """Parse an article snapshot into the same raw dict the in-page JS extractor returns.
+
+    JS 추출기의 build_spec과 같이 comments/content가 False이거나 max_images가 0이면 그 항목은 찾지 않는다.
+    """
+    try:
+        root = lxml.html.document_fromstring(html)
+    except (ParserError, ValueError):
+        return {}
+
+    comment_elements = []
+    for selector in _COMMENT if comments else []:
+        found = selector(root)
+        if found:
+            comment_elements = found
+            break
+
+    def child_text(element, selector: CSSSelector) -> Optional[str]:
+        found = selector(element)
+        return _element_text(found[0]) if found else None
+
+    comment_items = [
+        {
+            "text": child_text(element, _COMMENT_TEXT),
+            "author": child_text(element, _COMMENT_AUTHOR),
+            "date": child_text(element, _COMMENT_DATE),
+        }
+        for element in comment_elements
+    ]
+
+    image_sources = []
+    for img in root.iter("img") if max_images > 0 else []:
+        if len(image_sources) >= max_images:
+            break
+        src = img.get("src")
+        image_sources.append(urljoin(base_url, src) if src and not src.startswith("data:") else src)
+
+    return {
+        "title": _cascade_text(root, _TITLE),
+        "author": _cascade_text(root, _AUTHOR),
+        "content_text": _cascade_text(root, _CONTENT) if content else None,
+        "content_html": _cascade_html(root, _CONTENT) if content else None,
+        "posted_at": _cascade_text(root, _DATE),
+        "comments": comment_items,
+        "image_sources": image_sources,
+    }
+
+
+# 파싱 전용 프로세스 풀 (처음 사용할 때 생성)
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = max_workers or int(os.getenv("CAFESCRAPER_PARSE_WORKERS", "0")) or max(1, (os.cpu_count() or 2) - 1)
+            _pool = ProcessPoolExecutor(max_workers=workers)
+        return _pool
+
+
+def submit_parse(html: str, base_url: str = "", max_images: int = 10, comments: bool = True, content: bool = True) -> Future:
+    """파싱 작업을 프로세스 풀에 제출 - 브라우저는 바로 다음 페이지로 이동 가능"""
+    return get_parse_pool().submit(parse_article_html, html, base_url, max_images, comments, content)
+
+
+def shutdown_parse_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
@@ -0,0 +1,228 @@
+"""
+HTTP 수집 경로 - 브라우저에서 얻은 로그인 쿠키로 게시판 목록/게시글 API를 직접 호출
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.scraper.netcapture import raw_from_api
+
+# 로컬 대역 서버로 테스트할 때 CAFESCRAPER_API_BASE=http://127.0.0.1:8765 처럼 지정
+API_BASE = os.getenv("CAFESCRAPER_API_BASE", "https://apis.naver.com")
+CAFE_BASE = "https://cafe.naver.com"
+# HTTP 요청 간 최소 간격(초) - 요청 간격 제한(throttle)이 따로 없어도 댓글 페이지 등을 연달아 보내지 않음
+MIN_INTERVAL = float(os.getenv("CAFESCRAPER_MIN_REQUEST_INTERVAL", "1.0"))
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+_CLUB_ID = (
+    re.compile(r"clubid=(\d+)", re.IGNORECASE),
+    re.compile(r"/cafes/(\d+)"),
+)
+_MENU_ID = (
+    re.compile(r"menuid=(\d+)", re.IGNORECASE),
+    re.compile(r"/menus/(\d+)"),
+)
+_ARTICLE_ID = (
+    re.compile(r"articleid=(\d+)", re.IGNORECASE),
+    re.compile(r"/articles/(\d+)"),
+)
+
+
+class HttpLoginRequired(Exception):
+    """API가 로그인이 필요하다고 응답함 (브라우저에서 세션 갱신 필요)"""
+
+
+def _search(patterns, url: str) -> Optional[str]:
+    for pattern in patterns:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return None
+
+
+def article_ref(url: str) -> Optional[tuple[str, str]]:
+    """게시글 URL에서 (clubid, articleid) - 숫자 카페 ID가 없는 URL은 None (브라우저 경로 사용)"""
+    club_id, article_id = _search(_CLUB_ID, url), _search(_ARTICLE_ID, url)
+    return (club_id, article_id) if club_id and article_id else None
+
+
+def board_ref(url: str) -> Optional[tuple[str, str]]:
+    """게시판 URL에서 (clubid, menuid)"""
+    club_id, menu_id = _search(_CLUB_ID, url), _search(_MENU_ID, url)
+    return (club_id, menu_id) if club_id and menu_id else None
+
+
+def article_url(club_id: str, article_id: str) -> str:
+    """게시판 화면의 링크와 같은 형태의 게시글 URL"""
+    return f"{CAFE_BASE}/ArticleRead.nhn?clubid={club_id}&articleid={article_id}"
+
+
+def build_session(pool_size: int = 10, retries: int = 3) -> requests.Session:
+    """keep-alive 연결 풀과 재시도(429/5xx, 백오프)가 설정된 세션"""
+    session = requests.Session()
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Referer": f"{CAFE_BASE}/",
+        "Accept": "application/json, text/plain, */*",
+    })
+    return session
+
+
+class HttpFetcher:
+    """Fetch board lists and articles over a pooled requests.Session with the browser's cookies."""
+
+    def __init__(self, cookie_file: Path, api_base: Optional[str] = None, throttle: Optional[Callable[[], None]] = None, timeout: float = 10.0, session: Optional[requests.Session] = None, min_interval: Optional[float] = None) -> None:
+        self.cookie_file = Path(cookie_file)
+        self.api_base = (api_base or API_BASE).rstrip("/")
+        self.throttle = throttle
+        self.min_interval = MIN_INTERVAL if min_interval is None else max(0.0, min_interval)
+        self._next_request_at = 0.0
+        self.timeout = timeout
+        self.session = session or build_session()
+        self._cookies_mtime: Optional[float] = None
+        # 대역 서버(네이버가 아닌 호스트)로 테스트할 때는 쿠키를 그 호스트로 보냄
+        host = urlparse(self.api_base).hostname or ""
+        self._cookie_domain = None if host.endswith("naver.com") else host
+
+    def load_cookies(self, cookies: Optional[list[dict]] = None) -> int:
+        """Selenium 형식 쿠키를 세션에 적용 (인자가 없으면 쿠키 파일이 바뀐 경우에만 다시 읽음)"""
+        if cookies is None:
+            if not self.cookie_file.exists():
+                return 0
+            mtime = self.cookie_file.stat().st_mtime
+            if self._cookies_mtime == mtime:
+                return 0
+            with open(self.cookie_file, "r", encoding="utf-8") as f:
+                cookies = json.load(f)
+            self._cookies_mtime = mtime
+
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=self._cookie_domain or cookie.get("domain", ".naver.com"),
+                path=cookie.get("path", "/"),
+            )
+        return len(cookies)
+
+    def get_json(self, path: str, params: Optional[dict] = None) -> dict:
+        self.load_cookies()
+        if self.throttle is not None:
+            self.throttle()
+        self._pace()
+        response = self.session.get(f"{self.api_base}{path}", params=params, timeout=self.timeout)
+        if response.status_code in (401, 403):
+            raise HttpLoginRequired(f"HTTP {response.status_code}: {path}")
+        response.raise_for_status()
+        payload = response.json()
+        if not isinstance(payload, dict):
+            raise ValueError(f"Unexpected response: {type(payload).__name__}")
+        return payload
+
+    def _pace(self) -> None:
+        """이 세션의 직전 요청 후 min_interval이 지날 때까지 대기"""
+        delay = self._next_request_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._next_request_at = time.monotonic() + self.min_interval
+
+    def fetch_article(self, url: str, max_images: int = 10, comments: bool = True, content: bool = True) -> Optional[dict]:
+        """게시글 API와 댓글 API(전체 페이지)로 raw dict 생성 (HTTP 경로로 처리할 수 없는 URL이면 None)
+
+        comments가 False면 댓글 API를 호출하지 않는다 (max_images/content는 raw_from_api와 같음).
+        """
+        ref = article_ref(url)
+        if ref is None:
+            return None
+        club_id, article_id = ref
+        payload = self.get_json(
+            f"/cafe-web/cafe-articleapi/v2.1/cafes/{club_id}/articles/{article_id}",
+            {"useCafeId": "true"},
+        )
+        result = payload.get("result") or {}
+        if not result.get("article"):
+            # 비공개/등급 제한 글은 로그인 갱신 후 브라우저로 재시도
+            error = (result.get("errorCode") or payload.get("errorCode") or "")
+            if "LOGIN" in str(error).upper() or "AUTH" in str(error).upper():
+                raise HttpLoginRequired(f"{error}: {url}")
+            return None
+        comments_payload = self.fetch_comments(club_id, article_id) if comments else None
+        return raw_from_api(payload, comments_payload, max_images, comments, content)
+
+    def fetch_comments(self, club_id: str, article_id: str, max_pages: int = 50) -> dict:
+        """댓글 API를 페이지 순서대로 모두 읽어 댓글 응답 하나의 형태로 합침 (게시글 응답에는 첫 페이지만 포함됨)"""
+        items: list[dict] = []
+        seen: set = set()
+        for page in range(1, max_pages + 1):
+            payload = self.get_json(
+                f"/cafe-web/cafe-articleapi/v2.1/cafes/{club_id}/articles/{article_id}/comments/pages/{page}",
+                {"requestFrom": "A", "orderBy": "asc"},
+            )
+            comments = (payload.get("result") or {}).get("comments") or {}
+            new_items = []
+            for item in comments.get("items") or []:
+                key = item.get("id") or json.dumps(item, sort_keys=True, ensure_ascii=False)
+                if key not in seen:
+                    seen.add(key)
+                    new_items.append(item)
+            items.extend(new_items)
+            # 빈 페이지(또는 같은 댓글만 반복)이거나 다음 페이지가 없다고 하면 중단
+            if not new_items or not comments.get("hasNext", True):
+                break
+        return {"result": {"comments": {"items": items}}}
+
+    def fetch_board_page(self, board_url: str, page: int, per_page: int = 50) -> Optional[list[dict]]:
+        """게시판 목록 한 페이지 - 브라우저 경로의 _extract_article_links_from_board와 같은 형태"""
+        ref = board_ref(board_url)
+        if ref is None:
+            return None
+        club_id, menu_id = ref
+        payload = self.get_json("/cafe-web/cafe2/ArticleListV2dot1.json", {
+            "search.clubid": club_id,
+            "search.menuid": menu_id,
+            "search.queryType": "lastArticle",
+            "search.page": page,
+            "search.perPage": per_page,
+        })
+        result = (payload.get("message") or {}).get("result") or {}
+        articles = []
+        for item in result.get("articleList") or []:
+            article_id = str(item.get("articleId", ""))
+            if not article_id:
+                continue
+            timestamp = item.get("writeDateTimestamp")
+            articles.append({
+                "article_id": article_id,
+                "article_url": article_url(club_id, article_id),
+                "title": item.get("subject") or "제목 없음",
+                "author_nickname": item.get("writerNickname") or "알 수 없음",
+                "posted_at": time.strftime("%Y.%m.%d. %H:%M", time.localtime(timestamp / 1000)) if timestamp else None,
+                "scraped_at": None
+            })
+        return articles
+
+    def close(self) -> None:
+        self.session.close()
+
@@ -0,0 +1,277 @@
+"""
+이미지 다운로드 - 공유 연결 풀과 스레드 풀로 게시글 이미지를 동시에 내려받음
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+
+from app.scraper.http_client import build_session
+from app.scraper.transcode import TranscodeSettings, submit_transcode
+from app.utils.image_store import ImageStore, extension_for
+
+IMAGE_WORKERS = int(os.getenv("CAFESCRAPER_IMAGE_WORKERS", "8"))
+# 같은 호스트(pstatic.net 등)로 동시에 보내는 요청 수 제한
+IMAGE_PER_HOST = int(os.getenv("CAFESCRAPER_IMAGE_PER_HOST", "4"))
+# 게시글 하나의 이미지 다운로드에 쓸 수 있는 전체 시간(초)
+IMAGE_BUDGET = float(os.getenv("CAFESCRAPER_IMAGE_BUDGET", "20"))
+# 다운로드 전에 HEAD 요청으로 크기를 먼저 확인할지 여부 (요청이 하나 늘지만 큰 이미지 연결을 끊지 않음)
+IMAGE_HEAD_CHECK = os.getenv("CAFESCRAPER_IMAGE_HEAD_CHECK", "0") == "1"
+# 다운로드한 이미지 후처리 (축소/재인코딩) - 기본은 원본 유지
+IMAGE_TRANSCODE = TranscodeSettings.from_env()
+
+_CHUNK_SIZE = 64 * 1024
+
+# 모든 스크래퍼가 함께 쓰는 세션/스레드 풀 (처음 사용할 때 생성)
+_session: Optional[requests.Session] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_lock = threading.Lock()
+# skipped/saved_bytes: 헤더(HEAD/Content-Length)로 크기를 미리 알고 받지 않은 이미지와 그 크기
+# aborted/aborted_at_bytes: 크기를 모르거나 헤더가 틀려 받는 도중 끊은 이미지와 끊기 전까지 받은 양 (남은 크기는 알 수 없음)
+_stats = {"completed": 0, "skipped": 0, "aborted": 0, "downloaded_bytes": 0, "saved_bytes": 0, "aborted_at_bytes": 0, "transcoded": 0, "transcode_saved_bytes": 0}
+
+
+def _get_executor() -> tuple[requests.Session, ThreadPoolExecutor]:
+    global _session, _executor
+    with _lock:
+        if _executor is None:
+            # 이미지 요청에는 로그인 쿠키를 싣지 않음
+            _session = build_session(pool_size=max(IMAGE_WORKERS, IMAGE_PER_HOST), retries=1)
+            _session.headers["Accept"] = "image/avif,image/webp,image/*,*/*;q=0.8"
+            _executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="image-download")
+        return _session, _executor
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    host = urlparse(url).hostname or ""
+    with _lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(max(1, IMAGE_PER_HOST))
+        return slot
+
+
+def _mime_type(src: str) -> str:
+    mime_type = "image/jpeg"
+    if src.lower().endswith('.png'):
+        mime_type = "image/png"
+    elif src.lower().endswith('.gif'):
+        mime_type = "image/gif"
+    return mime_type
+
+
+class _Base64Encoder:
+    """청크를 3바이트 경계에 맞춰 바로 base64로 인코딩 - 원본 전체를 따로 들고 있지 않음"""
+
+    def __init__(self) -> None:
+        self.size = 0
+        self._parts: list[str] = []
+        self._rest = b""
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        data = self._rest + chunk
+        cut = len(data) - len(data) % 3
+        self._parts.append(base64.b64encode(data[:cut]).decode("ascii"))
+        self._rest = data[cut:]
+
+    def commit(self, mime: str) -> dict:
+        self._parts.append(base64.b64encode(self._rest).decode("ascii"))
+        return {"mime": mime, "data": "".join(self._parts)}
+
+    def abort(self) -> None:
+        self._parts = []
+        self._rest = b""
+
+
+class _BytesSink:
+    """후처리를 위해 원본 바이트를 모아 두는 버퍼 (크기 제한 안에서만 사용)"""
+
+    def __init__(self) -> None:
+        self.size = 0
+        self._buffer = bytearray()
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        self._buffer += chunk
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buffer)
+
+    def abort(self) -> None:
+        self._buffer = bytearray()
+
+
+def _record(**deltas: int) -> None:
+    with _lock:
+        for key, value in deltas.items():
+            _stats[key] += value
+
+
+def download_stats() -> dict:
+    """이미지 다운로드 누적 통계 - saved_mb는 헤더로 미리 건너뛴 이미지의 크기만 집계 (도중에 끊은 양은 aborted_at_bytes)"""
+    with _lock:
+        return {**_stats, "saved_mb": round(_stats["saved_bytes"] / (1024 * 1024), 2)}
+
+
+def _declared_size(response: requests.Response) -> Optional[int]:
+    try:
+        return int(response.headers["Content-Length"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _transcode(index: int, data: bytes, mime: str, settings: TranscodeSettings, deadline: float) -> tuple[bytes, str]:
+    """프로세스 풀에서 축소/재인코딩 (실패하거나 이득이 없으면 원본 유지)"""
+    try:
+        result = submit_transcode(data, settings).result(timeout=max(1.0, deadline - time.monotonic()))
+    except Exception as e:
+        print(f"⚠️ Image {index+1} transcode failed, keeping original: {e}")
+        return data, mime
+    if result is None:
+        return data, mime
+    encoded, new_mime = result
+    _record(transcoded=1, transcode_saved_bytes=len(data) - len(encoded))
+    return encoded, new_mime
+
+
+def _download_one(session: requests.Session, index: int, src: str, max_size_mb: float, deadline: float, store: Optional[ImageStore] = None, transcode: Optional[TranscodeSettings] = None) -> Optional[dict]:
+    """이미지 하나를 내려받아 base64 레코드(또는 저장소 참조)로 변환 (건너뛸 이미지는 None)
+
+    본문은 청크 단위로 받아 바로 인코딩/저장하며, 크기 제한을 넘는 순간 다운로드를 중단한다.
+    """
+    max_bytes = int(max_size_mb * 1024 * 1024)
+    slot = _host_slot(src)
+    if not slot.acquire(timeout=max(0.0, deadline - time.monotonic())):
+        print(f"⚠️ Image {index+1} skipped: time budget exhausted")
+        return None
+    sink = None
+    try:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        if IMAGE_HEAD_CHECK:
+            # 본문을 받기 전에 크기 확인 (연결을 끊지 않고 큰 이미지를 걸러냄)
+            head = session.head(src, timeout=min(10, remaining), allow_redirects=True)
+            declared = _declared_size(head) if head.status_code == 200 else None
+            if declared is not None and declared > max_bytes:
+                print(f"⚠️ Image {index+1} too large ({declared / (1024 * 1024):.1f}MB), skipping")
+                _record(skipped=1, saved_bytes=declared)
+                return None
+
+        with session.get(src, timeout=min(10, remaining), stream=True) as response:
+            if response.status_code != 200:
+                return None
+
+            # 응답 헤더의 Content-Length로 먼저 확인
+            declared = _declared_size(response)
+            if declared is not None and declared > max_bytes:
+                print(f"⚠️ Image {index+1} too large ({declared / (1024 * 1024):.1f}MB), skipping")
+                _record(skipped=1, saved_bytes=declared)
+                return None
+
+            if transcode is not None:
+                sink = _BytesSink()
+            else:
+                sink = store.writer() if store is not None else _Base64Encoder()
+            for chunk in response.iter_content(_CHUNK_SIZE):
+                sink.write(chunk)
+                if sink.size > max_bytes:
+                    # 크기 제한을 넘는 순간 중단 - 나머지는 받지 않음
+                    print(f"⚠️ Image {index+1} too large (>{max_size_mb}MB), aborted after {sink.size / (1024 * 1024):.1f}MB")
+                    _record(aborted=1, downloaded_bytes=sink.size, aborted_at_bytes=sink.size)
+                    sink.abort()
+                    return None
+                # 예산을 넘긴 느린 다운로드는 중간에 포기
+                if time.monotonic() > deadline:
+                    print(f"⚠️ Image {index+1} skipped: time budget exhausted")
+                    _record(downloaded_bytes=sink.size)
+                    sink.abort()
+                    return None
+            size = sink.size
+            _record(completed=1, downloaded_bytes=size)
+            if transcode is None:
+                record = sink.commit(_mime_type(src))
+                sink = None
+    finally:
+        if sink is not None and transcode is None:
+            sink.abort()
+        slot.release()
+
+    if transcode is not None:
+        # 호스트 슬롯을 반납한 뒤 변환 - 같은 호스트의 다음 다운로드를 막지 않음
+        data, mime = _transcode(index, sink.getvalue(), _mime_type(src), transcode, deadline)
+        sink = store.writer() if store is not None else _Base64Encoder()
+        sink.write(data)
+        record = sink.commit(mime)
+        size = len(data)
+
+    # 재인코딩(webp 등)이나 저장소의 형식 판별로 바뀐 최종 MIME 형식에 맞는 확장자
+    return {
+        **record,
+        "filename": f"image_{index+1}{extension_for(record['mime'])}",
+        "size_mb": round(size / (1024 * 1024), 2)
+    }
+
+
+def download_images(sources: list, max_size_mb: float = 5.0, budget: Optional[float] = None, store: Optional[ImageStore] = None, transcode: Optional[TranscodeSettings] = IMAGE_TRANSCODE) -> list:
+    """Download images concurrently and return them in source order (existing base64 record shape).
+
+    store를 지정하면 이미지 데이터 대신 내용 해시 기반 저장소의 참조(sha256/path/url)를 반환하고,
+    transcode를 지정하면 저장 전에 프로세스 풀에서 축소/재인코딩한다.
+    """
+    targets = [(i, src) for i, src in enumerate(sources) if src and not src.startswith("data:")]
+    if not targets:
+        return []
+
+    session, executor = _get_executor()
+    deadline = time.monotonic() + (IMAGE_BUDGET if budget is None else budget)
+    futures: dict[Future, int] = {
+        executor.submit(_download_one, session, i, src, max_size_mb, deadline, store, transcode): i
+        for i, src in targets
+    }
+
+    results: dict[int, dict] = {}
+    pending = set(futures)
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            index = futures[future]
+            try:
+                image = future.result()
+            except Exception as e:
+                print(f"⚠️ Error processing image {index}: {e}")
+                continue
+            if image is not None:
+                results[index] = image
+
+    if pending:
+        print(f"⚠️ 이미지 다운로드 시간 초과: {len(pending)}개 건너뜀")
+        for future in pending:
+            future.cancel()
+
+    return [results[index] for index in sorted(results)]
+
+
+def shutdown_image_pool() -> None:
+    global _session, _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+        if _session is not None:
+            _session.close()
+            _session = None
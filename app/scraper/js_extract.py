@@ -0,0 +1,98 @@
+"""
+브라우저 내 일괄 추출 - 셀렉터 캐스케이드 전체를 한 번의 execute_script 호출로 평가
+"""
+
+from __future__ import annotations
+
+from app.scraper.selectors import (
+    AUTHOR_SELECTORS,
+    COMMENT_AUTHOR_SELECTOR,
+    COMMENT_DATE_SELECTOR,
+    COMMENT_SELECTORS,
+    COMMENT_TEXT_SELECTOR,
+    CONTENT_SELECTORS,
+    DATE_SELECTORS,
+    TITLE_SELECTORS,
+)
+
+# Selenium의 _safe_extract / _safe_extract_html / _extract_comments 와 같은 규칙:
+# 셀렉터 순서대로 첫 번째 매칭 요소를 보고, 비어 있지 않은 텍스트(HTML)가 나오면 채택
+ARTICLE_EXTRACT_JS = """
+const spec = arguments[0];
+const first = (sel, root) => {
+    try { return (root || document).querySelector(sel); } catch (e) { return null; }
+};
+const cascadeText = (selectors) => {
+    for (const sel of selectors) {
+        const el = first(sel);
+        if (el) {
+            const text = (el.innerText || '').trim();
+            if (text) return text;
+        }
+    }
+    return null;
+};
+const cascadeHtml = (selectors) => {
+    for (const sel of selectors) {
+        const el = first(sel);
+        if (el) {
+            const html = (el.innerHTML || '').trim();
+            if (html) return html;
+        }
+    }
+    return null;
+};
+const childText = (root, sel) => {
+    const el = first(sel, root);
+    return el ? (el.innerText || '') : null;
+};
+
+let commentElements = [];
+for (const sel of spec.comment) {
+    let found = [];
+    try { found = Array.from(document.querySelectorAll(sel)); } catch (e) { found = []; }
+    if (found.length) { commentElements = found; break; }
+}
+const comments = commentElements.map((el) => ({
+    text: childText(el, spec.commentText),
+    author: childText(el, spec.commentAuthor),
+    date: childText(el, spec.commentDate)
+}));
+
+const images = Array.from(document.getElementsByTagName('img'))
+    .slice(0, spec.maxImages)
+    .map((img) => img.src || null);
+
+return {
+    title: cascadeText(spec.title),
+    author: cascadeText(spec.author),
+    content_text: cascadeText(spec.content),
+    content_html: cascadeHtml(spec.content),
+    posted_at: cascadeText(spec.date),
+    comments: comments,
+    image_sources: images
+};
+"""
+
+
+def build_spec(max_images: int = 10, comments: bool = True, content: bool = True) -> dict:
+    """스크립트에 인자로 넘길 셀렉터 묶음 (필요 없는 항목은 빈 목록으로 넘겨 탐색 생략)"""
+    return {
+        "title": TITLE_SELECTORS,
+        "author": AUTHOR_SELECTORS,
+        "content": CONTENT_SELECTORS if content else [],
+        "date": DATE_SELECTORS,
+        "comment": COMMENT_SELECTORS if comments else [],
+        "commentText": COMMENT_TEXT_SELECTOR,
+        "commentAuthor": COMMENT_AUTHOR_SELECTOR,
+        "commentDate": COMMENT_DATE_SELECTOR,
+        "maxImages": max_images,
+    }
+
+
+def run_article_extractor(driver, max_images: int = 10, comments: bool = True, content: bool = True) -> dict:
+    """현재 문서(또는 전환된 iframe)에서 게시글/댓글/이미지 주소를 한 번에 추출"""
+    raw = driver.execute_script(ARTICLE_EXTRACT_JS, build_spec(max_images, comments, content))
+    if not isinstance(raw, dict):
+        raise ValueError(f"Unexpected extractor result: {type(raw).__name__}")
+    return raw
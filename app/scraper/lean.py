@@ -0,0 +1,136 @@
+"""
+경량 페이지 모드 - CDP로 광고/분석/폰트/동영상 등 게시글 추출에 불필요한 요청을 차단
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+from dataclasses import dataclass, field
+from typing import Optional
+
+# 기본 차단 목록 (Network.setBlockedURLs 패턴 - '*' 와일드카드)
+DEFAULT_BLOCKED_URLS: tuple[str, ...] = (
+    # 광고 / 분석 비콘
+    "*veta.naver.com*",
+    "*adcr.naver.com*",
+    "*lcs.naver.com*",
+    "*wcs.naver.net*",
+    "*nelo2-col.navercorp.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    # 웹폰트
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    # 이미지 / 동영상 (이미지는 추출한 주소로 따로 다운로드)
+    "*.jpg",
+    "*.jpeg",
+    "*.png",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.mp4",
+    "*.m3u8",
+    "*.ts?*",
+    "*tv.naver.com/embed*",
+    "*youtube.com/embed*",
+    # 외부 위젯
+    "*facebook.net*",
+    "*platform.twitter.com*",
+    "*kakao.com/sdk*",
+)
+
+
+def _env_list(name: str) -> list[str]:
+    return [item.strip() for item in os.getenv(name, "").split(",") if item.strip()]
+
+
+@dataclass
+class LeanSettings:
+    """Headless + request-blocking settings for a lean browser.
+
+    blocked: 차단할 URL 패턴
+    allowed: 차단 목록에서 빼낼 패턴 - 차단 패턴이나 예시 URL이 이 패턴과 맞으면 차단하지 않음
+    """
+    headless: bool = True
+    blocked: list[str] = field(default_factory=lambda: list(DEFAULT_BLOCKED_URLS))
+    allowed: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_env(cls) -> "LeanSettings":
+        """CAFESCRAPER_BLOCK_URLS / CAFESCRAPER_ALLOW_URLS (쉼표 구분)로 기본 목록을 조정"""
+        return cls(
+            headless=os.getenv("CAFESCRAPER_LEAN_HEADLESS", "1") != "0",
+            blocked=list(DEFAULT_BLOCKED_URLS) + _env_list("CAFESCRAPER_BLOCK_URLS"),
+            allowed=_env_list("CAFESCRAPER_ALLOW_URLS"),
+        )
+
+    def blocked_urls(self) -> list[str]:
+        """허용 목록을 반영한 최종 차단 패턴"""
+        result = []
+        for pattern in self.blocked:
+            if any(pattern == allow or fnmatch.fnmatch(pattern, allow) for allow in self.allowed):
+                continue
+            if pattern not in result:
+                result.append(pattern)
+        return result
+
+
+def apply_chrome_options(chrome_options, settings: LeanSettings) -> None:
+    """브라우저 시작 전 옵션 - 헤드리스 실행과 렌더링 부하 감소"""
+    if settings.headless:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1280,2000")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--autoplay-policy=user-gesture-required")
+
+
+def install_request_blocking(driver, settings: LeanSettings) -> None:
+    """현재 탭(target)에 차단 목록 적용 - 새로 연 탭마다 다시 호출해야 함"""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": settings.blocked_urls()})
+
+
+# 최상위 문서와 같은 출처의 iframe(cafe_main)에서 Resource Timing을 합산
+# (교차 출처 리소스는 Timing-Allow-Origin이 없으면 transferSize가 0으로 보고되므로 근사값)
+PAGE_STATS_JS = """
+const wins = [window];
+for (const frame of document.querySelectorAll('iframe')) {
+    try {
+        if (frame.contentWindow && frame.contentWindow.performance) {
+            frame.contentWindow.document;
+            wins.push(frame.contentWindow);
+        }
+    } catch (e) {}
+}
+const origin = performance.timeOrigin;
+let bytes = 0;
+let requests = 0;
+let loadEnd = 0;
+for (const w of wins) {
+    const perf = w.performance;
+    const nav = perf.getEntriesByType('navigation');
+    for (const e of nav.concat(perf.getEntriesByType('resource'))) {
+        bytes += e.transferSize || 0;
+        requests += 1;
+    }
+    if (nav.length) {
+        const end = nav[0].loadEventEnd || nav[0].responseEnd || 0;
+        loadEnd = Math.max(loadEnd, perf.timeOrigin + end - origin);
+    }
+}
+return {bytes: bytes, requests: requests, load_ms: Math.round(loadEnd)};
+"""
+
+
+def collect_page_stats(driver) -> Optional[dict]:
+    """현재 페이지의 전송 바이트/요청 수/로드 시간 (조회 실패 시 None)"""
+    try:
+        stats = driver.execute_script(PAGE_STATS_JS)
+    except Exception:
+        return None
+    return stats if isinstance(stats, dict) else None
@@ -0,0 +1,131 @@
+"""
+다중 패턴 매칭 - 키워드/닉네임 필터를 Aho-Corasick 오토마톤 하나로 컴파일해 텍스트를 한 번만 훑음
+"""
+
+from __future__ import annotations
+
+import unicodedata
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, Optional
+
+
+def normalize(text: str) -> str:
+    """비교용 정규화 - 한글 자모 조합을 NFC로 맞추고 대소문자 구분 없이 비교"""
+    return unicodedata.normalize("NFC", text).casefold()
+
+
+class PatternMatcher:
+    """Aho-Corasick automaton over a fixed pattern list.
+
+    텍스트 길이에 비례하는 시간으로 모든 패턴을 한 번에 찾으며, 일치한 원래 패턴을 돌려준다.
+    빈 패턴은 무시한다.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns: tuple[str, ...] = tuple(dict.fromkeys(pattern for pattern in patterns if pattern and normalize(pattern)))
+        # 상태별 전이, 실패 링크, 그 상태에서 끝나는 패턴 번호
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[tuple[int, ...]] = [()]
+        for index, pattern in enumerate(self.patterns):
+            self._add(normalize(pattern), index)
+        self._build()
+
+    def _add(self, key: str, index: int) -> None:
+        state = 0
+        for char in key:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] += (index,)
+
+    def _build(self) -> None:
+        # 너비 우선으로 실패 링크를 채우고, 실패 상태의 출력도 합쳐 둠
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def _scan(self, text: str, first_only: bool) -> set[int]:
+        found: set[int] = set()
+        state = 0
+        for char in normalize(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                found.update(self._output[state])
+                if first_only or len(found) == len(self.patterns):
+                    break
+        return found
+
+    def findall(self, text: Optional[str]) -> list[str]:
+        """텍스트에 들어 있는 패턴 (패턴 목록 순서)"""
+        if not text or not self.patterns:
+            return []
+        return [self.patterns[index] for index in sorted(self._scan(text, first_only=False))]
+
+    def search(self, text: Optional[str]) -> bool:
+        """패턴이 하나라도 들어 있는지 (첫 일치에서 멈춤)"""
+        if not text or not self.patterns:
+            return False
+        return bool(self._scan(text, first_only=True))
+
+
+@lru_cache(maxsize=256)
+def _compiled(patterns: tuple[str, ...]) -> PatternMatcher:
+    return PatternMatcher(patterns)
+
+
+def compile_patterns(patterns: Optional[Iterable[str]]) -> PatternMatcher:
+    """패턴 목록을 컴파일 - 같은 목록은 작업 내내 한 번만 만듦 (게시글/댓글마다 다시 만들지 않음)"""
+    return _compiled(tuple(patterns or ()))
+
+
+class TextFilter:
+    """Include/exclude filter on one text field (e.g. comment nickname) backed by two matchers.
+
+    include가 있으면 그중 하나 이상을 포함해야 하고, exclude 중 하나라도 포함하면 제외한다.
+    """
+
+    def __init__(self, include: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None) -> None:
+        self.include = compile_patterns(include)
+        self.exclude = compile_patterns(exclude)
+
+    def allows(self, text: Optional[str]) -> bool:
+        if self.include and not self.include.search(text):
+            return False
+        return not (self.exclude and self.exclude.search(text))
+
+    def matches(self, text: Optional[str]) -> dict:
+        """허용 여부와 일치한 패턴 (include/exclude별)"""
+        return {
+            "allowed": self.allows(text),
+            "include": self.include.findall(text),
+            "exclude": self.exclude.findall(text),
+        }
+
+
+@lru_cache(maxsize=256)
+def _text_filter(include: tuple[str, ...], exclude: tuple[str, ...]) -> TextFilter:
+    return TextFilter(include, exclude)
+
+
+def text_filter(include: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None) -> TextFilter:
+    return _text_filter(tuple(include or ()), tuple(exclude or ()))
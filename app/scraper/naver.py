@@ -2,11 +2,14 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import re
 import time
 import psutil
 import base64
+from collections import deque
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -16,7 +19,37 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
-import requests
+
+from app.scraper.dates import parse_naver_dates, period_bounds
+from app.scraper.html_parser import submit_parse
+from app.scraper.http_client import CAFE_BASE, HttpFetcher, HttpLoginRequired, article_ref, board_ref
+from app.scraper.images import download_images
+from app.scraper.js_extract import run_article_extractor
+from app.scraper.matcher import compile_patterns, text_filter
+from app.scraper.lean import LeanSettings, apply_chrome_options, collect_page_stats, install_request_blocking
+from app.scraper.netcapture import NetworkCapture, article_key
+from app.scraper.selectors import (
+    AUTHOR_SELECTORS,
+    COMMENT_AUTHOR_SELECTOR,
+    COMMENT_DATE_SELECTOR,
+    COMMENT_SELECTORS,
+    COMMENT_TEXT_SELECTOR,
+    CONTENT_SELECTORS,
+    DATE_SELECTORS,
+    TITLE_SELECTORS,
+)
+from app.scraper.waits import (
+    NAVIGATE_JS,
+    PROFILES,
+    ReadinessTracker,
+    ReadyResult,
+    enter_content_frame,
+    probe_readiness,
+    wait_until_ready,
+)
+from app.utils.checkpoint import RunCheckpoint
+from app.utils.image_store import ImageStore
+from app.utils.seen_index import DedupPolicy, get_seen_index
 
 # 로깅 시스템 임포트
 try:
@@ -42,7 +75,45 @@ except ImportError:
 class NaverScraper:
     """Naver Cafe scraper using Selenium WebDriver with manual login and cookie persistence."""
 
-    def __init__(self, sessions_dir: str, snapshots_dir: str) -> None:
+    # 게시글 추출 방식: "js"(브라우저 내 스크립트 1회 호출), "selenium"(요소별 WebDriver 호출),
+    # "html"(page_source 캡처 후 프로세스 풀에서 lxml 파싱), "network"(게시글/댓글 API 응답 JSON을 그대로 사용)
+    EXTRACTION_MODES = ("js", "selenium", "html", "network")
+    # 수집 경로: "browser"(모든 페이지를 Chrome으로), "hybrid"(쿠키를 공유하는 HTTP 세션 우선, 실패 시 Chrome)
+    FETCH_MODES = ("browser", "hybrid")
+    # 이미지 처리: "none"(내려받지 않음), "base64"(CSV/응답에 인라인), "server"(내용 해시 기반 저장소에 파일로 저장)
+    IMAGE_PROCESSING_MODES = ("none", "base64", "server")
+    # fields 프로젝션으로 고를 수 있는 게시글 필드 (cafe_id/article_id/article_url/scraped_at 등 식별·메타 정보는 항상 포함)
+    ARTICLE_FIELDS = ("title", "author_nickname", "posted_at", "content_text", "content_html", "images_base64", "comments")
+
+    def __init__(self, sessions_dir: str, snapshots_dir: str, extraction_mode: str = "js", profile_dir: Optional[str] = None, lean: Optional[LeanSettings] = None, fetch_mode: str = "browser", image_processing: str = "base64", images_dir: Optional[str] = None, seen_index_path: Optional[str] = None, dedup: Optional[DedupPolicy] = None, incremental: bool = False, fields: Optional[Iterable[str]] = None) -> None:
+        if extraction_mode not in self.EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode: {extraction_mode}")
+        if fetch_mode not in self.FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode: {fetch_mode}")
+        self.fetch_mode = fetch_mode
+        if image_processing not in self.IMAGE_PROCESSING_MODES:
+            raise ValueError(f"Unknown image processing mode: {image_processing}")
+        self.image_processing = image_processing
+        self._default_image_processing = image_processing
+        # image_processing="server"일 때 이미지를 저장할 위치
+        self.image_store: Optional[ImageStore] = ImageStore(images_dir) if images_dir else None
+        # 이전 실행에서 수집한 게시글 이력과 중복 처리 정책 (풀에 반납될 때 reset_state에서 기본값으로 복원)
+        self.seen_index = get_seen_index(seen_index_path) if seen_index_path else None
+        self.dedup = dedup or DedupPolicy()
+        self._default_dedup = self.dedup
+        # 증분 크롤링 - 게시판별 기준 article_id 이하만 있는 페이지가 나오면 페이지네이션 중단
+        self.incremental = incremental
+        self._default_incremental = incremental
+        # 게시글 필드 프로젝션 - None이면 전체, 지정하면 고른 필드에 필요한 추출 단계만 실행 (스크린샷 생략)
+        self.fields = self.parse_fields(fields)
+        self._default_fields = self.fields
+        self.extraction_mode = extraction_mode
+        # 지정하면 Chrome 프로필을 이 디렉터리에 분리 (워커 프로세스별 격리용)
+        self.profile_dir = profile_dir
+        # 지정하면 헤드리스 + 불필요한 요청 차단 (경량 페이지 모드)
+        self.lean = lean
+        # 페이지 이동 직전에 호출되는 요청 간격 제한 (프로세스 간 공유 리미터 등)
+        self.throttle: Optional[Callable[[], None]] = None
         self.sessions_dir = Path(sessions_dir)
         self.snapshots_dir = Path(snapshots_dir)
         self.sessions_dir.mkdir(exist_ok=True)
@@ -50,6 +121,14 @@ class NaverScraper:
         
         self.driver: Optional[webdriver.Chrome] = None
         self._cookie_file = self.sessions_dir / "naver_cookies.json"
+        # 마지막으로 로드한 쿠키 파일의 수정 시각 (풀에서 재사용 시 중복 로드 방지)
+        self._cookies_loaded_mtime: Optional[float] = None
+        # 마지막 페이지 준비 대기 결과
+        self.last_ready: Optional[ReadyResult] = None
+        # network 모드에서 performance 로그로 API 응답을 추적
+        self._network: Optional[NetworkCapture] = None
+        # hybrid 모드의 HTTP 세션 (브라우저가 저장한 쿠키 파일을 공유)
+        self._http: Optional[HttpFetcher] = HttpFetcher(self._cookie_file, throttle=self._throttle) if fetch_mode == "hybrid" else None
 
     def start_browser(self) -> None:
         """Start Chrome browser with persistent context for cookie management."""
@@ -100,19 +179,31 @@ class NaverScraper:
                 "profile.default_content_setting_values.microphone": 2  # 마이크 차단
             })
             
+            if self.profile_dir:
+                chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
+            
             # User-Agent 설정
             chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
             
-            # 헤드리스 모드 (필요시 주석 해제)
-            # chrome_options.add_argument("--headless")
+            # 헤드리스 모드 (경량 페이지 모드에서 사용)
+            if self.lean:
+                apply_chrome_options(chrome_options, self.lean)
+            
+            # network 추출 방식은 performance 로그로 XHR 응답을 추적
+            if self.extraction_mode == "network":
+                chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
             
             # WebDriver 초기화
             service = Service(ChromeDriverManager().install())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self._cookies_loaded_mtime = None
+            self._network = NetworkCapture(self.driver) if self.extraction_mode == "network" else None
             
             # 자동화 감지 방지
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
+            self._prepare_tab()
+            
             print("✅ Selenium Chrome 브라우저 시작 완료")
             
         except Exception as e:
@@ -121,10 +212,15 @@ class NaverScraper:
             print(f"❌ 에러 상세: {str(e)}")
             raise Exception(f"브라우저 시작 실패: {str(e)}")
 
-    def _load_cookies(self) -> None:
+    def _load_cookies(self, force: bool = False) -> None:
         """Load saved cookies from file with improved domain handling."""
         if self._cookie_file.exists() and self.driver:
             try:
+                # 같은 쿠키 파일을 이미 로드한 브라우저라면 건너뜀
+                mtime = self._cookie_file.stat().st_mtime
+                if not force and self._cookies_loaded_mtime == mtime:
+                    return
+                
                 with open(self._cookie_file, 'r', encoding='utf-8') as f:
                     cookies = json.load(f)
                 
@@ -173,6 +269,7 @@ class NaverScraper:
                 # 쿠키 로드 후 페이지 새로고침하여 세션 활성화
                 self.driver.refresh()
                 time.sleep(2)
+                self._cookies_loaded_mtime = mtime
                 
             except Exception as e:
                 print(f"⚠️ Failed to load cookies: {e}")
@@ -369,8 +466,63 @@ class NaverScraper:
             print(f"❌ Login check failed: {e}")
             return False
 
-    def scrape_article(self, url: str, include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None, max_retries: int = 3):
-        """Scrape a single article with comments and images."""
+    @classmethod
+    def parse_fields(cls, fields: Optional[Iterable[str]]) -> Optional[frozenset[str]]:
+        """fields 프로젝션 확인 (None이면 전체 필드)"""
+        if fields is None:
+            return None
+        selected = frozenset(fields)
+        unknown = sorted(selected - set(cls.ARTICLE_FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown article fields: {', '.join(unknown)} (choose from {', '.join(cls.ARTICLE_FIELDS)})")
+        return selected
+
+    def _select_fields(self, fields: Optional[Iterable[str]]) -> None:
+        """메서드 인자로 받은 프로젝션 적용 (풀에 반납될 때 reset_state에서 기본값으로 복원)"""
+        if fields is not None:
+            self.fields = self.parse_fields(fields)
+
+    def _wants(self, *names: str) -> bool:
+        """프로젝션에 names 중 하나라도 포함되는지 (프로젝션이 없으면 항상 True)"""
+        return self.fields is None or any(name in self.fields for name in names)
+
+    def _needs_images(self) -> bool:
+        """이미지 주소 수집/다운로드 여부 - image_processing="none"이거나 images_base64를 고르지 않으면 생략"""
+        return self.image_processing != "none" and self._wants("images_base64")
+
+    def _extractor_options(self) -> dict:
+        """JS 추출기/HTML 파서/API 응답 변환에 넘길 프로젝션 - 필요 없는 이미지 주소, 댓글, 본문은 찾지 않음 (HTTP 경로는 댓글 API도 호출하지 않음)"""
+        return {
+            "max_images": 10 if self._needs_images() else 0,
+            "comments": self._wants("comments"),
+            "content": self._wants("content_text", "content_html"),
+        }
+
+    def _project(self, result: dict) -> dict:
+        """게시글 레코드에서 프로젝션에 없는 필드 제거"""
+        if self.fields is None:
+            return result
+        return {key: value for key, value in result.items() if key in self.fields or key not in self.ARTICLE_FIELDS}
+
+    def scrape_article(self, url: str, include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None, max_retries: int = 3, fields: Optional[Iterable[str]] = None):
+        """Scrape a single article with comments and images.
+
+        fields(예: {"title", "comments"})를 지정하면 고른 필드에 필요한 단계만 실행한다.
+        """
+        self._select_fields(fields)
+        return self._begin_article(url, include_nicks, exclude_nicks, max_retries)()
+
+    def _begin_article(self, url: str, include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None, max_retries: int = 3, use_http: bool = True) -> Callable[[], dict]:
+        """게시글을 로딩/추출하고, 완성된 결과를 돌려주는 함수를 반환
+
+        html 모드에서는 파싱이 프로세스 풀에서 진행되므로 반환된 함수를 나중에 호출하면
+        다음 게시글 페이지 로딩과 파싱이 겹쳐서 진행된다.
+        """
+        if use_http:
+            result = self._scrape_article_http(url, include_nicks, exclude_nicks)
+            if result is not None:
+                return lambda: result
+        
         # 로그인 상태 확인을 간소화 (이미 게시판 조회에서 확인됨)
         if not self.driver:
             raise Exception("Browser not started")
@@ -382,37 +534,10 @@ class NaverScraper:
                 # Navigate to article with retry logic
                 self._navigate_with_retry(url, max_retries=2)
                 
-                # JavaScript 로딩 대기 (더 긴 시간)
-                print("⏳ JavaScript 로딩 대기 중... (30초)")
-                time.sleep(30)
+                # 페이지 준비 대기 (iframe 부착, 제목/본문 셀렉터 존재, DOM 안정화 또는 API 응답 수신)
+                ready = self._wait_for_page("article", extra_check=self._article_data_arrived(url))
                 
-                # Take snapshot for debugging
-                # URL에서 안전한 디렉터리명 생성
-                import re
-                safe_name = re.sub(r'[^\w\-_.]', '_', url.split('/')[-1].split('?')[0])
-                snapshot_dir = self.snapshots_dir / safe_name
-                snapshot_dir.mkdir(exist_ok=True)
-                self.driver.save_screenshot(str(snapshot_dir / f"page_attempt_{attempt + 1}.png"))
-                
-                # Extract article information
-                article_data = self._extract_article_data(url)
-                
-                # Extract images and convert to base64
-                images_base64 = self._extract_images()
-                
-                # Extract comments with filtering
-                comments = self._extract_comments(include_nicks, exclude_nicks)
-                
-                # Combine all data
-                result = {
-                    **article_data,
-                    "images_base64": images_base64,
-                    "comments": comments,
-                    "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
-                }
-                
-                print(f"✅ 스크래핑 성공: {article_data.get('title', 'N/A')}")
-                return result
+                return self._extract_current_article(url, include_nicks, exclude_nicks, ready, attempt + 1)
                 
             except Exception as e:
                 print(f"⚠️ 스크래핑 시도 {attempt + 1} 실패: {e}")
@@ -424,69 +549,80 @@ class NaverScraper:
                     print(f"❌ 최대 재시도 횟수 초과: {url}")
                     raise e
 
+    def _extract_current_article(self, url: str, include_nicks: list[str] | None, exclude_nicks: list[str] | None, ready: ReadyResult, attempt: int = 1) -> Callable[[], dict]:
+        """현재 탭에 준비된 게시글을 추출하고, 완성된 결과를 돌려주는 함수를 반환"""
+        self._log_page_stats()
+        
+        # Take snapshot for debugging (필드 프로젝션을 지정한 경량 수집에서는 생략)
+        if self.fields is None:
+            # URL에서 안전한 디렉터리명 생성
+            import re
+            safe_name = re.sub(r'[^\w\-_.]', '_', url.split('/')[-1].split('?')[0])
+            snapshot_dir = self.snapshots_dir / safe_name
+            snapshot_dir.mkdir(exist_ok=True)
+            self.driver.save_screenshot(str(snapshot_dir / f"page_attempt_{attempt}.png"))
+        
+        if self._network is not None:
+            # 화면이 받아온 API 응답으로 바로 구성 (DOM 셀렉터 사용 안 함)
+            raw = self._network.take(article_key(url), **self._extractor_options())
+            if raw is not None:
+                result = self._finish_article(url, raw, include_nicks, exclude_nicks, ready)
+                return lambda: result
+            print("⚠️ 게시글 API 응답을 찾지 못함, 스크립트 추출로 전환")
+        
+        # 본문이 cafe_main iframe 안에 있으면 전환 후 추출
+        enter_content_frame(self.driver)
+        
+        if self.extraction_mode == "html":
+            # 브라우저는 캡처만 하고 파싱은 프로세스 풀에 맡김
+            base_url, html = self._capture_document()
+            self.driver.switch_to.default_content()
+            future = submit_parse(html, base_url, **self._extractor_options())
+            return lambda: self._finish_article(url, future.result(), include_nicks, exclude_nicks, ready)
+        
+        raw = None
+        if self.extraction_mode in ("js", "network"):
+            try:
+                raw = run_article_extractor(self.driver, **self._extractor_options())
+            except Exception as e:
+                print(f"⚠️ 스크립트 추출 실패, Selenium 추출로 전환: {e}")
+        
+        if raw is not None:
+            self.driver.switch_to.default_content()
+            result = self._finish_article(url, raw, include_nicks, exclude_nicks, ready)
+            return lambda: result
+        
+        # Extract article information
+        article_data = self._extract_article_data(url)
+        
+        # Extract images and convert to base64
+        images_base64 = self._extract_images()
+        
+        # Extract comments with filtering
+        comments = self._extract_comments(include_nicks, exclude_nicks) if self._wants("comments") else []
+        self.driver.switch_to.default_content()
+        
+        # Combine all data
+        result = self._project({
+            **article_data,
+            "images_base64": images_base64,
+            "comments": comments,
+            "page_ready_seconds": round(ready.elapsed, 2),
+            "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
+        })
+        
+        print(f"✅ 스크래핑 성공: {article_data.get('title', 'N/A')}")
+        return lambda: result
+
     def _extract_article_data(self, url: str) -> dict:
-        """Extract basic article information."""
+        """Extract basic article information (fields 프로젝션에 없는 항목은 찾지 않음)."""
         try:
-            # Extract cafe ID from URL
-            cafe_id = url.split("cafe.naver.com/")[1].split("/")[0] if "cafe.naver.com" in url else "unknown"
-            
-            # Extract article ID from URL
-            article_id = url.split("/")[-1] if "/" in url else "unknown"
-            
-            # 네이버 카페 최신 구조에 맞는 새로운 셀렉터 (2025년 업데이트)
-            title_selectors = [
-                # 1. 실제 발견된 셀렉터들 (우선순위)
-                "h3.title",
-                "h2.title", 
-                "h1.title",
-                ".title",
-                # 2. 네이버 카페 최신 구조 (2024년 기준)
-                ".se-title-text",
-                ".se-fs-",
-                ".se-component-content h1",
-                ".se-component-content h2", 
-                ".se-component-content h3",
-                ".se-text-paragraph",
-                # 3. 게시글 본문 영역 내 제목
-                ".article_content h1",
-                ".article_content h2",
-                ".article_content h3",
-                ".post_content h1",
-                ".post_content h2",
-                ".post_content h3",
-                # 4. 일반적인 제목 셀렉터
-                ".article_title",
-                ".post_title",
-                ".content_title",
-                ".view_title",
-                # 5. 네이버 카페 특화 셀렉터
-                ".cafe-article-title",
-                ".article-view-title",
-                ".post-view-title",
-                # 6. 최신 네이버 카페 구조
-                ".Layout_content__pUOz1 h1",
-                ".Layout_content__pUOz1 h2",
-                ".Layout_content__pUOz1 h3",
-                # 7. 완전히 새로운 접근 - 모든 h 태그에서 카페 제목 제외
-                "h1:not([class*='Layout_cafe_name']):not([class*='Header'])",
-                "h2:not([class*='Layout_cafe_name']):not([class*='Header'])",
-                "h3:not([class*='Layout_cafe_name']):not([class*='Header'])",
-                # 8. 게시글 제목이 있을 수 있는 특정 영역들
-                "[class*='article'] h1",
-                "[class*='article'] h2", 
-                "[class*='article'] h3",
-                "[class*='post'] h1",
-                "[class*='post'] h2",
-                "[class*='post'] h3",
-                "[class*='content'] h1",
-                "[class*='content'] h2",
-                "[class*='content'] h3"
-            ]
+            cafe_id, article_id = self._article_ids(url)
             
-            title = self._safe_extract(title_selectors, default="제목을 찾을 수 없음")
+            title = self._safe_extract(TITLE_SELECTORS, default="제목을 찾을 수 없음") if self._wants("title") else None
             
             # 디버깅: 제목 추출 실패 시 페이지 구조 분석
-            if title == "제목을 찾을 수 없음" or "비타민D자외선요법" in title:
+            if title is not None and (title == "제목을 찾을 수 없음" or "비타민D자외선요법" in title):
                 print("🔍 디버깅: 제목 추출 문제 분석 중...")
                 try:
                     # 페이지 소스에서 가능한 제목 요소들 찾기
@@ -583,87 +719,10 @@ class NaverScraper:
                 except Exception as e:
                     print(f"⚠️ 제목 디버깅 중 오류: {e}")
             
-            # Try multiple selectors for author (updated for current Naver Cafe structure)
-            author_selectors = [
-                # 최신 네이버 카페 구조
-                ".nick",
-                ".nickname", 
-                ".author",
-                ".writer",
-                ".user_nick",
-                ".user_name",
-                ".member_nick",
-                ".member_name",
-                # 네이버 카페 특화 셀렉터
-                ".cafe-nick",
-                ".cafe-author",
-                ".article-author",
-                ".post-author",
-                # 일반적인 셀렉터
-                "[data-testid='author']",
-                ".se-fs-",
-                ".nickname_text",
-                ".author_name",
-                ".writer_name",
-                "[class*='nick']",
-                "[class*='author']",
-                "[class*='writer']",
-                ".user_info .nick",
-                ".user_info .nickname",
-                ".article_info .nick",
-                ".article_info .nickname",
-                # 추가 시도
-                "span[class*='nick']",
-                "div[class*='author']",
-                "div[class*='writer']"
-            ]
-            
-            author = self._safe_extract(author_selectors, default="작성자를 찾을 수 없음")
-            
-            # 네이버 카페 최신 구조에 맞는 내용 셀렉터 (2025년 업데이트)
-            content_selectors = [
-                # 1. 실제 발견된 셀렉터들 (우선순위)
-                ".content",
-                # 2. 네이버 에디터 최신 구조
-                ".se-main-container",
-                ".se-component-content",
-                ".se-text-paragraph",
-                ".se-text",
-                ".se-component",
-                # 3. 게시글 본문 영역
-                ".article_content",
-                ".post_content",
-                ".article_text",
-                ".board_text",
-                ".article_body",
-                # 4. 네이버 카페 특화 셀렉터
-                ".cafe-content",
-                ".cafe-article-content",
-                ".article-view-content",
-                ".view-content",
-                ".content-view",
-                # 5. 최신 네이버 카페 구조
-                ".Layout_content__pUOz1",
-                ".Layout_content__pUOz1 .se-main-container",
-                ".Layout_content__pUOz1 .se-component-content",
-                # 6. 일반적인 셀렉터
-                "[data-testid='article-content']",
-                "[class*='content']",
-                "[class*='Content']",
-                "[class*='text']",
-                "[class*='Text']",
-                # 7. se- 관련 모든 클래스
-                "div[class*='se-']",
-                "p[class*='se-']",
-                "span[class*='se-']",
-                # 8. 게시글 본문이 있을 수 있는 영역들
-                "div[class*='article']",
-                "div[class*='post']",
-                "div[class*='content']"
-            ]
+            author = self._safe_extract(AUTHOR_SELECTORS, default="작성자를 찾을 수 없음") if self._wants("author_nickname") else None
             
-            content_text = self._safe_extract(content_selectors, default="내용을 찾을 수 없음")
-            content_html = self._safe_extract_html(content_selectors, default="<p>내용을 찾을 수 없음</p>")
+            content_text = self._safe_extract(CONTENT_SELECTORS, default="내용을 찾을 수 없음") if self._wants("content_text") else None
+            content_html = self._safe_extract_html(CONTENT_SELECTORS, default="<p>내용을 찾을 수 없음</p>") if self._wants("content_html") else None
             
             # 디버깅: 페이지 구조 확인
             if content_text == "내용을 찾을 수 없음":
@@ -688,26 +747,7 @@ class NaverScraper:
                 except Exception as e:
                     print(f"⚠️ 디버깅 중 오류: {e}")
             
-            # Try to extract date
-            date_selectors = [
-                ".date",
-                ".time", 
-                ".created_at",
-                "[data-testid='created-date']",
-                ".article_date",
-                ".post_date",
-                ".board_date",
-                "[class*='date']",
-                "[class*='Date']",
-                "[class*='time']",
-                "[class*='Time']",
-                ".article_info .date",
-                ".article_info .time",
-                ".user_info .date",
-                ".user_info .time"
-            ]
-            
-            posted_at = self._safe_extract(date_selectors, default=None)
+            posted_at = self._safe_extract(DATE_SELECTORS, default=None) if self._wants("posted_at") else None
             if posted_at == "알 수 없음":
                 posted_at = None
             
@@ -735,9 +775,73 @@ class NaverScraper:
                 "content_html": f"<p>오류: {str(e)}</p>"
             }
 
+    @staticmethod
+    def _article_ids(url: str) -> tuple[str, str]:
+        """게시글 URL에서 (cafe_id, article_id) 추출"""
+        # ArticleRead.nhn?clubid=..&articleid=.. / cafes/{clubid}/articles/{id} 형태
+        ref = article_ref(url)
+        if ref is not None:
+            return ref
+        
+        # Extract cafe ID from URL
+        cafe_id = url.split("cafe.naver.com/")[1].split("/")[0] if "cafe.naver.com" in url else "unknown"
+        
+        # Extract article ID from URL
+        article_id = url.split("/")[-1] if "/" in url else "unknown"
+        return cafe_id, article_id
+
+    def _capture_document(self) -> tuple[str, str]:
+        """현재 문서(또는 전환된 iframe)의 URL과 직렬화된 DOM을 한 번에 가져옴"""
+        base_url, html = self.driver.execute_script("return [document.URL, document.documentElement.outerHTML];")
+        return base_url, html
+
+    def _finish_article(self, url: str, raw: dict, include_nicks: list[str] | None, exclude_nicks: list[str] | None, ready: ReadyResult) -> dict:
+        """추출 결과(raw)에 이미지 다운로드를 더해 최종 게시글 레코드를 만듦"""
+        article_data, image_sources, comments = self._bundle_from_raw(url, raw, include_nicks, exclude_nicks)
+        images_base64 = self._download_images(image_sources)
+        
+        result = self._project({
+            **article_data,
+            "images_base64": images_base64,
+            "comments": comments,
+            "page_ready_seconds": round(ready.elapsed, 2),
+            "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S")
+        })
+        print(f"✅ 스크래핑 성공: {article_data.get('title', 'N/A')}")
+        return result
+
+    def _bundle_from_raw(self, url: str, raw: dict, include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None) -> tuple[dict, list, list]:
+        """스크립트/HTML 파서의 raw 결과를 기존 게시글 스키마, 이미지 주소, 필터링된 댓글로 변환"""
+        cafe_id, article_id = self._article_ids(url)
+        
+        article_data = {
+            "cafe_id": cafe_id,
+            "article_id": article_id,
+            "article_url": url,
+            "title": raw.get("title") or "제목을 찾을 수 없음",
+            "author_nickname": raw.get("author") or "작성자를 찾을 수 없음",
+            "posted_at": raw.get("posted_at") or None,
+            "content_text": raw.get("content_text") or "내용을 찾을 수 없음",
+            "content_html": raw.get("content_html") or "<p>내용을 찾을 수 없음</p>"
+        }
+        
+        comments = []
+        if self._wants("comments"):
+            for item in raw.get("comments") or []:
+                author = item.get("author") or "알 수 없음"
+                if self._comment_allowed(author, include_nicks, exclude_nicks):
+                    comments.append(self._build_comment(len(comments) + 1, author, item.get("text"), item.get("date")))
+        
+        return article_data, raw.get("image_sources") or [], comments
+
     def _extract_images(self, max_images: int = 10, max_size_mb: float = 5.0) -> list:
         """Extract images and convert to base64 with memory optimization."""
-        images = []
+        if not self._needs_images():
+            return []
+        return self._download_images(self._collect_image_sources(max_images), max_size_mb)
+
+    def _collect_image_sources(self, max_images: int = 10) -> list:
+        """현재 문서의 img src 목록 (최대 max_images개)"""
         try:
             # Find all images in the article
             image_elements = self.driver.find_elements(By.TAG_NAME, "img")
@@ -747,91 +851,36 @@ class NaverScraper:
                 print(f"⚠️ Too many images ({len(image_elements)}), limiting to {max_images}")
                 image_elements = image_elements[:max_images]
             
-            for i, img in enumerate(image_elements):
+            sources = []
+            for img in image_elements:
                 try:
-                    # Get image source
-                    src = img.get_attribute("src")
-                    if not src or src.startswith("data:"):
-                        continue
-                    
-                    # Download image and convert to base64
-                    response = requests.get(src, timeout=10)
-                    if response.status_code == 200:
-                        image_data = response.content
-                        
-                        # Check image size to prevent memory issues
-                        size_mb = len(image_data) / (1024 * 1024)
-                        if size_mb > max_size_mb:
-                            print(f"⚠️ Image {i+1} too large ({size_mb:.1f}MB), skipping")
-                            continue
-                        
-                        base64_data = base64.b64encode(image_data).decode('utf-8')
-                        
-                        # Determine MIME type
-                        mime_type = "image/jpeg"
-                        if src.lower().endswith('.png'):
-                            mime_type = "image/png"
-                        elif src.lower().endswith('.gif'):
-                            mime_type = "image/gif"
-                        
-                        images.append({
-                            "mime": mime_type,
-                            "data": base64_data,
-                            "filename": f"image_{i+1}.jpg",
-                            "size_mb": round(size_mb, 2)
-                        })
-                        
-                except Exception as e:
-                    print(f"⚠️ Error processing image {i}: {e}")
-                    continue
-                    
+                    sources.append(img.get_attribute("src"))
+                except Exception:
+                    sources.append(None)
+            return sources
         except Exception as e:
             print(f"⚠️ Error extracting images: {e}")
-        
-        return images
+            return []
+
+    def _download_images(self, sources: list, max_size_mb: float = 5.0) -> list:
+        """이미지 주소 목록을 내려받아 base64로 변환 (연결 풀 + 동시 다운로드, 게시글당 시간 제한)"""
+        if not self._needs_images():
+            return []
+        store = self.image_store if self.image_processing == "server" else None
+        if self.image_processing == "server" and store is None:
+            print("⚠️ 이미지 저장소가 설정되지 않아 base64로 처리")
+        try:
+            return download_images(sources, max_size_mb, store=store)
+        except Exception as e:
+            print(f"⚠️ Error extracting images: {e}")
+            return []
 
     def _extract_comments(self, include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None) -> list:
         """Extract comments with nickname filtering."""
         comments = []
         try:
-            # Try multiple selectors for comments (updated for current Naver Cafe structure)
-            comment_selectors = [
-                # 1. 실제 발견된 셀렉터들 (우선순위)
-                ".comment_area",
-                ".LinkComment",
-                # 2. 최신 네이버 카페 구조
-                ".comment",
-                ".reply", 
-                ".comment_item",
-                ".reply_item",
-                ".cafe-comment",
-                ".cafe-reply",
-                ".article-comment",
-                ".article-reply",
-                # 3. 네이버 카페 특화 셀렉터
-                ".comment-list .comment",
-                ".comment-list .reply",
-                ".reply-list .comment",
-                ".reply-list .reply",
-                ".comment-area .comment",
-                ".comment-area .reply",
-                ".reply-area .comment",
-                ".reply-area .reply",
-                # 4. 일반적인 셀렉터
-                "[data-testid='comment']",
-                "[class*='comment']",
-                "[class*='Comment']",
-                "[class*='reply']",
-                "[class*='Reply']",
-                # 5. 추가 시도
-                "div[class*='comment']",
-                "div[class*='reply']",
-                "li[class*='comment']",
-                "li[class*='reply']"
-            ]
-            
             comment_elements = []
-            for selector in comment_selectors:
+            for selector in COMMENT_SELECTORS:
                 try:
                     elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                     if elements:
@@ -843,33 +892,20 @@ class NaverScraper:
             for comment_element in comment_elements:
                 try:
                     # Extract comment text
-                    text_element = comment_element.find_elements(By.CSS_SELECTOR, ".comment_text, .reply_text, .content")
+                    text_element = comment_element.find_elements(By.CSS_SELECTOR, COMMENT_TEXT_SELECTOR)
                     text = text_element[0].text if text_element else "댓글 내용 없음"
                     
                     # Extract author
-                    author_element = comment_element.find_elements(By.CSS_SELECTOR, ".nick, .nickname, .author")
+                    author_element = comment_element.find_elements(By.CSS_SELECTOR, COMMENT_AUTHOR_SELECTOR)
                     author = author_element[0].text if author_element else "알 수 없음"
                     
                     # Extract date
-                    date_element = comment_element.find_elements(By.CSS_SELECTOR, ".date, .time")
+                    date_element = comment_element.find_elements(By.CSS_SELECTOR, COMMENT_DATE_SELECTOR)
                     date = date_element[0].text if date_element else None
                     
                     # Apply nickname filtering
-                    should_include = True
-                    
-                    if include_nicks and include_nicks:
-                        should_include = any(nick in author for nick in include_nicks)
-                    
-                    if exclude_nicks and exclude_nicks:
-                        should_include = should_include and not any(nick in author for nick in exclude_nicks)
-                    
-                    if should_include:
-                        comments.append({
-                            "comment_id": f"comment_{len(comments)+1}",
-                            "nickname": author.strip() if author else "알 수 없음",
-                            "text": text.strip() if text else "댓글 내용 없음",
-                            "created_at": date.strip() if date else None
-                        })
+                    if self._comment_allowed(author, include_nicks, exclude_nicks):
+                        comments.append(self._build_comment(len(comments) + 1, author, text, date))
                         
                 except Exception as e:
                     print(f"⚠️ Error processing comment: {e}")
@@ -880,18 +916,50 @@ class NaverScraper:
         
         return comments
 
-    def scrape_board_articles(self, board_url: str, max_pages: int = 5) -> list[dict]:
-        """Scrape articles from a board page with pagination."""
+    @staticmethod
+    def _comment_allowed(author: str, include_nicks: list[str] | None, exclude_nicks: list[str] | None) -> bool:
+        """댓글 작성자 닉네임 포함/제외 필터 (대소문자/한글 조합 차이 무시)"""
+        return text_filter(include_nicks, exclude_nicks).allows(author)
+
+    @staticmethod
+    def _build_comment(index: int, author: str | None, text: str | None, date: str | None) -> dict:
+        """댓글 레코드 생성 (CSV comments_json 스키마)"""
+        return {
+            "comment_id": f"comment_{index}",
+            "nickname": author.strip() if author else "알 수 없음",
+            "text": text.strip() if text else "댓글 내용 없음",
+            "created_at": date.strip() if date else None
+        }
+
+    def scrape_board_articles(self, board_url: str, max_pages: int = 5, start_page: int = 1, on_page: Optional[Callable[[int, list[dict]], None]] = None, article_filter: Optional[dict] = None, limit: Optional[int] = None) -> list[dict]:
+        """Scrape articles from a board page with pagination.
+
+        start_page부터 읽으며, on_page(page, articles)는 페이지를 하나 읽을 때마다 호출된다 (체크포인트 기록용).
+        incremental 모드에서는 이전 실행의 기준 article_id보다 큰 게시글만 반환하고,
+        기준 이하 게시글만 있는 페이지를 만나면 더 읽지 않는다.
+        article_filter(키워드/작성자/기간)는 페이지를 읽을 때마다 바로 적용하며, 통과한 게시글이 limit개가 되거나
+        페이지 마지막 게시글(목록은 최신순)이 수집 기간보다 오래되면 다음 페이지를 읽지 않는다.
+        """
         # 간단한 로그인 상태 확인
         if not self._cookie_file.exists():
             raise Exception("Login required but failed")
         
         articles = []
-        page = 1
+        page = start_page
         total_articles = 0
+        if limit is not None and limit <= 0:
+            return articles
+        not_before = self._period_start(article_filter)
+        
+        board_ids = self._board_ids(board_url) if self.incremental and self.seen_index is not None else None
+        high_water = self.seen_index.high_water_mark(*board_ids) if board_ids else None
+        newest = high_water
+        completed = True
         
         print(f"📊 게시판 스크래핑 시작: {board_url}")
         print(f"📄 최대 페이지: {max_pages}")
+        if high_water is not None:
+            print(f"📌 증분 크롤링: article_id {high_water} 이후 게시글만 수집")
         print("=" * 50)
         
         while page <= max_pages:
@@ -899,40 +967,127 @@ class NaverScraper:
                 progress = f"[페이지 {page:2d}/{max_pages:2d}]"
                 print(f"📄 {progress} 게시판 페이지 로딩 중...")
                 
-                # Navigate to board page
-                page_url = f"{board_url}?page={page}" if "?" not in board_url else f"{board_url}&page={page}"
-                self.driver.get(page_url)
-                time.sleep(2)
-                
-                # Take snapshot for debugging
-                snapshot_dir = self.snapshots_dir / f"board_page_{page}"
-                snapshot_dir.mkdir(exist_ok=True)
-                self.driver.save_screenshot(str(snapshot_dir / "page.png"))
-                
-                # Extract article links from current page
-                page_articles = self._extract_article_links_from_board()
+                # hybrid 모드는 게시판 목록 API를 먼저 시도
+                page_articles = self._fetch_board_page_http(board_url, page)
+                fetched_over_http = page_articles is not None
+                if not fetched_over_http:
+                    page_articles = self._load_board_page(board_url, page)
                 
                 if not page_articles:
                     print(f"📄 {progress} 게시글을 찾을 수 없음, 페이지네이션 중단")
                     break
                 
+                listed = page_articles
+                if board_ids is not None:
+                    page_ids = [self._numeric_article_id(article) for article in page_articles]
+                    newest = max([newest or 0, *(article_id for article_id in page_ids if article_id is not None)])
+                    if high_water is not None:
+                        page_articles = [article for article, article_id in zip(page_articles, page_ids) if article_id is None or article_id > high_water]
+                        if not page_articles:
+                            print(f"📌 {progress} 새 게시글 없음 (기준 article_id {high_water} 이하), 페이지네이션 중단")
+                            break
+                
+                found = len(page_articles)
+                page_articles = self._skip_seen(page_articles)
+                if article_filter is not None:
+                    page_articles = self._filter_articles(page_articles, **article_filter)
+                filled = limit is not None and total_articles + len(page_articles) >= limit
+                if filled:
+                    page_articles = page_articles[:limit - total_articles]
                 articles.extend(page_articles)
                 total_articles += len(page_articles)
-                print(f"✅ {progress} 완료 - 발견된 게시글: {len(page_articles)}개 (누적: {total_articles}개)")
+                excluded = f", 제외 {found - len(page_articles)}개" if len(page_articles) < found else ""
+                print(f"✅ {progress} 완료 - 발견된 게시글: {found}개{excluded} (누적: {total_articles}개)")
+                if on_page is not None:
+                    on_page(page, page_articles)
+                
+                if filled:
+                    # 뒤쪽 페이지를 읽지 않았으므로 증분 기준은 올리지 않음
+                    print(f"🛑 {progress} 수집할 게시글 수({limit}개)를 채움, 페이지네이션 중단")
+                    completed = False
+                    break
+                if not_before is not None and self._page_older_than(listed, not_before):
+                    print(f"📅 {progress} 수집 기간({not_before:%Y.%m.%d.}) 이전 게시글에 도달, 페이지네이션 중단")
+                    break
                 
                 page += 1
                 
-                # Add delay to avoid being blocked
-                time.sleep(2)
+                # Add delay to avoid being blocked (HTTP 경로는 요청 간격 제한이 설정된 경우에만 그것으로 대체)
+                if not fetched_over_http or self.throttle is None:
+                    time.sleep(2)
                 
             except Exception as e:
                 print(f"⚠️ {progress} 오류: {e}")
+                completed = False
                 break
+        else:
+            # max_pages에서 멈추면 그 뒤(더 오래된) 게시글은 목록에서 보지 못함
+            completed = False
+        
+        # 목록을 끝까지 읽은 경우에만 기준 후보로 기록 (오류, 수집 수 제한, max_pages로 중단되면 다음 실행에서 다시 확인)
+        # 기준은 수집할 게시글이 CSV에 기록될 때(수집 이력의 on_written 경로) 기록된 만큼만 올라감
+        if board_ids is not None and completed and newest and newest != high_water:
+            self.seen_index.track_board_listing(*board_ids, newest, [self._article_ids(article["article_url"]) for article in articles])
         
         print("=" * 50)
         print(f"📊 게시판 스크래핑 완료: 총 {total_articles}개 게시글 발견")
         return articles
 
+    @staticmethod
+    def _page_older_than(page_articles: list[dict], not_before: datetime) -> bool:
+        """페이지의 가장 아래(가장 오래된) 날짜가 기준보다 이전인지 - 위쪽 공지글은 보지 않음"""
+        dates = [date for date in parse_naver_dates(article.get("posted_at") for article in page_articles) if date is not None]
+        return bool(dates) and dates[-1] < not_before
+
+    @staticmethod
+    def _board_ids(board_url: str) -> Optional[tuple[str, str]]:
+        """게시판 URL에서 (cafe_id, menu_id) 추출 - 증분 크롤링 기준의 키"""
+        ref = board_ref(board_url)
+        if ref is not None:
+            return ref
+        match = re.search(r"menuid=(\d+)", board_url, re.IGNORECASE)
+        if match is None or "cafe.naver.com/" not in board_url:
+            return None
+        cafe_id = board_url.split("cafe.naver.com/")[1].split("/")[0].split("?")[0]
+        return (cafe_id, match.group(1)) if cafe_id else None
+
+    def _numeric_article_id(self, article: dict) -> Optional[int]:
+        article_id = self._article_ids(article["article_url"])[1]
+        return int(article_id) if article_id.isdigit() else None
+
+    def _skip_seen(self, articles: list[dict]) -> list[dict]:
+        """중복 처리 정책에 따라 이전 실행에서 수집한 게시글을 목록에서 제외"""
+        if self.seen_index is None or not self.dedup.enabled or not articles:
+            return articles
+        refs = [self._article_ids(article["article_url"]) for article in articles]
+        scraped = self.seen_index.scraped_times(refs)
+        if not scraped:
+            return articles
+        now = time.time()
+        kept = [article for article, ref in zip(articles, refs) if not self.dedup.should_skip(scraped.get(ref), now)]
+        self.seen_index.count_skipped(len(articles) - len(kept))
+        return kept
+
+    def _load_board_page(self, board_url: str, page: int) -> list[dict]:
+        """브라우저로 게시판 페이지를 열어 게시글 링크 추출"""
+        # Navigate to board page
+        page_url = f"{board_url}?page={page}" if "?" not in board_url else f"{board_url}&page={page}"
+        self._throttle()
+        self.driver.get(page_url)
+        self._wait_for_page("board")
+        
+        # Take snapshot for debugging (필드 프로젝션을 지정한 경량 수집에서는 생략)
+        if self.fields is None:
+            snapshot_dir = self.snapshots_dir / f"board_page_{page}"
+            snapshot_dir.mkdir(exist_ok=True)
+            self.driver.save_screenshot(str(snapshot_dir / "page.png"))
+        
+        # Extract article links from current page
+        enter_content_frame(self.driver)
+        page_articles = self._extract_article_links_from_board()
+        self.driver.switch_to.default_content()
+        return page_articles
+
     def _extract_article_links_from_board(self) -> list[dict]:
         """Extract article links and basic info from board page."""
         articles = []
@@ -1047,14 +1202,37 @@ class NaverScraper:
         
         return articles
 
-    def scrape_multiple_articles(self, article_urls: list[str], include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None, max_concurrent: int = 3) -> list[dict]:
-        """Scrape multiple articles with progress tracking."""
+    def scrape_multiple_articles(self, article_urls: list[str], include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None, max_concurrent: int = 3, use_http: bool = True, on_result: Optional[Callable[[dict], None]] = None, fields: Optional[Iterable[str]] = None) -> list[dict]:
+        """Scrape multiple articles with progress tracking.
+
+        on_result는 게시글 하나가 끝날 때마다(실패 포함) 호출된다 - 결과 저장을 스크래핑과 겹쳐 진행하는 용도.
+        fields를 지정하면 고른 필드에 필요한 추출 단계만 실행한다.
+        """
+        self._select_fields(fields)
+        results: list[Optional[dict]] = [None] * len(article_urls)
+        for index, result in self._iter_articles(article_urls, include_nicks, exclude_nicks, max_concurrent, use_http):
+            results[index] = result
+            if on_result is not None:
+                on_result(result)
+        return results
+
+    def iter_multiple_articles(self, article_urls: list[str], include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None, max_concurrent: int = 3, use_http: bool = True, fields: Optional[Iterable[str]] = None) -> Iterator[dict]:
+        """scrape_multiple_articles의 제너레이터 버전 - 끝난 게시글부터 하나씩 반환 (결과 목록을 모아 두지 않음)"""
+        self._select_fields(fields)
+        for _, result in self._iter_articles(article_urls, include_nicks, exclude_nicks, max_concurrent, use_http):
+            yield result
+
+    def _iter_articles(self, article_urls: list[str], include_nicks: list[str] | None, exclude_nicks: list[str] | None, max_concurrent: int, use_http: bool) -> Iterator[tuple[int, dict]]:
+        """(입력 순서 인덱스, 결과)를 게시글이 끝나는 순서대로 반환"""
         # 로그인 상태 확인을 간소화 (이미 게시판 조회에서 확인됨)
         if not self.driver:
             raise Exception("Browser not started")
         
-        start_time = time.time()
-        results = []
+        # hybrid 모드: HTTP로 먼저 처리하고 실패한 게시글만 브라우저로
+        if use_http and self._http is not None:
+            yield from self._iter_articles_hybrid(article_urls, include_nicks, exclude_nicks, max_concurrent)
+            return
+        
         total = len(article_urls)
         successful = 0
         failed = 0
@@ -1066,45 +1244,306 @@ class NaverScraper:
         print(f"🚀 다중 게시글 스크래핑 시작: {total}개 게시글")
         print("=" * 60)
         
-        # Process articles sequentially (Selenium doesn't support true concurrency)
-        for i, url in enumerate(article_urls, 1):
+        # 여러 탭에서 페이지 로딩을 겹쳐 진행
+        if max_concurrent > 1 and total > 1:
+            for index, result in self._iter_articles_in_tabs(article_urls, include_nicks, exclude_nicks, max_concurrent):
+                if "error" not in result:
+                    successful += 1
+                yield index, result
+            failed = total - successful
+            print("=" * 60)
+            print(f"📊 스크래핑 완료: 총 {total}개 중 성공 {successful}개, 실패 {failed}개")
+            return
+        
+        # html 모드에서는 이전 게시글의 마무리(파싱 결과 수신)를 한 단계 늦춰
+        # 프로세스 풀의 파싱이 다음 게시글 로딩과 겹치도록 함
+        pipeline_depth = 1 if self.extraction_mode == "html" else 0
+        pending = []
+        
+        def complete(progress: str, url: str, finish: Callable[[], dict]) -> dict:
+            nonlocal successful, failed
             try:
-                progress = f"[{i:3d}/{total:3d}]"
-                percentage = (i / total) * 100
-                print(f"📄 {progress} ({percentage:5.1f}%) 스크래핑 중: {url}")
-                
-                # Scrape individual article
-                article_data = self.scrape_article(url, include_nicks, exclude_nicks)
-                results.append(article_data)
+                result = finish()
                 successful += 1
                 print(f"✅ {progress} 완료")
-                
-                # Add delay between requests
-                if i < total:
-                    delay = self._calculate_delay(i, total)
-                    scraping_logger.log_antibot_measure("요청 간 대기", f"{delay}초")
-                    time.sleep(delay)
-                
+                return result
             except Exception as e:
                 print(f"❌ {progress} 실패: {e}")
                 failed += 1
-                results.append({
+                return {
                     "article_url": url,
                     "title": "스크래핑 실패",
                     "error": str(e),
                     "scraped_at": None
-                })
+                }
+        
+        # Process articles sequentially (Selenium doesn't support true concurrency)
+        for i, url in enumerate(article_urls, 1):
+            progress = f"[{i:3d}/{total:3d}]"
+            percentage = (i / total) * 100
+            print(f"📄 {progress} ({percentage:5.1f}%) 스크래핑 중: {url}")
+            
+            # Scrape individual article
+            try:
+                finish = self._begin_article(url, include_nicks, exclude_nicks, use_http=use_http)
+            except Exception as e:
+                def finish(error: Exception = e) -> dict:
+                    raise error
+            pending.append((i - 1, progress, url, finish))
+            
+            while len(pending) > pipeline_depth:
+                index, *args = pending.pop(0)
+                yield index, complete(*args)
+            
+            # Add delay between requests
+            if i < total:
+                delay = self._calculate_delay(i, total)
+                scraping_logger.log_antibot_measure("요청 간 대기", f"{delay}초")
+                time.sleep(delay)
+        
+        while pending:
+            index, *args = pending.pop(0)
+            yield index, complete(*args)
         
         print("=" * 60)
         print(f"📊 스크래핑 완료: 총 {total}개 중 성공 {successful}개, 실패 {failed}개")
-        return results
+
+    def _iter_articles_hybrid(self, article_urls: list[str], include_nicks: list[str] | None, exclude_nicks: list[str] | None, max_concurrent: int) -> Iterator[tuple[int, dict]]:
+        """HTTP 세션으로 게시글을 가져오고, 처리하지 못한 게시글은 기존 브라우저 경로로 넘김"""
+        total = len(article_urls)
+        fallback: list[int] = []
+        successful = 0
+        
+        scraping_logger.log_scraping_start("다중 게시글 (HTTP)", total)
+        for i, url in enumerate(article_urls):
+            result = self._scrape_article_http(url, include_nicks, exclude_nicks)
+            if result is None:
+                fallback.append(i)
+                continue
+            successful += 1
+            print(f"✅ [{i + 1:3d}/{total:3d}] 완료 (HTTP)")
+            yield i, result
+            
+            # 요청 간격 제한이 없으면 브라우저 경로와 같은 간격으로 대기
+            if self.throttle is None and i + 1 < total:
+                delay = self._calculate_delay(i + 1, total)
+                scraping_logger.log_antibot_measure("요청 간 대기 (HTTP)", f"{delay}초")
+                time.sleep(delay)
+        
+        if fallback:
+            print(f"🌐 HTTP로 처리하지 못한 게시글 {len(fallback)}개는 브라우저로 처리")
+            browser_results = self._iter_articles([article_urls[i] for i in fallback], include_nicks, exclude_nicks, max_concurrent, use_http=False)
+            for j, result in browser_results:
+                if "error" not in result:
+                    successful += 1
+                yield fallback[j], result
+        
+        print(f"📊 스크래핑 완료: 총 {total}개 중 성공 {successful}개, 실패 {total - successful}개 (HTTP {total - len(fallback)}개)")
+
+    def _scrape_article_http(self, url: str, include_nicks: list[str] | None, exclude_nicks: list[str] | None) -> Optional[dict]:
+        """hybrid 모드에서 HTTP로 게시글 처리 (처리할 수 없으면 None - 호출자가 브라우저로 처리)"""
+        if self._http is None:
+            return None
+        start = time.monotonic()
+        try:
+            raw = self._http.fetch_article(url, **self._extractor_options())
+        except HttpLoginRequired as e:
+            print(f"🔑 HTTP 세션 로그인 필요 ({e}) - 브라우저 쿠키로 갱신")
+            self._refresh_http_session()
+            return None
+        except Exception as e:
+            print(f"⚠️ HTTP 게시글 요청 실패, 브라우저로 전환: {e}")
+            return None
+        if raw is None:
+            return None
+        
+        ready = ReadyResult("http", True, time.monotonic() - start, "http")
+        scraping_logger.log_performance("HTTP 게시글", ready.elapsed, url)
+        return self._finish_article(url, raw, include_nicks, exclude_nicks, ready)
+
+    def _fetch_board_page_http(self, board_url: str, page: int) -> Optional[list[dict]]:
+        """hybrid 모드에서 HTTP로 게시판 목록 한 페이지 조회 (실패 시 None)"""
+        if self._http is None:
+            return None
+        try:
+            return self._http.fetch_board_page(board_url, page)
+        except HttpLoginRequired as e:
+            print(f"🔑 HTTP 세션 로그인 필요 ({e}) - 브라우저 쿠키로 갱신")
+            self._refresh_http_session()
+        except Exception as e:
+            print(f"⚠️ HTTP 게시판 요청 실패, 브라우저로 전환: {e}")
+        return None
+
+    def _refresh_http_session(self) -> None:
+        """브라우저의 최신 쿠키를 HTTP 세션에 다시 적용"""
+        if self._http is None or not self.driver:
+            return
+        try:
+            self._throttle()
+            self.driver.get(CAFE_BASE)
+            self._http.load_cookies(self.driver.get_cookies())
+        except Exception as e:
+            print(f"⚠️ HTTP 세션 쿠키 갱신 실패: {e}")
+
+    def _iter_articles_in_tabs(self, article_urls: list[str], include_nicks: list[str] | None, exclude_nicks: list[str] | None, max_concurrent: int) -> Iterator[tuple[int, dict]]:
+        """여러 탭에서 게시글 페이지 로딩을 동시에 시작하고, 준비된 탭부터 추출
+
+        chromedriver는 로딩 중인 탭에 명령을 보내면 그 탭의 로드가 끝날 때까지 응답을 미루지만,
+        그동안 다른 탭의 로딩도 계속 진행되므로 페이지 로드 시간이 서로 겹친다.
+        마무리(html 모드의 파싱 결과 수신 등)는 탭 수만큼만 미뤄 두고 끝난 게시글부터 (인덱스, 결과)로 반환한다.
+        게시글 이동 사이의 대기는 순차 처리와 같으므로 카페로 보내는 요청 빈도는 늘지 않고, 로딩과 추출만 대기 시간과 겹친다.
+        탭에서 실패한 게시글은 마지막에 기존 순차 방식(scrape_article 재시도 포함)으로 다시 시도한다.
+        """
+        total = len(article_urls)
+        finishers: dict[int, Callable[[], dict]] = {}
+        retry_indexes: list[int] = []
+        profile = PROFILES["article"]
+        queue = deque(enumerate(article_urls))
+        busy: dict[str, tuple[int, str, ReadinessTracker]] = {}
+        tabs = [self.driver.current_window_handle]
+        launched = 0
+        next_launch_at = 0.0
+        
+        def progress_of(index: int) -> str:
+            return f"[{index + 1:3d}/{total:3d}]"
+        
+        def finish(index: int) -> Iterator[tuple[int, dict]]:
+            try:
+                result = finishers.pop(index)()
+            except Exception as e:
+                print(f"⚠️ {progress_of(index)} 추출 실패: {e}")
+                retry_indexes.append(index)
+                return
+            print(f"✅ {progress_of(index)} 완료")
+            yield index, result
+        
+        try:
+            for _ in range(min(max_concurrent, total) - 1):
+                self.driver.switch_to.new_window("tab")
+                self._prepare_tab()
+                tabs.append(self.driver.current_window_handle)
+            print(f"🗂️ 탭 {len(tabs)}개로 동시 로딩")
+            
+            while queue or busy:
+                # 1. 비어 있는 탭에 다음 게시글 이동 시작 (요청 간 대기는 순차 처리와 같음 - 탭을 늘려도 요청 빈도는 그대로)
+                for handle in list(tabs):
+                    if not queue or handle in busy or time.monotonic() < next_launch_at:
+                        continue
+                    index, url = queue.popleft()
+                    print(f"📄 {progress_of(index)} ({(index + 1) / total * 100:5.1f}%) 스크래핑 중: {url}")
+                    try:
+                        self.driver.switch_to.window(handle)
+                        self.driver.switch_to.default_content()
+                        self._throttle()
+                        self.driver.execute_script(NAVIGATE_JS, url)
+                        busy[handle] = (index, url, ReadinessTracker(profile))
+                    except Exception as e:
+                        print(f"⚠️ {progress_of(index)} 탭 이동 실패: {e}")
+                        retry_indexes.append(index)
+                        self._drop_dead_tab(handle, tabs)
+                    launched += 1
+                    if launched < total:
+                        delay = self._calculate_delay(launched, total)
+                        scraping_logger.log_antibot_measure("요청 간 대기", f"{delay:.1f}초 (탭 {len(tabs)}개)")
+                        next_launch_at = time.monotonic() + delay
+                
+                # 2. 로딩 중인 탭 중 준비된 탭만 추출
+                harvested = False
+                for handle, (index, url, tracker) in list(busy.items()):
+                    try:
+                        self.driver.switch_to.window(handle)
+                        try:
+                            probe = probe_readiness(self.driver, profile)
+                        except Exception as e:
+                            probe = None
+                            tracker.reason = f"probe failed: {type(e).__name__}"
+                        if self._network is not None and self._network.has_article(article_key(url)):
+                            ready = tracker.signal()
+                        else:
+                            ready = tracker.update(probe)
+                        if ready is None:
+                            continue
+                        
+                        del busy[handle]
+                        harvested = True
+                        status = "준비 완료" if ready.ready else f"데드라인 도달 - {ready.reason}"
+                        scraping_logger.log_performance(f"페이지 준비 [{ready.profile}]", ready.elapsed, status)
+                        self.last_ready = ready
+                        finishers[index] = self._extract_current_article(url, include_nicks, exclude_nicks, ready)
+                    except Exception as e:
+                        busy.pop(handle, None)
+                        print(f"⚠️ {progress_of(index)} 탭 처리 실패: {e}")
+                        retry_indexes.append(index)
+                        self._drop_dead_tab(handle, tabs)
+                
+                # 결과를 모두 모아 두지 않도록 오래된 마무리부터 처리
+                while len(finishers) > len(tabs):
+                    yield from finish(min(finishers))
+                
+                if not tabs:
+                    raise Exception("All browser tabs were lost")
+                if busy and not harvested:
+                    time.sleep(profile.poll_interval)
+                elif queue and not busy:
+                    time.sleep(max(0.0, next_launch_at - time.monotonic()))
+        finally:
+            self._close_extra_tabs(tabs)
+        
+        # 남은 마무리 (입력 순서대로)
+        for index in sorted(finishers):
+            yield from finish(index)
+        
+        # 탭에서 실패한 게시글은 순차 방식으로 재시도 (다른 탭의 결과에는 영향 없음)
+        for index in sorted(retry_indexes):
+            url = article_urls[index]
+            try:
+                result = self.scrape_article(url, include_nicks, exclude_nicks)
+                print(f"✅ {progress_of(index)} 완료 (재시도)")
+            except Exception as e:
+                print(f"❌ {progress_of(index)} 실패: {e}")
+                result = {
+                    "article_url": url,
+                    "title": "스크래핑 실패",
+                    "error": str(e),
+                    "scraped_at": None
+                }
+            yield index, result
+
+    def _drop_dead_tab(self, handle: str, tabs: list[str]) -> None:
+        """닫혔거나 응답하지 않는 탭을 목록에서 제거"""
+        try:
+            alive = handle in self.driver.window_handles
+        except Exception:
+            alive = False
+        if not alive and handle in tabs:
+            tabs.remove(handle)
+
+    def _close_extra_tabs(self, tabs: list[str]) -> None:
+        """동시 로딩용으로 연 탭을 닫고 첫 번째 탭으로 복귀"""
+        try:
+            handles = self.driver.window_handles
+        except Exception:
+            return
+        keep = next((handle for handle in tabs if handle in handles), handles[0] if handles else None)
+        for handle in handles:
+            if handle == keep or handle not in tabs:
+                continue
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                continue
+        if keep:
+            self.driver.switch_to.window(keep)
+            self.driver.switch_to.default_content()
 
     def _navigate_with_retry(self, url: str, max_retries: int = 3) -> None:
         """Navigate to URL with retry logic."""
         for attempt in range(max_retries):
             try:
+                # driver.get은 문서 로드까지 대기하며, 이후 준비 상태는 호출자가 _wait_for_page로 확인
+                self._throttle()
                 self.driver.get(url)
-                time.sleep(3)  # Wait for page to load
                 return
             except Exception as e:
                 print(f"⚠️ 네비게이션 시도 {attempt + 1} 실패: {e}")
@@ -1113,6 +1552,61 @@ class NaverScraper:
                 else:
                     raise e
 
+    def _prepare_tab(self) -> None:
+        """경량 모드면 현재 탭에 요청 차단 적용 (CDP 설정은 탭마다 별도)"""
+        if not self.lean:
+            return
+        try:
+            install_request_blocking(self.driver, self.lean)
+        except Exception as e:
+            print(f"⚠️ 요청 차단 설정 실패: {e}")
+
+    def _log_page_stats(self) -> Optional[dict]:
+        """현재 페이지의 전송량과 로드 시간을 기록 (경량 모드 절감 효과 확인용)"""
+        stats = collect_page_stats(self.driver)
+        if stats:
+            mode = "lean" if self.lean else "full"
+            scraping_logger.log_performance(
+                f"페이지 로드 [{mode}]",
+                stats.get("load_ms", 0) / 1000,
+                f"{stats.get('bytes', 0) / 1024:.0f}KB, 요청 {stats.get('requests', 0)}개"
+            )
+        return stats
+
+    def _article_data_arrived(self, url: str) -> Optional[Callable[[], bool]]:
+        """network 모드의 준비 신호 - 해당 게시글의 API 응답 수신 여부"""
+        if self._network is None:
+            return None
+        key = article_key(url)
+        return lambda: self._network.has_article(key)
+
+    def _worker_options(self) -> dict:
+        """워커 프로세스의 스크래퍼를 같은 설정으로 만들기 위한 생성자 인자"""
+        return {
+            "extraction_mode": self.extraction_mode,
+            "lean": self.lean,
+            "fetch_mode": self.fetch_mode,
+            "image_processing": self.image_processing,
+            "images_dir": str(self.image_store.root) if self.image_store else None,
+            "seen_index_path": self.seen_index.path if self.seen_index else None,
+            "dedup": self.dedup,
+            "incremental": self.incremental,
+            "fields": self.fields,
+        }
+
+    def _throttle(self) -> None:
+        """설정된 요청 간격 제한이 있으면 대기"""
+        if self.throttle is not None:
+            self.throttle()
+
+    def _wait_for_page(self, profile: str, extra_check=None) -> ReadyResult:
+        """페이지 준비 대기 후 측정된 준비 시간을 기록"""
+        result = wait_until_ready(self.driver, profile, extra_check=extra_check)
+        status = "준비 완료" if result.ready else f"데드라인 도달 - {result.reason}"
+        scraping_logger.log_performance(f"페이지 준비 [{result.profile}]", result.elapsed, status)
+        self.last_ready = result
+        return result
+
     def _safe_extract(self, selectors: list[str], timeout: int = 2, default: str = "알 수 없음") -> str:
         """Safely extract text using multiple selectors."""
         for selector in selectors:
@@ -1190,7 +1684,7 @@ class NaverScraper:
             # 카페 메인 페이지로 이동
             print(f"🌐 카페 페이지 이동: {cafe_url}")
             self.driver.get(cafe_url)
-            time.sleep(3)
+            self._wait_for_page("menu")
             
             # 게시판 목록 추출
             boards = self._extract_cafe_boards()
@@ -1284,14 +1778,86 @@ class NaverScraper:
         print(f"📊 총 {len(boards)}개 게시판 추출 완료")
         return boards
     
-    def scrape_cafe(self, cafe_url: str, max_pages: int, all_boards: bool, selected_boards: list[str], include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None) -> list[dict]:
-        """카페 전체 또는 특정 게시판 스크래핑"""
+    def crawl_board(self, board_url: str, max_pages: int, include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None, article_filter: Optional[dict] = None, limit: Optional[int] = None, on_result: Optional[Callable[[dict], None]] = None, fields: Optional[Iterable[str]] = None) -> list[dict]:
+        """게시판 하나를 페이지네이션하고 (필터 적용 후) 게시글 상세를 스크래핑"""
+        self._select_fields(fields)
+        article_urls = self._board_article_urls(board_url, max_pages, article_filter, limit)
+        if not article_urls:
+            return []
+        return self.scrape_multiple_articles(article_urls, include_nicks, exclude_nicks, on_result=on_result)
+
+    def iter_board(self, board_url: str, max_pages: int, include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None, article_filter: Optional[dict] = None, limit: Optional[int] = None, fields: Optional[Iterable[str]] = None) -> Iterator[dict]:
+        """crawl_board의 제너레이터 버전 - 끝난 게시글부터 하나씩 반환"""
+        self._select_fields(fields)
+        article_urls = self._board_article_urls(board_url, max_pages, article_filter, limit)
+        yield from self.iter_multiple_articles(article_urls, include_nicks, exclude_nicks)
+
+    def _board_article_urls(self, board_url: str, max_pages: int, article_filter: Optional[dict], limit: Optional[int]) -> list[str]:
+        # 게시판 스크래핑 - 키워드/작성자/기간 필터는 페이지마다 적용하고, 남은 수집 가능한 게시글 수를 채우면 중단
+        board_results = self.scrape_board_articles(board_url, max_pages, article_filter=article_filter, limit=limit)
+        return [article["article_url"] for article in board_results]
+
+    @staticmethod
+    def _period_start(article_filter: Optional[dict]) -> Optional[datetime]:
+        if article_filter is None:
+            return None
+        return period_bounds(article_filter.get("period", "all"), article_filter.get("period_start"), article_filter.get("period_end"))[0]
+
+    def _iter_board_checkpointed(self, board: dict, max_pages: int, include_nicks: list[str] | None, exclude_nicks: list[str] | None, article_filter: Optional[dict], limit: Optional[int], checkpoint: RunCheckpoint) -> Iterator[dict]:
+        """체크포인트를 남기며 게시판 하나를 처리 - 이미 읽은 페이지와 CSV에 기록된 게시글은 건너뜀"""
+        menu_id = board["menu_id"]
+        next_page, listed = checkpoint.board_state(menu_id)
+        if not listed:
+            board_results = checkpoint.listed_articles(menu_id)
+            if next_page > 1:
+                print(f"♻️ 게시판 목록 {next_page}페이지부터 재개 (이전에 발견한 게시글 {len(board_results)}개)")
+            if board_results and article_filter is not None:
+                board_results = self._filter_articles(board_results, **article_filter)
+            if next_page <= max_pages:
+                board_results += self.scrape_board_articles(
+                    board["board_url"],
+                    max_pages,
+                    start_page=next_page,
+                    on_page=lambda page, articles: checkpoint.record_page(menu_id, page, articles),
+                    article_filter=article_filter,
+                    limit=None if limit is None else limit - len(board_results)
+                )
+            checkpoint.finish_listing(menu_id, [article["article_url"] for article in board_results])
+        
+        article_urls = checkpoint.pending_urls(menu_id)
+        if limit is not None:
+            article_urls = article_urls[:max(0, limit)]
+        if not article_urls:
+            print(f"♻️ 게시판 {board['menu_name']}: 남은 게시글 없음")
+            return
+        for result in self.iter_multiple_articles(article_urls, include_nicks, exclude_nicks):
+            if "error" in result:
+                checkpoint.record_failed(result["article_url"], result["error"])
+            yield result
+
+    @staticmethod
+    def _collect(results: Iterator[dict], on_result: Optional[Callable[[dict], None]]) -> list[dict]:
+        """제너레이터 결과를 목록으로 모음 (목록을 반환하는 기존 메서드용)"""
+        collected = []
+        for result in results:
+            collected.append(result)
+            if on_result is not None:
+                on_result(result)
+        return collected
+
+    def scrape_cafe(self, cafe_url: str, max_pages: int, all_boards: bool, selected_boards: list[str], include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None, workers: int = 1, on_result: Optional[Callable[[dict], None]] = None, fields: Optional[Iterable[str]] = None) -> list[dict]:
+        """카페 전체 또는 특정 게시판 스크래핑 (게시글이 끝난 순서대로)"""
+        return self._collect(self.iter_cafe(cafe_url, max_pages, all_boards, selected_boards, include_nicks, exclude_nicks, workers, fields=fields), on_result)
+
+    def iter_cafe(self, cafe_url: str, max_pages: int, all_boards: bool, selected_boards: list[str], include_nicks: list[str] | None = None, exclude_nicks: list[str] | None = None, workers: int = 1, fields: Optional[Iterable[str]] = None) -> Iterator[dict]:
+        """scrape_cafe의 제너레이터 버전 - 게시글을 모아 두지 않고 끝나는 대로 하나씩 반환"""
+        self._select_fields(fields)
         # 로그인 상태 확인을 간소화 (이미 게시판 조회에서 확인됨)
         if not self.driver:
             raise Exception("Browser not started")
         
-        start_time = time.time()
-        all_results = []
+        successful = 0
+        failed = 0
         
         # 게시판 목록 조회
         boards = self.get_cafe_boards(cafe_url)
@@ -1309,22 +1875,35 @@ class NaverScraper:
         
         print(f"📊 스크래핑 대상 게시판: {len(target_boards)}개")
         
+        # 워커 프로세스별 Chrome으로 게시판을 나눠 처리
+        if workers > 1:
+            from app.scraper.workers import ProcessCrawler
+            crawler = ProcessCrawler(str(self.sessions_dir), str(self.snapshots_dir), workers, **self._worker_options())
+            for result in crawler.iter_boards(target_boards, max_pages, include_nicks, exclude_nicks):
+                if "error" in result:
+                    failed += 1
+                else:
+                    successful += 1
+                yield result
+            scraping_logger.log_scraping_complete(successful, failed, successful + failed)
+            return
+        
         # 각 게시판 스크래핑
         for i, board in enumerate(target_boards, 1):
             try:
                 print(f"📄 게시판 {i}/{len(target_boards)}: {board['menu_name']}")
                 scraping_logger.log_scraping_progress(i, len(target_boards), board['menu_name'])
                 
-                # 게시판 스크래핑
-                board_results = self.scrape_board_articles(board["board_url"], max_pages)
-                
-                # 각 게시글 상세 스크래핑
-                article_urls = [article["article_url"] for article in board_results]
-                if article_urls:
-                    detailed_results = self.scrape_multiple_articles(article_urls, include_nicks, exclude_nicks)
-                    all_results.extend(detailed_results)
+                board_count = 0
+                for result in self.iter_board(board["board_url"], max_pages, include_nicks, exclude_nicks):
+                    board_count += 1
+                    if "error" in result:
+                        failed += 1
+                    else:
+                        successful += 1
+                    yield result
                 
-                print(f"✅ 게시판 {i}/{len(target_boards)} 완료: {len(article_urls)}개 게시글")
+                print(f"✅ 게시판 {i}/{len(target_boards)} 완료: {board_count}개 게시글")
                 
                 # 게시판 간 지연
                 if i < len(target_boards):
@@ -1337,14 +1916,18 @@ class NaverScraper:
                 continue
         
         # 완료 로깅
-        successful = len([r for r in all_results if "error" not in r])
-        failed = len(all_results) - successful
-        scraping_logger.log_scraping_complete(successful, failed, len(all_results))
-        
-        return all_results
+        scraping_logger.log_scraping_complete(successful, failed, successful + failed)
     
-    def batch_scraping(self, cafe_url: str, max_pages: int, all_boards: bool, selected_boards: list[str], search_keywords: list[str], post_authors: list[str], comment_authors: list[str], max_articles: int, image_processing: str, period: str, delay_between_requests: int) -> list[dict]:
-        """배치 크롤링 - 키워드 검색 및 작성자 필터링 포함"""
+    def batch_scraping(self, cafe_url: str, max_pages: int, all_boards: bool, selected_boards: list[str], search_keywords: list[str], post_authors: list[str], comment_authors: list[str], max_articles: int, image_processing: str, period: str, delay_between_requests: int, workers: int = 1, on_result: Optional[Callable[[dict], None]] = None, checkpoint: Optional[RunCheckpoint] = None, period_start: Optional[str] = None, period_end: Optional[str] = None, fields: Optional[Iterable[str]] = None) -> list[dict]:
+        """배치 크롤링 - 키워드 검색 및 작성자 필터링 포함 (게시글이 끝난 순서대로)"""
+        return self._collect(self.iter_batch(cafe_url, max_pages, all_boards, selected_boards, search_keywords, post_authors, comment_authors, max_articles, image_processing, period, delay_between_requests, workers, checkpoint, period_start, period_end, fields), on_result)
+
+    def iter_batch(self, cafe_url: str, max_pages: int, all_boards: bool, selected_boards: list[str], search_keywords: list[str], post_authors: list[str], comment_authors: list[str], max_articles: int, image_processing: str, period: str, delay_between_requests: int, workers: int = 1, checkpoint: Optional[RunCheckpoint] = None, period_start: Optional[str] = None, period_end: Optional[str] = None, fields: Optional[Iterable[str]] = None) -> Iterator[dict]:
+        """batch_scraping의 제너레이터 버전 - 게시글을 모아 두지 않고 끝나는 대로 하나씩 반환
+
+        checkpoint를 지정하면 게시판별 페이지 위치와 게시글 상태를 기록하고, 같은 체크포인트로 다시 실행하면
+        이미 읽은 페이지와 CSV에 기록된 게시글을 건너뛰고 이어서 수집한다.
+        """
         try:
             # 브라우저 세션 확인 및 재시작
             if not self.driver:
@@ -1376,9 +1959,18 @@ class NaverScraper:
             print(f"❌ 배치 크롤링 초기화 실패: {e}")
             raise
         
-        start_time = time.time()
-        all_results = []
-        collected_count = 0
+        # 이미지 처리 방식 (풀에 반납될 때 reset_state에서 기본값으로 복원)
+        if image_processing not in self.IMAGE_PROCESSING_MODES:
+            raise ValueError(f"Unknown image processing mode: {image_processing}")
+        self.image_processing = image_processing
+        self._select_fields(fields)
+        # 수집 기간 확인 (custom은 period_start/period_end 사용)
+        period_bounds(period, period_start, period_end)
+        
+        collected_count = checkpoint.scraped_count() if checkpoint is not None else 0
+        successful = 0
+        if collected_count:
+            print(f"♻️ 체크포인트에서 재개: 이미 수집한 게시글 {collected_count}개")
         
         # 게시판 목록 조회
         boards = self.get_cafe_boards(cafe_url)
@@ -1399,6 +1991,33 @@ class NaverScraper:
         print(f"👤 게시글 작성자 필터: {post_authors}")
         print(f"💬 댓글 작성자 필터: {comment_authors}")
         
+        article_filter = {
+            "search_keywords": search_keywords,
+            "post_authors": post_authors,
+            "comment_authors": comment_authors,
+            "period": period,
+            "period_start": period_start,
+            "period_end": period_end
+        }
+        
+        # 재개는 단일 프로세스로 진행 (이미 CSV에 기록된 게시글을 건너뛰기 위해)
+        if workers > 1 and collected_count:
+            print("♻️ 멀티 프로세스 배치는 단일 프로세스로 재개합니다")
+            workers = 1
+        
+        # 워커 프로세스별 Chrome으로 게시판을 나눠 처리
+        if workers > 1:
+            from app.scraper.workers import ProcessCrawler
+            if checkpoint is not None:
+                print("⚠️ 멀티 프로세스 크롤링은 페이지 단위 체크포인트를 남기지 않음 - CSV에 기록된 게시글만 기록")
+            crawler = ProcessCrawler(str(self.sessions_dir), str(self.snapshots_dir), workers, **self._worker_options())
+            for result in crawler.iter_boards(target_boards, max_pages, comment_authors, None, article_filter=article_filter, max_articles=max_articles):
+                collected_count += 1
+                successful += "error" not in result
+                yield result
+            scraping_logger.log_scraping_complete(successful, collected_count - successful, collected_count)
+            return
+        
         # 각 게시판 스크래핑
         for i, board in enumerate(target_boards, 1):
             if collected_count >= max_articles:
@@ -1433,34 +2052,28 @@ class NaverScraper:
                 print(f"📄 게시판 {i}/{len(target_boards)}: {board['menu_name']}")
                 scraping_logger.log_scraping_progress(i, len(target_boards), board['menu_name'])
                 
-                # 게시판 스크래핑
-                board_results = self.scrape_board_articles(board["board_url"], max_pages)
-                
-                # 키워드 및 작성자 필터링
-                filtered_articles = self._filter_articles(
-                    board_results, 
-                    search_keywords, 
-                    post_authors, 
-                    comment_authors,
-                    period
-                )
-                
-                # 각 게시글 상세 스크래핑
-                article_urls = [article["article_url"] for article in filtered_articles]
-                if article_urls:
-                    # 남은 수집 가능한 게시글 수만큼만 처리
-                    remaining_articles = max_articles - collected_count
-                    if len(article_urls) > remaining_articles:
-                        article_urls = article_urls[:remaining_articles]
-                    
-                    detailed_results = self.scrape_multiple_articles(article_urls, comment_authors, None)
-                    all_results.extend(detailed_results)
-                    collected_count += len(detailed_results)
+                board_count = 0
+                if checkpoint is not None:
+                    board_articles = self._iter_board_checkpointed(board, max_pages, comment_authors, None, article_filter, max_articles - collected_count, checkpoint)
+                else:
+                    board_articles = self.iter_board(
+                        board["board_url"],
+                        max_pages,
+                        comment_authors,
+                        None,
+                        article_filter=article_filter,
+                        limit=max_articles - collected_count
+                    )
+                for result in board_articles:
+                    board_count += 1
+                    collected_count += 1
+                    successful += "error" not in result
+                    yield result
                 
-                print(f"✅ 게시판 {i}/{len(target_boards)} 완료: {len(article_urls)}개 게시글 (누적: {collected_count}개)")
+                print(f"✅ 게시판 {i}/{len(target_boards)} 완료: {board_count}개 게시글 (누적: {collected_count}개)")
                 
-                # 게시판 간 지연
-                if i < len(target_boards):
+                # 게시판 간 지연 (수집할 게시글 수를 채웠으면 다음 게시판으로 넘어가지 않으므로 생략)
+                if i < len(target_boards) and collected_count < max_articles:
                     time.sleep(delay_between_requests)
                 
             except Exception as e:
@@ -1469,13 +2082,9 @@ class NaverScraper:
                 continue
         
         # 완료 로깅
-        successful = len([r for r in all_results if "error" not in r])
-        failed = len(all_results) - successful
-        scraping_logger.log_scraping_complete(successful, failed, len(all_results))
-        
-        return all_results
+        scraping_logger.log_scraping_complete(successful, collected_count - successful, collected_count)
     
-    def _filter_articles(self, articles: list[dict], search_keywords: list[str], post_authors: list[str], comment_authors: list[str], period: str) -> list[dict]:
+    def _filter_articles(self, articles: list[dict], search_keywords: list[str], post_authors: list[str], comment_authors: list[str], period: str, period_start: Optional[str] = None, period_end: Optional[str] = None) -> list[dict]:
         """게시글 필터링 - 키워드, 작성자, 기간"""
         filtered = []
         
@@ -1483,47 +2092,77 @@ class NaverScraper:
         print(f"🔍 검색 키워드: {search_keywords}")
         print(f"🔍 작성자 필터: {post_authors}")
         
+        # 기간 필터 - 날짜를 알 수 없는 게시글은 통과 (상세 수집 후 확인)
+        start, end = period_bounds(period, period_start, period_end)
+        posted = parse_naver_dates(article.get("posted_at") for article in articles) if start or end else [None] * len(articles)
+        # 키워드/작성자는 컴파일된 매처로 한 번에 검사 (같은 목록은 작업 내내 재사용)
+        keyword_matcher = compile_patterns(search_keywords)
+        author_matcher = compile_patterns(post_authors)
+        
         for i, article in enumerate(articles):
-            title = article.get('title', '').lower()
-            author = article.get('author_nickname', '').lower()
+            author = article.get('author_nickname', '')
             
-            # 키워드 필터링
-            if search_keywords:
-                keyword_match = any(keyword.lower() in title for keyword in search_keywords)
-                if not keyword_match:
+            # 키워드 필터링 (일치한 키워드는 matched_keywords에 기록)
+            if keyword_matcher:
+                matched = keyword_matcher.findall(article.get('title'))
+                if not matched:
                     print(f"❌ 키워드 불일치: {article.get('title', 'N/A')[:30]}...")
                     continue
-                else:
-                    print(f"✅ 키워드 일치: {article.get('title', 'N/A')[:30]}...")
+                article["matched_keywords"] = matched
+                print(f"✅ 키워드 일치 ({', '.join(matched)}): {article.get('title', 'N/A')[:30]}...")
             
             # 작성자 필터링
-            if post_authors:
-                author_match = any(author_nick.lower() in author for author_nick in post_authors)
-                if not author_match:
+            if author_matcher:
+                if not author_matcher.search(author):
                     print(f"❌ 작성자 불일치: {author}")
                     continue
-                else:
-                    print(f"✅ 작성자 일치: {author}")
+                print(f"✅ 작성자 일치: {author}")
             
-            # 기간 필터링 (간단한 구현)
-            if period != "all":
-                # 실제 구현에서는 날짜 파싱 및 비교 필요
-                pass
+            # 기간 필터링
+            if posted[i] is not None and ((start and posted[i] < start) or (end and posted[i] > end)):
+                print(f"❌ 기간 불일치: {article.get('posted_at')}")
+                continue
             
             filtered.append(article)
             print(f"✅ 필터 통과: {len(filtered)}번째 게시글")
-            
-            # 최대 게시글 수 제한 확인
-            if len(filtered) >= 5:  # 5개로 제한
-                print(f"🛑 최대 게시글 수(5개)에 도달하여 필터링 중단")
-                break
         
         print(f"🔍 필터링 완료: {len(filtered)}개 게시글 선택")
         return filtered
 
+    def is_alive(self) -> bool:
+        """브라우저 세션이 살아 있는지 확인 (풀 헬스체크용)"""
+        if not self.driver:
+            return False
+        try:
+            current_url = self.driver.current_url
+            return bool(self.driver.window_handles) and current_url is not None
+        except Exception:
+            return False
+
+    def reset_state(self) -> None:
+        """풀에 반납하기 전 추가 탭/iframe 상태를 정리"""
+        self.image_processing = self._default_image_processing
+        self.dedup = self._default_dedup
+        self.incremental = self._default_incremental
+        self.fields = self._default_fields
+        if not self.driver:
+            return
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                continue
+        self.driver.switch_to.window(handles[0])
+        self.driver.switch_to.default_content()
+
     def close(self) -> None:
         """Close browser and save cookies."""
         if self.driver:
             self._save_cookies()
             self.driver.quit()
+            self.driver = None
+            self._cookies_loaded_mtime = None
+            self._network = None
         print("🔒 Browser closed, cookies saved.")
\ No newline at end of file
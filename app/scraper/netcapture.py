@@ -0,0 +1,183 @@
+"""
+네트워크 캡처 추출 - 게시글 화면(SPA)이 받아오는 JSON 응답을 그대로 읽어 게시글/댓글 구성
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import lxml.html
+from lxml.etree import ParserError
+
+from app.scraper.html_parser import html_to_text
+
+# 게시글 본문 / 댓글 API (apis.naver.com/cafe-web/cafe-articleapi/...)
+_ARTICLE_API = re.compile(r"/cafe-articleapi/v[\d.]+/cafes/[^/]+/articles/(\d+)(?:[?#]|$)")
+_COMMENTS_API = re.compile(r"/cafe-articleapi/v[\d.]+/cafes/[^/]+/articles/(\d+)/comments")
+
+# 게시글 URL 형태별 글 번호 (ArticleRead.nhn?articleid=, /articles/123, /cafename/123)
+_URL_ARTICLE_ID = (
+    re.compile(r"[?&]articleid=(\d+)", re.IGNORECASE),
+    re.compile(r"/articles/(\d+)"),
+    re.compile(r"/(\d+)(?:[?#]|$)"),
+)
+
+# 캡처해 둘 최대 게시글 수 (가져가지 않은 응답이 쌓이지 않도록)
+_MAX_TRACKED = 200
+
+
+def article_key(url: str) -> Optional[str]:
+    """게시글 URL에서 숫자 글 번호를 추출 (API 응답과 매칭하는 키)"""
+    for pattern in _URL_ARTICLE_ID:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _format_timestamp(value) -> Optional[str]:
+    """API의 epoch 밀리초를 화면 표기(YYYY.MM.DD. HH:MM)로 변환"""
+    if isinstance(value, (int, float)) and value > 0:
+        return time.strftime("%Y.%m.%d. %H:%M", time.localtime(value / 1000))
+    if isinstance(value, str) and value:
+        return value
+    return None
+
+
+def _image_sources(content_html: str, max_images: int) -> list:
+    if not content_html:
+        return []
+    try:
+        root = lxml.html.fragment_fromstring(content_html, create_parent="div")
+    except (ParserError, ValueError):
+        return []
+    return [img.get("src") for img in root.iter("img")][:max_images]
+
+
+def _comment_items(payload: Optional[dict]) -> list:
+    if not isinstance(payload, dict):
+        return []
+    result = payload.get("result", payload)
+    comments = result.get("comments", result)
+    items = comments.get("items") if isinstance(comments, dict) else None
+    return items or []
+
+
+def raw_from_api(article_payload: dict, comments_payload: Optional[dict] = None, max_images: int = 10, comments: bool = True, content: bool = True) -> dict:
+    """Build the extractor's raw dict from the article (and optional comments) API JSON.
+
+    JS 추출기와 같이 comments/content가 False이거나 max_images가 0이면 그 항목은 만들지 않는다.
+    """
+    result = article_payload.get("result", article_payload)
+    article = result.get("article") or {}
+    writer = article.get("writer") or {}
+    content_html = (article.get("contentHtml") or "").strip()
+
+    # 댓글 API를 따로 받았으면 그쪽을, 아니면 게시글 응답에 포함된 댓글을 사용
+    items = (_comment_items(comments_payload) or _comment_items(article_payload)) if comments else []
+    comment_items = [
+        {
+            "text": item.get("content"),
+            "author": (item.get("writer") or {}).get("nick"),
+            "date": _format_timestamp(item.get("updateDate") or item.get("writeDate")),
+        }
+        for item in items
+        if not item.get("isDeleted")
+    ]
+
+    return {
+        "title": (article.get("subject") or "").strip() or None,
+        "author": writer.get("nick"),
+        "content_text": (html_to_text(content_html) or None) if content else None,
+        "content_html": (content_html or None) if content else None,
+        "posted_at": _format_timestamp(article.get("writeDate")),
+        "comments": comment_items,
+        "image_sources": _image_sources(content_html, max_images) if max_images > 0 else [],
+    }
+
+
+class NetworkCapture:
+    """Track article/comment API responses from Chrome's performance log.
+
+    performance 로그는 읽을 때마다 비워지므로 이 객체가 게시글 번호별로 요청 ID를 모아 두고,
+    응답 본문은 추출할 때 Network.getResponseBody로 가져온다.
+    """
+
+    def __init__(self, driver) -> None:
+        self.driver = driver
+        self._pending: dict[str, tuple[str, str]] = {}
+        self._finished: "OrderedDict[str, dict[str, str]]" = OrderedDict()
+
+    def poll(self) -> None:
+        """새로 쌓인 performance 로그를 읽어 게시글/댓글 API 응답을 기록"""
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return
+
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params") or {}
+
+            if method == "Network.responseReceived":
+                # CORS preflight 등은 제외하고 실제 데이터 요청만 추적
+                if params.get("type") not in ("XHR", "Fetch"):
+                    continue
+                url = (params.get("response") or {}).get("url", "")
+                match = _COMMENTS_API.search(url)
+                kind = "comments"
+                if not match:
+                    match = _ARTICLE_API.search(url)
+                    kind = "article"
+                if match:
+                    self._pending[params.get("requestId")] = (match.group(1), kind)
+            elif method == "Network.loadingFinished":
+                tracked = self._pending.pop(params.get("requestId"), None)
+                if tracked:
+                    article_id, kind = tracked
+                    self._finished.setdefault(article_id, {})[kind] = params.get("requestId")
+                    self._finished.move_to_end(article_id)
+                    while len(self._finished) > _MAX_TRACKED:
+                        self._finished.popitem(last=False)
+            elif method == "Network.loadingFailed":
+                self._pending.pop(params.get("requestId"), None)
+
+    def has_article(self, article_id: Optional[str]) -> bool:
+        """게시글 API 응답 수신이 끝났는지 (페이지 준비 신호로 사용)"""
+        if not article_id:
+            return False
+        self.poll()
+        return "article" in self._finished.get(article_id, {})
+
+    def take(self, article_id: Optional[str], max_images: int = 10, comments: bool = True, content: bool = True) -> Optional[dict]:
+        """캡처된 응답으로 raw dict 생성 (응답이 없거나 본문을 읽지 못하면 None)"""
+        if not self.has_article(article_id):
+            return None
+        request_ids = self._finished.pop(article_id)
+        article_payload = self._body(request_ids["article"])
+        if not isinstance(article_payload, dict):
+            return None
+        comments_payload = self._body(request_ids["comments"]) if comments and "comments" in request_ids else None
+        return raw_from_api(article_payload, comments_payload, max_images, comments, content)
+
+    def discard(self, article_id: Optional[str]) -> None:
+        self._finished.pop(article_id, None)
+
+    def _body(self, request_id: str):
+        try:
+            response = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            body = response.get("body", "")
+            if response.get("base64Encoded"):
+                body = base64.b64decode(body).decode("utf-8")
+            return json.loads(body)
+        except Exception:
+            return None
@@ -0,0 +1,193 @@
+"""
+브라우저 풀 - 로그인된 NaverScraper 인스턴스를 엔드포인트 간에 재사용
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from app.scraper.naver import NaverScraper
+
+
+class PoolExhausted(Exception):
+    """체크아웃 대기 시간 안에 사용 가능한 브라우저가 없을 때"""
+
+
+class BrowserPool:
+    """Pool of long-lived, logged-in NaverScraper instances with checkout/checkin."""
+
+    def __init__(self, factory: Callable[[], "NaverScraper"], size: int = 2, checkout_timeout: float = 300.0, max_uses: int = 200) -> None:
+        self.factory = factory
+        self.size = max(1, size)
+        self.checkout_timeout = checkout_timeout
+        self.max_uses = max_uses
+
+        self._idle: list["NaverScraper"] = []
+        self._uses: dict[int, int] = {}
+        self._created = 0
+        self._in_use = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def start(self, prewarm: int = 1) -> None:
+        """Warm up `prewarm` browsers in a background thread so app startup is not blocked."""
+        prewarm = min(max(0, prewarm), self.size)
+        if prewarm == 0:
+            return
+
+        def _warm() -> None:
+            for _ in range(prewarm):
+                with self._cond:
+                    if self._closed or self._created >= self.size:
+                        return
+                    self._created += 1
+                try:
+                    scraper = self._create()
+                except Exception as e:
+                    print(f"⚠️ 브라우저 풀 예열 실패: {e}")
+                    with self._cond:
+                        self._created -= 1
+                        self._cond.notify()
+                    return
+                self.checkin(scraper, _fresh=True)
+
+        threading.Thread(target=_warm, name="browser-pool-prewarm", daemon=True).start()
+
+    def checkout(self, timeout: Optional[float] = None) -> "NaverScraper":
+        """Borrow a healthy browser, creating one if the pool is below its size."""
+        deadline = time.monotonic() + (self.checkout_timeout if timeout is None else timeout)
+
+        while True:
+            scraper = None
+            create = False
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise PoolExhausted("Browser pool is shut down")
+                    if self._idle:
+                        scraper = self._idle.pop()
+                        break
+                    if self._created < self.size:
+                        self._created += 1
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolExhausted(f"No browser available within timeout (size={self.size})")
+                    self._cond.wait(remaining)
+                self._in_use += 1
+
+            if create:
+                try:
+                    scraper = self._create()
+                except Exception:
+                    with self._cond:
+                        self._created -= 1
+                        self._in_use -= 1
+                        self._cond.notify()
+                    raise
+                return scraper
+
+            # 유휴 인스턴스 헬스체크 - 죽은 브라우저는 폐기하고 다시 시도
+            if self._is_healthy(scraper):
+                scraper._load_cookies()
+                return scraper
+
+            print("⚠️ 풀의 브라우저 세션이 끊어짐 - 폐기 후 재시도")
+            with self._cond:
+                self._in_use -= 1
+            self._discard(scraper)
+
+    def checkin(self, scraper: "NaverScraper", discard: bool = False, _fresh: bool = False) -> None:
+        """Return a borrowed browser; broken or worn-out instances are discarded."""
+        key = id(scraper)
+        with self._cond:
+            if not _fresh:
+                self._in_use -= 1
+            uses = self._uses.get(key, 0) + (0 if _fresh else 1)
+            self._uses[key] = uses
+            closed = self._closed
+
+        if discard or closed or uses >= self.max_uses or not self._is_healthy(scraper):
+            self._discard(scraper)
+            return
+
+        try:
+            scraper.reset_state()
+        except Exception as e:
+            print(f"⚠️ 브라우저 상태 초기화 실패: {e}")
+            self._discard(scraper)
+            return
+
+        with self._cond:
+            self._idle.append(scraper)
+            self._cond.notify()
+
+    @contextmanager
+    def borrow(self, timeout: Optional[float] = None) -> Iterator["NaverScraper"]:
+        """`with pool.borrow() as scraper:` - checkin happens even when the body raises."""
+        scraper = self.checkout(timeout)
+        failed = False
+        try:
+            yield scraper
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            # 예외가 났더라도 브라우저가 살아 있으면 재사용
+            self.checkin(scraper, discard=failed and not self._is_healthy(scraper))
+
+    def status(self) -> dict:
+        with self._cond:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "closed": self._closed,
+            }
+
+    def shutdown(self) -> None:
+        """Close every idle browser; browsers still in use are closed when checked in."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for scraper in idle:
+            self._discard(scraper)
+
+    def _create(self) -> "NaverScraper":
+        print("🔄 브라우저 풀: 새 브라우저 생성 중...")
+        scraper = self.factory()
+        try:
+            scraper.start_browser()
+            scraper._load_cookies()
+        except Exception:
+            try:
+                scraper.close()
+            except Exception:
+                pass
+            raise
+        self._uses[id(scraper)] = 0
+        return scraper
+
+    def _discard(self, scraper: "NaverScraper") -> None:
+        with self._cond:
+            self._created -= 1
+            self._uses.pop(id(scraper), None)
+            self._cond.notify()
+        try:
+            scraper.close()
+        except Exception as e:
+            print(f"⚠️ 브라우저 종료 실패: {e}")
+
+    @staticmethod
+    def _is_healthy(scraper: "NaverScraper") -> bool:
+        try:
+            return scraper.is_alive()
+        except Exception:
+            return False
@@ -0,0 +1,190 @@
+"""
+네이버 카페 페이지 셀렉터 - Selenium, 브라우저 내 스크립트, HTML 파서가 공통으로 사용
+"""
+
+# 게시글 제목
+TITLE_SELECTORS = [
+    # 1. 실제 발견된 셀렉터들 (우선순위)
+    "h3.title",
+    "h2.title", 
+    "h1.title",
+    ".title",
+    # 2. 네이버 카페 최신 구조 (2024년 기준)
+    ".se-title-text",
+    ".se-fs-",
+    ".se-component-content h1",
+    ".se-component-content h2", 
+    ".se-component-content h3",
+    ".se-text-paragraph",
+    # 3. 게시글 본문 영역 내 제목
+    ".article_content h1",
+    ".article_content h2",
+    ".article_content h3",
+    ".post_content h1",
+    ".post_content h2",
+    ".post_content h3",
+    # 4. 일반적인 제목 셀렉터
+    ".article_title",
+    ".post_title",
+    ".content_title",
+    ".view_title",
+    # 5. 네이버 카페 특화 셀렉터
+    ".cafe-article-title",
+    ".article-view-title",
+    ".post-view-title",
+    # 6. 최신 네이버 카페 구조
+    ".Layout_content__pUOz1 h1",
+    ".Layout_content__pUOz1 h2",
+    ".Layout_content__pUOz1 h3",
+    # 7. 완전히 새로운 접근 - 모든 h 태그에서 카페 제목 제외
+    "h1:not([class*='Layout_cafe_name']):not([class*='Header'])",
+    "h2:not([class*='Layout_cafe_name']):not([class*='Header'])",
+    "h3:not([class*='Layout_cafe_name']):not([class*='Header'])",
+    # 8. 게시글 제목이 있을 수 있는 특정 영역들
+    "[class*='article'] h1",
+    "[class*='article'] h2", 
+    "[class*='article'] h3",
+    "[class*='post'] h1",
+    "[class*='post'] h2",
+    "[class*='post'] h3",
+    "[class*='content'] h1",
+    "[class*='content'] h2",
+    "[class*='content'] h3"
+]
+
+# 게시글 작성자
+AUTHOR_SELECTORS = [
+    # 최신 네이버 카페 구조
+    ".nick",
+    ".nickname", 
+    ".author",
+    ".writer",
+    ".user_nick",
+    ".user_name",
+    ".member_nick",
+    ".member_name",
+    # 네이버 카페 특화 셀렉터
+    ".cafe-nick",
+    ".cafe-author",
+    ".article-author",
+    ".post-author",
+    # 일반적인 셀렉터
+    "[data-testid='author']",
+    ".se-fs-",
+    ".nickname_text",
+    ".author_name",
+    ".writer_name",
+    "[class*='nick']",
+    "[class*='author']",
+    "[class*='writer']",
+    ".user_info .nick",
+    ".user_info .nickname",
+    ".article_info .nick",
+    ".article_info .nickname",
+    # 추가 시도
+    "span[class*='nick']",
+    "div[class*='author']",
+    "div[class*='writer']"
+]
+
+# 게시글 본문
+CONTENT_SELECTORS = [
+    # 1. 실제 발견된 셀렉터들 (우선순위)
+    ".content",
+    # 2. 네이버 에디터 최신 구조
+    ".se-main-container",
+    ".se-component-content",
+    ".se-text-paragraph",
+    ".se-text",
+    ".se-component",
+    # 3. 게시글 본문 영역
+    ".article_content",
+    ".post_content",
+    ".article_text",
+    ".board_text",
+    ".article_body",
+    # 4. 네이버 카페 특화 셀렉터
+    ".cafe-content",
+    ".cafe-article-content",
+    ".article-view-content",
+    ".view-content",
+    ".content-view",
+    # 5. 최신 네이버 카페 구조
+    ".Layout_content__pUOz1",
+    ".Layout_content__pUOz1 .se-main-container",
+    ".Layout_content__pUOz1 .se-component-content",
+    # 6. 일반적인 셀렉터
+    "[data-testid='article-content']",
+    "[class*='content']",
+    "[class*='Content']",
+    "[class*='text']",
+    "[class*='Text']",
+    # 7. se- 관련 모든 클래스
+    "div[class*='se-']",
+    "p[class*='se-']",
+    "span[class*='se-']",
+    # 8. 게시글 본문이 있을 수 있는 영역들
+    "div[class*='article']",
+    "div[class*='post']",
+    "div[class*='content']"
+]
+
+# 게시글 작성일
+DATE_SELECTORS = [
+    ".date",
+    ".time", 
+    ".created_at",
+    "[data-testid='created-date']",
+    ".article_date",
+    ".post_date",
+    ".board_date",
+    "[class*='date']",
+    "[class*='Date']",
+    "[class*='time']",
+    "[class*='Time']",
+    ".article_info .date",
+    ".article_info .time",
+    ".user_info .date",
+    ".user_info .time"
+]
+
+# 댓글 목록
+COMMENT_SELECTORS = [
+    # 1. 실제 발견된 셀렉터들 (우선순위)
+    ".comment_area",
+    ".LinkComment",
+    # 2. 최신 네이버 카페 구조
+    ".comment",
+    ".reply", 
+    ".comment_item",
+    ".reply_item",
+    ".cafe-comment",
+    ".cafe-reply",
+    ".article-comment",
+    ".article-reply",
+    # 3. 네이버 카페 특화 셀렉터
+    ".comment-list .comment",
+    ".comment-list .reply",
+    ".reply-list .comment",
+    ".reply-list .reply",
+    ".comment-area .comment",
+    ".comment-area .reply",
+    ".reply-area .comment",
+    ".reply-area .reply",
+    # 4. 일반적인 셀렉터
+    "[data-testid='comment']",
+    "[class*='comment']",
+    "[class*='Comment']",
+    "[class*='reply']",
+    "[class*='Reply']",
+    # 5. 추가 시도
+    "div[class*='comment']",
+    "div[class*='reply']",
+    "li[class*='comment']",
+    "li[class*='reply']"
+]
+
+# 댓글 요소 내부 필드
+COMMENT_TEXT_SELECTOR = ".comment_text, .reply_text, .content"
+COMMENT_AUTHOR_SELECTOR = ".nick, .nickname, .author"
+COMMENT_DATE_SELECTOR = ".date, .time"
@@ -0,0 +1,96 @@
+"""
+이미지 후처리 - 긴 변 축소, WebP/JPEG 재인코딩, 메타데이터 제거 (프로세스 풀에서 실행)
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+_FORMATS = {
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg"),
+}
+
+
+@dataclass(frozen=True)
+class TranscodeSettings:
+    """format: webp 또는 jpeg, max_edge: 긴 변 최대 픽셀, quality: 인코딩 품질(1-95)"""
+    format: str = "webp"
+    max_edge: int = 1600
+    quality: int = 80
+
+    @classmethod
+    def from_env(cls) -> Optional["TranscodeSettings"]:
+        """CAFESCRAPER_IMAGE_TRANSCODE가 webp/jpeg일 때만 설정 반환 (기본: 사용 안 함)"""
+        fmt = os.getenv("CAFESCRAPER_IMAGE_TRANSCODE", "off").lower()
+        if fmt not in _FORMATS:
+            return None
+        return cls(
+            format=fmt,
+            max_edge=int(os.getenv("CAFESCRAPER_IMAGE_MAX_EDGE", "1600")),
+            quality=int(os.getenv("CAFESCRAPER_IMAGE_QUALITY", "80")),
+        )
+
+
+def transcode_image(data: bytes, settings: TranscodeSettings) -> Optional[tuple[bytes, str]]:
+    """Downscale and re-encode one image; None means keep the original bytes.
+
+    애니메이션 이미지, 읽을 수 없는 이미지, 재인코딩 결과가 원본보다 큰 경우는 원본을 유지한다.
+    """
+    pil_format, mime = _FORMATS[settings.format]
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if getattr(image, "is_animated", False):
+                return None
+            # EXIF 회전 정보를 픽셀에 반영한 뒤 메타데이터 없이 저장
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((settings.max_edge, settings.max_edge), Image.LANCZOS)
+
+            if pil_format == "JPEG" and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            elif pil_format == "WEBP" and image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+
+            output = io.BytesIO()
+            image.save(output, pil_format, quality=settings.quality, optimize=True)
+    except (UnidentifiedImageError, OSError, ValueError):
+        return None
+
+    encoded = output.getvalue()
+    if len(encoded) >= len(data):
+        return None
+    return encoded, mime
+
+
+# 변환 전용 프로세스 풀 (처음 사용할 때 생성)
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_transcode_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = max_workers or int(os.getenv("CAFESCRAPER_TRANSCODE_WORKERS", "0")) or max(1, (os.cpu_count() or 2) - 1)
+            _pool = ProcessPoolExecutor(max_workers=workers)
+        return _pool
+
+
+def submit_transcode(data: bytes, settings: TranscodeSettings) -> Future:
+    """변환 작업을 프로세스 풀에 제출 - 다운로드 스레드는 GIL을 잡지 않고 결과만 기다림"""
+    return get_transcode_pool().submit(transcode_image, data, settings)
+
+
+def shutdown_transcode_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
@@ -0,0 +1,210 @@
+"""
+페이지 준비 상태 대기 - 고정 sleep 대신 실제 렌더링 완료 시점을 감지
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+# 게시글 본문이 렌더링되는 iframe 이름 (구형 카페 레이아웃)
+CONTENT_FRAME_NAME = "cafe_main"
+
+
+@dataclass(frozen=True)
+class ReadinessProfile:
+    """페이지 종류별 준비 조건
+
+    required: 각 그룹에서 셀렉터가 하나 이상 존재해야 준비 완료로 판단
+    stable_ms: DOM 크기/텍스트 길이가 이 시간 동안 변하지 않아야 함
+    deadline: 조건을 만족하지 못해도 이 시간이 지나면 대기 종료
+    """
+    name: str
+    required: tuple[tuple[str, ...], ...]
+    frame_name: Optional[str] = CONTENT_FRAME_NAME
+    stable_ms: int = 400
+    poll_interval: float = 0.15
+    deadline: float = 20.0
+
+
+@dataclass
+class ReadyResult:
+    """대기 결과 - 준비 여부와 측정된 준비 시간"""
+    profile: str
+    ready: bool
+    elapsed: float
+    reason: str
+
+
+PROFILES: dict[str, ReadinessProfile] = {
+    "article": ReadinessProfile(
+        name="article",
+        required=(
+            # 제목
+            (".title_text", "h3.title", ".se-title-text", ".ArticleTitle", ".article_title", ".tit-box .title"),
+            # 본문
+            (".se-main-container", ".ContentRenderer", ".article_viewer", "#tbody", ".article_container", ".content"),
+        ),
+        deadline=25.0,
+    ),
+    "board": ReadinessProfile(
+        name="board",
+        required=(
+            ("a[href*='ArticleRead']", "a[href*='/articles/']", ".article-board a.article", ".board_list a"),
+        ),
+        deadline=15.0,
+    ),
+    "menu": ReadinessProfile(
+        name="menu",
+        required=(
+            ("a[href*='menuid=']", "a[href*='BoardList.nhn']", "#cafe-menu a", ".cafe_menu a"),
+        ),
+        frame_name=None,
+        deadline=15.0,
+    ),
+}
+
+# 한 번의 execute_script 호출로 iframe 상태, 셀렉터 존재 여부, DOM 시그니처를 함께 조회
+_PROBE_JS = """
+const frameName = arguments[0];
+const groups = arguments[1];
+const docs = [document];
+let frame = 'none';
+if (frameName) {
+    const el = document.querySelector('iframe[name="' + frameName + '"], iframe#' + frameName);
+    if (el) {
+        try {
+            const fdoc = el.contentDocument;
+            if (!fdoc || fdoc.readyState === 'loading' || fdoc.URL === 'about:blank') {
+                frame = 'loading';
+            } else {
+                frame = 'ready';
+                docs.push(fdoc);
+            }
+        } catch (e) {
+            frame = 'cross-origin';
+        }
+    }
+}
+// 탭에서 새 이동을 시작하면 이전 문서에 표시를 남겨 둠 - 새 문서가 올라오기 전에는 준비로 보지 않음
+const stale = window.__cafeScraperStale === true;
+const has = (sel) => docs.some((d) => {
+    try { return d.querySelector(sel) !== null; } catch (e) { return false; }
+});
+let elements = 0;
+let textLength = 0;
+for (const d of docs) {
+    elements += d.getElementsByTagName('*').length;
+    textLength += d.body ? d.body.textContent.length : 0;
+}
+return {
+    readyState: document.readyState,
+    stale: stale,
+    frame: frame,
+    matched: groups.map((group) => group.some(has)),
+    signature: elements + ':' + textLength
+};
+"""
+
+
+def probe_readiness(driver, profile: ReadinessProfile) -> dict:
+    """현재 페이지 상태를 한 번 조회 (대기 없음)"""
+    return driver.execute_script(_PROBE_JS, profile.frame_name, [list(group) for group in profile.required])
+
+
+# 현재 문서를 이전 문서로 표시한 뒤 이동 (응답을 기다리지 않음)
+NAVIGATE_JS = "window.__cafeScraperStale = true; window.location.href = arguments[0];"
+
+
+class ReadinessTracker:
+    """한 페이지(탭)의 준비 상태를 probe 결과로 누적 판단"""
+
+    def __init__(self, profile: ReadinessProfile, deadline: Optional[float] = None) -> None:
+        self.profile = profile
+        self.start = time.monotonic()
+        self.end = self.start + (deadline if deadline is not None else profile.deadline)
+        self.last_signature = None
+        self.stable_since = self.start
+        self.reason = "no probe"
+
+    def update(self, probe: Optional[dict], now: Optional[float] = None) -> Optional[ReadyResult]:
+        """probe 결과를 반영하고, 준비 완료 또는 데드라인이면 결과를 반환 (아니면 None)"""
+        now = time.monotonic() if now is None else now
+
+        if probe:
+            signature = probe.get("signature")
+            if signature != self.last_signature:
+                self.last_signature = signature
+                self.stable_since = now
+
+            missing = [i for i, ok in enumerate(probe.get("matched", [])) if not ok]
+            if probe.get("stale"):
+                self.reason = "previous document still shown"
+            elif probe.get("frame") == "loading":
+                self.reason = f"{CONTENT_FRAME_NAME} iframe loading"
+            elif missing:
+                self.reason = f"selector group {missing} missing"
+            elif (now - self.stable_since) * 1000 < self.profile.stable_ms:
+                self.reason = "DOM still changing"
+            else:
+                return ReadyResult(self.profile.name, True, now - self.start, "ready")
+
+        if now >= self.end:
+            return ReadyResult(self.profile.name, False, now - self.start, self.reason)
+        return None
+
+    def signal(self, now: Optional[float] = None) -> ReadyResult:
+        """외부 신호(네트워크 응답 등)로 준비 완료 처리"""
+        now = time.monotonic() if now is None else now
+        return ReadyResult(self.profile.name, True, now - self.start, "signal")
+
+
+def wait_until_ready(driver, profile: ReadinessProfile | str, deadline: Optional[float] = None, extra_check: Optional[Callable[[], bool]] = None) -> ReadyResult:
+    """Poll until the profile's conditions hold and the DOM is stable, or the deadline passes.
+
+    extra_check가 True를 반환하면 DOM 조건과 무관하게 즉시 준비 완료로 처리한다.
+    """
+    if isinstance(profile, str):
+        profile = PROFILES[profile]
+
+    # 이전 작업에서 iframe 안으로 전환된 상태일 수 있으므로 최상위 문서 기준으로 조회
+    try:
+        driver.switch_to.default_content()
+    except Exception:
+        pass
+
+    tracker = ReadinessTracker(profile, deadline)
+
+    while True:
+        if extra_check is not None:
+            try:
+                if extra_check():
+                    return tracker.signal()
+            except Exception:
+                pass
+
+        try:
+            probe = probe_readiness(driver, profile)
+        except Exception as e:
+            probe = None
+            tracker.reason = f"probe failed: {type(e).__name__}"
+
+        result = tracker.update(probe)
+        if result is not None:
+            return result
+
+        time.sleep(profile.poll_interval)
+
+
+def enter_content_frame(driver, frame_name: str = CONTENT_FRAME_NAME) -> bool:
+    """본문 iframe이 있으면 전환하고 True 반환 (없으면 최상위 문서 유지)"""
+    try:
+        driver.switch_to.default_content()
+        frames = driver.find_elements("css selector", f"iframe[name='{frame_name}'], iframe#{frame_name}")
+        if frames:
+            driver.switch_to.frame(frames[0])
+            return True
+    except Exception:
+        pass
+    return False
@@ -0,0 +1,155 @@
+"""
+멀티 프로세스 크롤러 - 워커 프로세스마다 독립된 Chrome(프로필 디렉토리)으로 게시판을 나눠 처리
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+from typing import Callable, Iterator, Optional
+
+
+class PolitenessLimiter:
+    """Process-shared minimum interval between navigations to the same site.
+
+    모든 워커가 공유 메모리의 '다음 요청 가능 시각'을 함께 보므로,
+    워커 수를 늘려도 사이트 전체에 대한 요청 간격은 min_interval 이상으로 유지된다.
+    """
+
+    def __init__(self, min_interval: float, ctx=None) -> None:
+        ctx = ctx or multiprocessing.get_context("spawn")
+        self.min_interval = max(0.0, min_interval)
+        self._next_slot = ctx.Value("d", 0.0)
+
+    def wait(self) -> None:
+        if self.min_interval <= 0:
+            return
+        # 슬롯만 예약하고 잠금 밖에서 대기 - 다른 워커는 다음 슬롯을 바로 예약할 수 있음
+        with self._next_slot.get_lock():
+            now = time.time()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+# 워커 프로세스 전역 상태 (_init_worker에서 한 번 설정)
+_scraper = None
+
+
+def _init_worker(sessions_dir: str, snapshots_dir: str, limiter: PolitenessLimiter, scraper_options: dict) -> None:
+    """워커 프로세스 초기화 - 전용 프로필 디렉토리를 가진 스크래퍼 생성 (브라우저는 첫 작업 때 시작)"""
+    global _scraper
+    from app.scraper.naver import NaverScraper
+
+    profile_dir = tempfile.mkdtemp(prefix="cafescraper_worker_")
+    _scraper = NaverScraper(sessions_dir, snapshots_dir, profile_dir=profile_dir, **scraper_options)
+    _scraper.throttle = limiter.wait
+
+    def _cleanup(scraper=_scraper, path=profile_dir) -> None:
+        try:
+            scraper.close()
+        except Exception:
+            pass
+        shutil.rmtree(path, ignore_errors=True)
+
+    # 워커 종료 시 Chrome과 임시 프로필 정리
+    Finalize(_scraper, _cleanup, exitpriority=10)
+
+
+def _crawl_board_task(board: dict, max_pages: int, include_nicks: Optional[list[str]], exclude_nicks: Optional[list[str]], article_filter: Optional[dict], limit: Optional[int]) -> list[dict]:
+    """워커에서 게시판 하나를 처리 - 공유 쿠키 파일로 로그인 상태를 맞춘 뒤 크롤링"""
+    if not _scraper.is_alive():
+        _scraper.start_browser()
+    _scraper._load_cookies()
+
+    print(f"📄 [worker {os.getpid()}] 게시판: {board.get('menu_name')}")
+    return _scraper.crawl_board(board["board_url"], max_pages, include_nicks, exclude_nicks, article_filter=article_filter, limit=limit)
+
+
+class ProcessCrawler:
+    """Shard boards across worker processes and merge their results in board order."""
+
+    def __init__(self, sessions_dir: str, snapshots_dir: str, workers: int, min_interval: Optional[float] = None, **scraper_options) -> None:
+        """scraper_options는 워커마다 만드는 NaverScraper의 생성자 인자 (extraction_mode, lean 등)"""
+        self.sessions_dir = sessions_dir
+        self.snapshots_dir = snapshots_dir
+        self.workers = max(1, workers)
+        self.scraper_options = scraper_options
+        self.min_interval = float(os.getenv("CAFESCRAPER_MIN_REQUEST_INTERVAL", "1.0")) if min_interval is None else min_interval
+
+    def crawl_boards(self, boards: list[dict], max_pages: int, include_nicks: Optional[list[str]] = None, exclude_nicks: Optional[list[str]] = None, article_filter: Optional[dict] = None, max_articles: Optional[int] = None, on_result: Optional[Callable[[dict], None]] = None) -> list[dict]:
+        """on_result는 게시판 결과가 워커에서 돌아올 때마다 게시글별로 호출 (max_articles를 넘는 게시글은 제외)"""
+        results: dict[int, list[dict]] = {}
+        collected = 0
+        for index, articles in self._iter_board_results(boards, max_pages, include_nicks, exclude_nicks, article_filter, max_articles):
+            results[index] = articles
+            if on_result is not None:
+                emit = articles if max_articles is None else articles[:max(0, max_articles - collected)]
+                for article in emit:
+                    on_result(article)
+            collected += len(articles)
+
+        merged = [article for index in sorted(results) for article in results[index]]
+        if max_articles is not None:
+            merged = merged[:max_articles]
+        return merged
+
+    def iter_boards(self, boards: list[dict], max_pages: int, include_nicks: Optional[list[str]] = None, exclude_nicks: Optional[list[str]] = None, article_filter: Optional[dict] = None, max_articles: Optional[int] = None) -> Iterator[dict]:
+        """crawl_boards의 제너레이터 버전 - 게시판 결과가 돌아오는 순서대로 게시글을 반환"""
+        remaining = max_articles
+        for _, articles in self._iter_board_results(boards, max_pages, include_nicks, exclude_nicks, article_filter, max_articles):
+            if remaining is not None:
+                articles = articles[:max(0, remaining)]
+                remaining -= len(articles)
+            yield from articles
+
+    def _iter_board_results(self, boards: list[dict], max_pages: int, include_nicks: Optional[list[str]], exclude_nicks: Optional[list[str]], article_filter: Optional[dict], max_articles: Optional[int]) -> Iterator[tuple[int, list[dict]]]:
+        """(게시판 인덱스, 게시글 목록)을 워커가 끝내는 순서대로 반환"""
+        if not boards:
+            return
+
+        # Chrome/Selenium 상태가 fork로 복제되지 않도록 spawn 사용
+        ctx = multiprocessing.get_context("spawn")
+        limiter = PolitenessLimiter(self.min_interval, ctx)
+        workers = min(self.workers, len(boards))
+        print(f"🧵 {workers}개 워커 프로세스로 {len(boards)}개 게시판 처리 (요청 간격 {self.min_interval}초)")
+
+        collected = 0
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self.sessions_dir, self.snapshots_dir, limiter, self.scraper_options),
+        ) as executor:
+            # 게시판 단위로 제출 - 먼저 끝난 워커가 다음 게시판을 가져가므로 부하가 자동으로 분산됨
+            futures = {
+                executor.submit(_crawl_board_task, board, max_pages, include_nicks, exclude_nicks, article_filter, max_articles): index
+                for index, board in enumerate(boards)
+            }
+            try:
+                for future in as_completed(futures):
+                    index = futures[future]
+                    board = boards[index]
+                    try:
+                        articles = future.result()
+                    except Exception as e:
+                        print(f"❌ 게시판 {board.get('menu_name')} 처리 실패: {e}")
+                        continue
+
+                    collected += len(articles)
+                    print(f"✅ 게시판 {board.get('menu_name')} 완료: {len(articles)}개 게시글 (누적: {collected}개)")
+                    yield index, articles
+                    if max_articles is not None and collected >= max_articles:
+                        print(f"📊 최대 게시글 수 도달: {max_articles}개 - 남은 게시판 취소")
+                        break
+            finally:
+                # 최대 수에 도달했거나 호출자가 중단하면 아직 시작하지 않은 게시판은 취소
+                for pending in futures:
+                    pending.cancel()
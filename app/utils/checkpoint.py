@@ -0,0 +1,232 @@
+"""
+크롤링 체크포인트 - 배치 크롤링 진행 상황을 SQLite에 기록하고 중단된 지점부터 재개
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    spec TEXT NOT NULL,
+    status TEXT NOT NULL,
+    csv_path TEXT,
+    csv_offset INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS boards (
+    run_id TEXT NOT NULL,
+    menu_id TEXT NOT NULL,
+    next_page INTEGER NOT NULL DEFAULT 1,
+    listed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, menu_id)
+);
+CREATE TABLE IF NOT EXISTS articles (
+    run_id TEXT NOT NULL,
+    article_url TEXT NOT NULL,
+    menu_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    meta TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (run_id, article_url)
+);
+CREATE INDEX IF NOT EXISTS articles_board ON articles (run_id, menu_id, status);
+"""
+
+# 게시글 상태: listed(목록에서 발견) → pending(필터 통과, 상세 수집 대상) → scraped(CSV에 기록됨) / failed
+ARTICLE_STATUSES = ("listed", "pending", "scraped", "failed")
+
+
+class CheckpointStore:
+    """SQLite file holding every batch run's board cursors, article states and CSV offset."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # 스크래퍼 스레드와 CSV 쓰기 스레드가 함께 쓰므로 연결 하나를 잠금으로 보호
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def execute(self, sql: str, params=()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def transaction(self, statements: list[tuple[str, tuple]]) -> None:
+        """여러 문장을 한 트랜잭션으로 실행 (중간에 프로세스가 죽어도 반쯤 기록되지 않음)"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for sql, params in statements:
+                    self._conn.execute(sql, params)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def create_run(self, run_id: str, kind: str, spec: dict) -> "RunCheckpoint":
+        now = time.time()
+        self.execute(
+            "INSERT INTO runs (run_id, kind, spec, status, created_at, updated_at) VALUES (?, ?, ?, 'running', ?, ?)",
+            (run_id, kind, json.dumps(spec, ensure_ascii=False), now, now),
+        )
+        return RunCheckpoint(self, run_id)
+
+    def open_run(self, run_id: str) -> Optional["RunCheckpoint"]:
+        if not self.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,)):
+            return None
+        return RunCheckpoint(self, run_id)
+
+    def list_runs(self, limit: int = 50) -> list[dict]:
+        rows = self.execute("SELECT run_id FROM runs ORDER BY created_at DESC LIMIT ?", (limit,))
+        return [RunCheckpoint(self, row["run_id"]).info() for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RunCheckpoint:
+    """Checkpoint operations for one batch run (run_id is the batch id)."""
+
+    def __init__(self, store: CheckpointStore, run_id: str) -> None:
+        self.store = store
+        self.run_id = run_id
+
+    def info(self) -> dict:
+        """실행 정보와 게시글 상태별 개수"""
+        run = self.store.execute("SELECT * FROM runs WHERE run_id = ?", (self.run_id,))[0]
+        counts = {status: 0 for status in ARTICLE_STATUSES}
+        for row in self.store.execute("SELECT status, COUNT(*) AS n FROM articles WHERE run_id = ? GROUP BY status", (self.run_id,)):
+            counts[row["status"]] = row["n"]
+        boards = self.store.execute("SELECT COUNT(*) AS n, SUM(listed) AS listed FROM boards WHERE run_id = ?", (self.run_id,))[0]
+        return {
+            "run_id": self.run_id,
+            "kind": run["kind"],
+            "status": run["status"],
+            "spec": json.loads(run["spec"]),
+            "csv_path": run["csv_path"],
+            "csv_offset": run["csv_offset"],
+            "boards_started": boards["n"],
+            "boards_listed": boards["listed"] or 0,
+            "articles": counts,
+            "created_at": run["created_at"],
+            "updated_at": run["updated_at"],
+        }
+
+    @property
+    def spec(self) -> dict:
+        return json.loads(self.store.execute("SELECT spec FROM runs WHERE run_id = ?", (self.run_id,))[0]["spec"])
+
+    @property
+    def status(self) -> str:
+        return self.store.execute("SELECT status FROM runs WHERE run_id = ?", (self.run_id,))[0]["status"]
+
+    def set_status(self, status: str) -> None:
+        self.store.execute("UPDATE runs SET status = ?, updated_at = ? WHERE run_id = ?", (status, time.time(), self.run_id))
+
+    # 게시판 목록 단계
+
+    def board_state(self, menu_id: str) -> tuple[int, bool]:
+        """(다음에 읽을 페이지, 목록 수집 완료 여부)"""
+        rows = self.store.execute("SELECT next_page, listed FROM boards WHERE run_id = ? AND menu_id = ?", (self.run_id, menu_id))
+        if not rows:
+            return 1, False
+        return rows[0]["next_page"], bool(rows[0]["listed"])
+
+    def listed_articles(self, menu_id: str) -> list[dict]:
+        """이전 실행에서 이미 읽은 페이지의 게시글 (발견 순서)"""
+        rows = self.store.execute(
+            "SELECT meta FROM articles WHERE run_id = ? AND menu_id = ? ORDER BY rowid",
+            (self.run_id, menu_id),
+        )
+        return [json.loads(row["meta"]) for row in rows]
+
+    def record_page(self, menu_id: str, page: int, articles: list[dict]) -> None:
+        """게시판 한 페이지를 읽은 뒤 발견한 게시글과 다음 페이지 위치를 함께 기록"""
+        now = time.time()
+        statements = [
+            (
+                "INSERT OR IGNORE INTO articles (run_id, article_url, menu_id, status, meta, updated_at) VALUES (?, ?, ?, 'listed', ?, ?)",
+                (self.run_id, article["article_url"], menu_id, json.dumps(article, ensure_ascii=False), now),
+            )
+            for article in articles
+        ]
+        statements.append((
+            "INSERT INTO boards (run_id, menu_id, next_page) VALUES (?, ?, ?) "
+            "ON CONFLICT (run_id, menu_id) DO UPDATE SET next_page = excluded.next_page",
+            (self.run_id, menu_id, page + 1),
+        ))
+        statements.append(("UPDATE runs SET updated_at = ? WHERE run_id = ?", (now, self.run_id)))
+        self.store.transaction(statements)
+
+    def finish_listing(self, menu_id: str, article_urls: list[str]) -> None:
+        """목록 수집 완료 - 필터를 통과한 게시글을 상세 수집 대상(pending)으로 표시"""
+        now = time.time()
+        statements = [
+            ("UPDATE articles SET status = 'pending', updated_at = ? WHERE run_id = ? AND article_url = ? AND status = 'listed'", (now, self.run_id, url))
+            for url in article_urls
+        ]
+        statements.append((
+            "INSERT INTO boards (run_id, menu_id, listed) VALUES (?, ?, 1) "
+            "ON CONFLICT (run_id, menu_id) DO UPDATE SET listed = 1",
+            (self.run_id, menu_id),
+        ))
+        self.store.transaction(statements)
+
+    # 상세 수집 단계
+
+    def pending_urls(self, menu_id: str) -> list[str]:
+        """아직 CSV에 기록되지 않은 수집 대상 (이전 실행에서 실패한 게시글 포함)"""
+        rows = self.store.execute(
+            "SELECT article_url FROM articles WHERE run_id = ? AND menu_id = ? AND status IN ('pending', 'failed') ORDER BY rowid",
+            (self.run_id, menu_id),
+        )
+        return [row["article_url"] for row in rows]
+
+    def scraped_count(self) -> int:
+        return self.store.execute("SELECT COUNT(*) AS n FROM articles WHERE run_id = ? AND status = 'scraped'", (self.run_id,))[0]["n"]
+
+    def record_failed(self, article_url: str, error: str) -> None:
+        self.store.execute(
+            "UPDATE articles SET status = 'failed', error = ?, updated_at = ? WHERE run_id = ? AND article_url = ?",
+            (error, time.time(), self.run_id, article_url),
+        )
+
+    def record_written(self, bundles: list[dict], path: str, offset: int) -> None:
+        """CSV 쓰기 스레드가 행을 디스크에 기록한 뒤 호출 - 게시글 완료와 출력 위치를 함께 확정"""
+        now = time.time()
+        # 목록 단계를 거치지 않은 게시글(멀티 프로세스 크롤링)도 기록되도록 upsert
+        statements = [
+            (
+                "INSERT INTO articles (run_id, article_url, menu_id, status, updated_at) VALUES (?, ?, '', 'scraped', ?) "
+                "ON CONFLICT (run_id, article_url) DO UPDATE SET status = 'scraped', error = NULL, updated_at = excluded.updated_at",
+                (self.run_id, bundle.get("article_url"), now),
+            )
+            for bundle in bundles
+        ]
+        statements.append(("UPDATE runs SET csv_path = ?, csv_offset = ?, updated_at = ? WHERE run_id = ?", (path, offset, now, self.run_id)))
+        self.store.transaction(statements)
+
+    def prepare_output(self) -> Optional[str]:
+        """재개 전에 CSV를 마지막으로 확정된 위치까지 자름 (확정되지 않은 행은 다시 수집됨)"""
+        run = self.store.execute("SELECT csv_path, csv_offset FROM runs WHERE run_id = ?", (self.run_id,))[0]
+        path = run["csv_path"]
+        if path and os.path.exists(path) and os.path.getsize(path) > run["csv_offset"]:
+            with open(path, "r+b") as f:
+                f.truncate(run["csv_offset"])
+            print(f"✂️ CSV를 마지막 체크포인트 위치({run['csv_offset']}바이트)까지 정리: {path}")
+        return path
@@ -1,8 +1,12 @@
 import csv
 import os
+import queue
+import threading
+import time
+import weakref
 from datetime import datetime
 import orjson
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 CSV_FIELDS = [
 	"cafe_id",
@@ -18,6 +22,9 @@ CSV_FIELDS = [
 	"scraped_at",
 ]
 
+# 쓰기 대기열 크기 - 가득 차면 스크래퍼가 잠시 기다림 (디스크가 느릴 때 메모리 무한 증가 방지)
+WRITE_QUEUE_SIZE = int(os.getenv("CAFESCRAPER_WRITE_QUEUE", "64"))
+
 
 def _ensure_today_output_dir(base_dir: str) -> str:
 	date_dir = datetime.now().strftime("%Y-%m-%d")
@@ -26,6 +33,22 @@ def _ensure_today_output_dir(base_dir: str) -> str:
 	return target
 
 
+def _bundle_to_row(bundle: Dict[str, Any]) -> Dict[str, str]:
+	return {
+		"cafe_id": bundle.get("cafe_id", ""),
+		"article_id": bundle.get("article_id", ""),
+		"article_url": bundle.get("article_url", ""),
+		"title": bundle.get("title", ""),
+		"author_nickname": bundle.get("author_nickname", ""),
+		"posted_at": bundle.get("posted_at") or "",
+		"content_text": bundle.get("content_text", ""),
+		"content_html": bundle.get("content_html", ""),
+		"images_base64_json": orjson.dumps(bundle.get("images_base64", [])).decode(),
+		"comments_json": orjson.dumps(bundle.get("comments", [])).decode(),
+		"scraped_at": datetime.now().astimezone().isoformat(timespec="seconds"),
+	}
+
+
 def append_article_bundle_row(base_dir: str, bundle: Dict[str, Any], batch_id: str = None) -> str:
 	out_dir = _ensure_today_output_dir(base_dir)
 	
@@ -47,19 +70,7 @@ def append_article_bundle_row(base_dir: str, bundle: Dict[str, Any], batch_id: s
 			csv_path = os.path.join(out_dir, csv_name)
 			counter += 1
 
-	row = {
-		"cafe_id": bundle.get("cafe_id", ""),
-		"article_id": bundle.get("article_id", ""),
-		"article_url": bundle.get("article_url", ""),
-		"title": bundle.get("title", ""),
-		"author_nickname": bundle.get("author_nickname", ""),
-		"posted_at": bundle.get("posted_at") or "",
-		"content_text": bundle.get("content_text", ""),
-		"content_html": bundle.get("content_html", ""),
-		"images_base64_json": orjson.dumps(bundle.get("images_base64", [])).decode(),
-		"comments_json": orjson.dumps(bundle.get("comments", [])).decode(),
-		"scraped_at": datetime.now().astimezone().isoformat(timespec="seconds"),
-	}
+	row = _bundle_to_row(bundle)
 
 	file_exists = os.path.exists(csv_path)
 	with open(csv_path, "a", encoding="utf-8", newline="") as f:
@@ -69,3 +80,225 @@ def append_article_bundle_row(base_dir: str, bundle: Dict[str, Any], batch_id: s
 		writer.writerow(row)
 	return csv_path
 
+
+class CsvSink:
+	"""Job-scoped CSV writer: one file per job, a buffered DictWriter and periodic flushes.
+
+	append_article_bundle_row와 달리 파일을 한 번만 열어 두고 행마다 파일 시스템을 조회하지 않는다.
+	batch_id를 지정하면 기존과 같은 batch_articles_<id>.csv 파일에, path를 지정하면 그 파일에 이어서 쓴다.
+	"""
+
+	def __init__(self, base_dir: str, batch_id: Optional[str] = None, flush_rows: int = 50, flush_seconds: float = 5.0, path: Optional[str] = None) -> None:
+		self.base_dir = base_dir
+		self.batch_id = batch_id
+		self.flush_rows = flush_rows
+		self.flush_seconds = flush_seconds
+		self.path: Optional[str] = path
+		self.rows_written = 0
+		self._file = None
+		self._writer: Optional[csv.DictWriter] = None
+		self._pending = 0
+		self._flushed_offset = 0
+		self._last_flush = time.monotonic()
+
+	def _open(self) -> None:
+		if self.path or self.batch_id:
+			if not self.path:
+				self.path = os.path.join(_ensure_today_output_dir(self.base_dir), f"batch_articles_{self.batch_id}.csv")
+			# 이어 쓰는 파일 - 없거나 비어 있을 때만 헤더 기록 (재개 시 잘라낸 빈 파일 포함)
+			write_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+			self._file = open(self.path, "a", encoding="utf-8", newline="", buffering=1024 * 1024)
+		else:
+			# 작업마다 한 번만 빈 파일명을 찾음 - "x" 모드로 열어 다른 작업과 겹치지 않게 함
+			out_dir = _ensure_today_output_dir(self.base_dir)
+			base_name = datetime.now().strftime("articles_%Y%m%d")
+			self.path = os.path.join(out_dir, f"{base_name}.csv")
+			counter = 1
+			while True:
+				try:
+					self._file = open(self.path, "x", encoding="utf-8", newline="", buffering=1024 * 1024)
+					break
+				except FileExistsError:
+					self.path = os.path.join(out_dir, f"{base_name}_{counter:03d}.csv")
+					counter += 1
+			write_header = True
+		self._writer = csv.DictWriter(self._file, fieldnames=CSV_FIELDS)
+		if write_header:
+			self._writer.writeheader()
+
+	def write(self, bundle: Dict[str, Any]) -> str:
+		"""행 하나를 버퍼에 쓰고, 행 수/시간 기준을 넘으면 디스크로 내보냄"""
+		self.write_row(_bundle_to_row(bundle))
+		return self.path
+
+	def write_row(self, row: Dict[str, str]) -> None:
+		"""이미 직렬화된 행 쓰기"""
+		if self._writer is None:
+			self._open()
+		self._writer.writerow(row)
+		self.rows_written += 1
+		self._pending += 1
+		if self._pending >= self.flush_rows or time.monotonic() - self._last_flush >= self.flush_seconds:
+			self.flush()
+
+	def flush(self) -> None:
+		if self._file is not None and self._pending:
+			self._file.flush()
+			self._flushed_offset = self._file.tell()
+		self._pending = 0
+		self._last_flush = time.monotonic()
+
+	@property
+	def pending(self) -> int:
+		"""버퍼에만 있고 아직 디스크로 내보내지 않은 행 수"""
+		return self._pending
+
+	def tell(self) -> int:
+		"""마지막 flush까지 디스크에 기록된 위치(바이트) - 체크포인트의 출력 위치로 사용 (flush를 일으키지 않음)"""
+		return self._flushed_offset
+
+	def close(self) -> None:
+		if self._file is not None:
+			self.flush()
+			self._file.close()
+			self._file = None
+			self._writer = None
+
+	@property
+	def saved_paths(self) -> list:
+		"""응답의 saved_csvs 필드용 (아무 행도 쓰지 않았으면 빈 목록)"""
+		return [self.path] if self.rows_written else []
+
+	def __enter__(self) -> "CsvSink":
+		return self
+
+	def __exit__(self, *exc_info) -> None:
+		self.close()
+
+
+_STOP = object()
+# 종료 시 닫히지 않은 writer를 정리하기 위한 목록
+_active_writers: "weakref.WeakSet[WriteBehindWriter]" = weakref.WeakSet()
+
+
+class WriteBehindWriter:
+	"""Write-behind CSV output: scrapers put() finished bundles, a thread serializes and writes them.
+
+	대기열이 가득 차면 put()이 기다리므로(backpressure) 디스크가 느려도 메모리가 쌓이지 않는다.
+	close()(또는 with 블록 종료)는 남은 행을 모두 쓰고 파일을 flush한 뒤 반환한다.
+	on_written(bundles, path, offset)을 지정하면 CsvSink가 flush할 때마다(flush_rows/flush_seconds 기준) 쓰기 스레드에서
+	그 사이에 기록된 행 묶음과 디스크 위치로 호출한다.
+	"""
+
+	def __init__(self, sink: CsvSink, max_queue: Optional[int] = None, batch_size: int = 32, on_written: Optional[Callable[[list, str, int], None]] = None) -> None:
+		self.sink = sink
+		self.batch_size = batch_size
+		self.on_written = on_written
+		self.blocked_seconds = 0.0
+		self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue or WRITE_QUEUE_SIZE)
+		self._error: Optional[BaseException] = None
+		self._closed = False
+		self._thread = threading.Thread(target=self._run, name="csv-write-behind", daemon=True)
+		self._thread.start()
+		_active_writers.add(self)
+
+	@property
+	def path(self) -> Optional[str]:
+		return self.sink.path
+
+	@property
+	def saved_paths(self) -> list:
+		return self.sink.saved_paths
+
+	def put(self, bundle: Dict[str, Any]) -> None:
+		"""게시글 하나를 쓰기 대기열에 추가 (대기열이 가득 차면 빌 때까지 대기)"""
+		if self._error is not None:
+			raise RuntimeError(f"CSV writer failed: {self._error}") from self._error
+		if self._closed:
+			raise RuntimeError("CSV writer is closed")
+		try:
+			self._queue.put_nowait(bundle)
+		except queue.Full:
+			start = time.monotonic()
+			self._queue.put(bundle)
+			self.blocked_seconds += time.monotonic() - start
+
+	def writer_for(self, skip_errors: bool = False) -> Callable[[Dict[str, Any]], None]:
+		"""스크래퍼의 on_result 콜백 (skip_errors면 실패한 게시글은 쓰지 않음)"""
+		def on_result(bundle: Dict[str, Any]) -> None:
+			if skip_errors and "error" in bundle:
+				return
+			self.put(bundle)
+		return on_result
+
+	def _run(self) -> None:
+		# 버퍼에 쓰였지만 아직 flush되지 않은 게시글 (flush된 뒤 on_written으로 알림)
+		unflushed: list = []
+		while True:
+			try:
+				# 버퍼에 남은 행이 있으면 flush_seconds까지만 기다린 뒤 내보냄
+				batch = [self._queue.get(timeout=self.sink.flush_seconds if self.sink.pending else None)]
+			except queue.Empty:
+				batch = []
+			# 쌓여 있는 행을 한 번에 가져와 직렬화/쓰기
+			while batch and len(batch) < self.batch_size:
+				try:
+					batch.append(self._queue.get_nowait())
+				except queue.Empty:
+					break
+			stop = any(item is _STOP for item in batch)
+			if self._error is None:
+				try:
+					for bundle in batch:
+						if bundle is _STOP:
+							continue
+						self.sink.write_row(_bundle_to_row(bundle))
+						if self.on_written is not None:
+							unflushed.append(bundle)
+						if not self.sink.pending:
+							unflushed = self._notify_written(unflushed)
+					if not batch or stop:
+						self.sink.flush()
+						unflushed = self._notify_written(unflushed)
+				except BaseException as e:
+					# 이후 put()에서 오류를 알리고, 대기열은 계속 비워 스크래퍼가 멈추지 않게 함
+					self._error = e
+			if stop:
+				return
+
+	def _notify_written(self, bundles: list) -> list:
+		"""flush로 디스크에 기록된 위치까지 확정한 뒤 알림 (체크포인트가 이 위치를 기준으로 재개)"""
+		if bundles and self.on_written is not None:
+			self.on_written(bundles, self.sink.path, self.sink.tell())
+		return []
+
+	def close(self) -> None:
+		"""남은 행을 모두 쓰고 파일을 닫음 (쓰기 중 오류가 있었다면 다시 발생)"""
+		if not self._closed:
+			self._closed = True
+			self._queue.put(_STOP)
+			self._thread.join()
+			self.sink.close()
+			_active_writers.discard(self)
+		if self._error is not None:
+			raise RuntimeError(f"CSV writer failed: {self._error}") from self._error
+
+	def __enter__(self) -> "WriteBehindWriter":
+		return self
+
+	def __exit__(self, exc_type, exc, tb) -> None:
+		try:
+			self.close()
+		except RuntimeError:
+			# 스크래핑 자체가 실패한 경우에는 원래 예외를 유지
+			if exc_type is None:
+				raise
+
+
+def shutdown_writers() -> None:
+	"""서버 종료 시 아직 열려 있는 writer의 남은 행을 모두 기록"""
+	for writer in list(_active_writers):
+		try:
+			writer.close()
+		except Exception as e:
+			print(f"⚠️ CSV writer 종료 실패: {e}")
@@ -0,0 +1,93 @@
+"""
+스트리밍 응답 - 스크래핑 이벤트(진행/게시글/완료)를 NDJSON 또는 SSE로 하나씩 전송
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Iterable, Iterator, Optional
+
+import orjson
+
+STREAM_FORMATS = ("ndjson", "sse")
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+_END = object()
+
+
+def encode_event(event: dict, fmt: str = "ndjson") -> bytes:
+    """이벤트 하나를 한 줄 JSON(NDJSON) 또는 SSE 메시지로 직렬화"""
+    data = orjson.dumps(event)
+    if fmt == "sse":
+        return b"event: " + event.get("event", "message").encode() + b"\ndata: " + data + b"\n\n"
+    return data + b"\n"
+
+
+def _omit(event: dict, omit_fields: frozenset) -> dict:
+    article = event.get("article")
+    if not omit_fields or not isinstance(article, dict):
+        return event
+    return {**event, "article": {key: value for key, value in article.items() if key not in omit_fields}}
+
+
+def stream_events(events: Iterator[dict], fmt: str = "ndjson", omit_fields: Optional[Iterable[str]] = None, heartbeat: float = 5.0, max_queue: int = 16) -> Iterator[bytes]:
+    """Run a blocking event generator in a thread and yield encoded events as they arrive.
+
+    스크래퍼는 별도 스레드에서 돌고, 응답 쪽은 대기열에서 이벤트를 꺼내 바로 전송한다.
+    heartbeat초 동안 새 이벤트가 없으면 경과 시간을 담은 progress 이벤트를 보내 연결을 유지하고,
+    클라이언트가 연결을 끊으면 다음 게시글 경계에서 events를 닫아 스크래핑을 멈춘다.
+    """
+    omit = frozenset(omit_fields or ())
+    # 마지막으로 받은 진행 수치 (heartbeat 이벤트에 함께 보냄)
+    progress = {"articles_scraped": 0, "articles_failed": 0}
+    events_queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+    stop = threading.Event()
+    started = time.monotonic()
+
+    def put(item) -> bool:
+        # 응답이 느리거나 끊긴 경우를 대비해 제한 시간 단위로 재시도
+        while not stop.is_set():
+            try:
+                events_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for event in events:
+                if not put(event):
+                    break
+        except Exception as e:
+            put({"event": "error", "message": str(e)})
+        finally:
+            # 스크래퍼 제너레이터의 정리(브라우저 반납, CSV flush)는 이 스레드에서 실행
+            try:
+                events.close()
+            except Exception as e:
+                print(f"⚠️ 스트리밍 작업 정리 실패: {e}")
+            put(_END)
+
+    producer = threading.Thread(target=produce, name="scrape-stream", daemon=True)
+    producer.start()
+    try:
+        while True:
+            try:
+                event = events_queue.get(timeout=heartbeat)
+            except queue.Empty:
+                yield encode_event({"event": "progress", **progress, "elapsed_seconds": round(time.monotonic() - started, 1)}, fmt)
+                continue
+            if event is _END:
+                break
+            for key in progress:
+                if key in event:
+                    progress[key] = event[key]
+            yield encode_event(_omit(event, omit), fmt)
+    finally:
+        stop.set()
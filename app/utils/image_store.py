@@ -0,0 +1,124 @@
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# 내용 해시(sha256) 기준 저장 - 같은 이미지(프로필, 퍼온 글 이미지 등)는 한 번만 저장
+_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+
+_EXTENSIONS = {
+	"image/jpeg": ".jpg",
+	"image/png": ".png",
+	"image/gif": ".gif",
+	"image/webp": ".webp",
+}
+_MIME_BY_EXT = {ext: mime for mime, ext in _EXTENSIONS.items()}
+
+
+def extension_for(mime: str) -> str:
+	"""MIME 형식에 맞는 파일 확장자 (알 수 없는 형식은 .bin)"""
+	return _EXTENSIONS.get(mime, ".bin")
+
+
+def sniff_mime(data: bytes, default: str = "image/jpeg") -> str:
+	"""파일 시그니처로 이미지 형식 판별 (URL 확장자보다 정확)"""
+	if data.startswith(b"\x89PNG\r\n\x1a\n"):
+		return "image/png"
+	if data.startswith((b"GIF87a", b"GIF89a")):
+		return "image/gif"
+	if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+		return "image/webp"
+	if data.startswith(b"\xff\xd8\xff"):
+		return "image/jpeg"
+	return default
+
+
+class ImageStore:
+	"""Content-addressed image files under <root>/<sha256[:2]>/<sha256>.<ext>."""
+
+	def __init__(self, root: str) -> None:
+		self.root = Path(root)
+		self.root.mkdir(parents=True, exist_ok=True)
+
+	def put(self, data: bytes, mime: Optional[str] = None) -> dict:
+		"""이미지를 저장하고 참조 레코드를 반환 (이미 있으면 쓰지 않음)"""
+		writer = self.writer()
+		writer.write(data)
+		return writer.commit(mime)
+
+	def writer(self) -> "ImageWriter":
+		"""청크 단위로 받아 쓰는 저장기 - 이미지 전체를 메모리에 올리지 않음"""
+		return ImageWriter(self)
+
+	def find(self, digest: str) -> Optional[Path]:
+		"""해시로 저장된 파일 경로 조회 (잘못된 해시나 없는 파일이면 None)"""
+		digest = digest.lower()
+		if not _HASH_RE.match(digest):
+			return None
+		directory = self.root / digest[:2]
+		if not directory.is_dir():
+			return None
+		for ext in list(_EXTENSIONS.values()) + [".bin"]:
+			path = directory / f"{digest}{ext}"
+			if path.exists():
+				return path
+		return None
+
+	@staticmethod
+	def mime_of(path: Path) -> str:
+		return _MIME_BY_EXT.get(path.suffix, "application/octet-stream")
+
+	def _path(self, digest: str, ext: str) -> Path:
+		return self.root / digest[:2] / f"{digest}{ext}"
+
+
+class ImageWriter:
+	"""Stream chunks to a temp file while hashing; commit() moves it to its content address."""
+
+	def __init__(self, store: ImageStore) -> None:
+		self.store = store
+		self.size = 0
+		self._hash = hashlib.sha256()
+		self._head = b""
+		fd, self._tmp_path = tempfile.mkstemp(dir=store.root, suffix=".tmp")
+		self._file = os.fdopen(fd, "wb")
+
+	def write(self, chunk: bytes) -> None:
+		if len(self._head) < 16:
+			self._head += chunk[:16 - len(self._head)]
+		self._hash.update(chunk)
+		self._file.write(chunk)
+		self.size += len(chunk)
+
+	def commit(self, mime: Optional[str] = None) -> dict:
+		"""저장을 확정하고 참조 레코드를 반환 (같은 해시가 이미 있으면 임시 파일만 삭제)"""
+		self._file.close()
+		digest = self._hash.hexdigest()
+		mime = sniff_mime(self._head, mime or "image/jpeg")
+		path = self.store._path(digest, extension_for(mime))
+		try:
+			if path.exists():
+				os.unlink(self._tmp_path)
+			else:
+				path.parent.mkdir(parents=True, exist_ok=True)
+				# 임시 파일을 교체 - 동시에 같은 이미지를 저장해도 깨진 파일이 남지 않음
+				os.replace(self._tmp_path, path)
+		except BaseException:
+			self.abort()
+			raise
+
+		return {
+			"sha256": digest,
+			"mime": mime,
+			"path": str(path.relative_to(self.store.root.parent)),
+			"url": f"/images/{digest}",
+		}
+
+	def abort(self) -> None:
+		"""중단된 다운로드의 임시 파일 삭제"""
+		if not self._file.closed:
+			self._file.close()
+		if os.path.exists(self._tmp_path):
+			os.unlink(self._tmp_path)
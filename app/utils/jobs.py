@@ -0,0 +1,180 @@
+"""
+백그라운드 작업 - 스크래핑 요청을 작업 ID로 등록하고 이벤트 루프 밖의 스레드에서 실행
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed", "cancelled")
+_FINISHED = ("succeeded", "failed", "cancelled")
+
+
+@dataclass
+class Job:
+    """작업 하나의 상태와 진행 수치 (러너 스레드가 갱신하고 API가 snapshot()으로 조회)"""
+    id: str
+    kind: str
+    spec: dict
+    total: Optional[int] = None
+    status: str = "queued"
+    processed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    current: Optional[str] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in _FINISHED
+
+    def record(self, article: dict) -> None:
+        """게시글 하나가 끝날 때마다 러너가 호출"""
+        self.processed += 1
+        if "error" in article:
+            self.failed += 1
+        else:
+            self.succeeded += 1
+        self.current = article.get("title") or article.get("article_url")
+
+    def snapshot(self) -> dict:
+        """진행률, 처리 속도(게시글/분), 남은 시간 추정을 포함한 상태"""
+        end = self.finished_at or time.time()
+        elapsed = end - self.started_at if self.started_at else 0.0
+        rate = self.processed / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.total and rate > 0 and not self.finished:
+            eta = round(max(0, self.total - self.processed) / rate, 1)
+        return {
+            "job_id": self.id,
+            "type": self.kind,
+            "status": self.status,
+            "cancel_requested": self.cancel_requested,
+            "total": self.total,
+            "processed": self.processed,
+            "articles_scraped": self.succeeded,
+            "articles_failed": self.failed,
+            "progress": round(min(1.0, self.processed / self.total), 3) if self.total else None,
+            "current": self.current,
+            "elapsed_seconds": round(elapsed, 1),
+            "articles_per_minute": round(rate * 60, 2),
+            "eta_seconds": eta,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+            "spec": self.spec,
+        }
+
+
+class JobManager:
+    """Run scrape jobs on a thread pool and keep their state for polling and cancellation.
+
+    취소는 협조적으로 동작한다 - 러너가 게시글 경계마다 job.cancel_requested를 확인하고 멈춘다.
+    끝난 작업은 최근 keep개만 보관한다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, keep: int = 100) -> None:
+        self.max_workers = max_workers or int(os.getenv("CAFESCRAPER_JOB_WORKERS", "2"))
+        self.keep = keep
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, kind: str, spec: dict, run: Callable[[Job], Optional[dict]], total: Optional[int] = None) -> Job:
+        """작업을 등록하고 바로 반환 - run(job)은 작업 스레드에서 실행되며 반환값이 job.result가 됨"""
+        job = Job(id=uuid.uuid4().hex[:12], kind=kind, spec=spec, total=total)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scrape-job")
+            self._jobs[job.id] = job
+            self._prune()
+            self._executor.submit(self._run, job, run)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> list[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def snapshot(self, job: Job) -> dict:
+        """작업 상태 조회 - 러너 스레드가 상태를 바꾸는 도중의 값이 섞이지 않도록 잠금 안에서 읽음"""
+        with self._lock:
+            return job.snapshot()
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """취소 요청 (대기 중이면 바로 취소, 실행 중이면 다음 게시글 경계에서 멈춤)"""
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return job
+        job._cancel.set()
+        with self._lock:
+            if job.status == "queued":
+                job.status = "cancelled"
+                job.finished_at = time.time()
+        return job
+
+    def _run(self, job: Job, run: Callable[[Job], Optional[dict]]) -> None:
+        with self._lock:
+            if job.status != "queued":
+                return
+            job.status = "running"
+            job.started_at = time.time()
+        result, error = None, None
+        try:
+            result = run(job)
+        except Exception as e:
+            print(f"❌ 작업 {job.id} 실패: {e}")
+            error = str(e)
+        finally:
+            # 끝난 상태는 조회(snapshot)와 같은 잠금 안에서 한 번에 기록
+            with self._lock:
+                job.result = result
+                job.error = error
+                job.status = "failed" if error is not None else "cancelled" if job.cancel_requested else "succeeded"
+                job.finished_at = time.time()
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.keep)]:
+            del self._jobs[job_id]
+
+    def status(self) -> dict:
+        with self._lock:
+            counts = {status: 0 for status in JOB_STATUSES}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        return {"max_workers": self.max_workers, **counts}
+
+    def shutdown(self, timeout: float = 30.0) -> None:
+        """서버 종료 시 모든 작업에 취소를 요청하고, 실행 중인 작업이 멈출 때까지 최대 timeout초 대기"""
+        for job in self.list():
+            self.cancel(job.id)
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        executor.shutdown(wait=False, cancel_futures=True)
+        deadline = time.monotonic() + timeout
+        while any(job.status == "running" for job in self.list()) and time.monotonic() < deadline:
+            time.sleep(0.1)
@@ -0,0 +1,304 @@
+"""
+수집 이력 - 이전 실행에서 CSV에 기록한 게시글을 (cafe_id, article_id)로 기억해 다시 수집하지 않음
+게시판별로 지금까지 본 가장 큰 article_id도 함께 기록 (증분 크롤링)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    cafe_id TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    scraped_at REAL NOT NULL,
+    PRIMARY KEY (cafe_id, article_id)
+);
+CREATE TABLE IF NOT EXISTS board_marks (
+    cafe_id TEXT NOT NULL,
+    menu_id TEXT NOT NULL,
+    max_article_id INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (cafe_id, menu_id)
+);
+CREATE TABLE IF NOT EXISTS board_listings (
+    cafe_id TEXT NOT NULL,
+    menu_id TEXT NOT NULL,
+    newest_article_id INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (cafe_id, menu_id)
+);
+CREATE TABLE IF NOT EXISTS board_pending (
+    cafe_id TEXT NOT NULL,
+    menu_id TEXT NOT NULL,
+    article_cafe_id TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    article_no INTEGER NOT NULL,
+    PRIMARY KEY (cafe_id, menu_id, article_cafe_id, article_id)
+);
+CREATE INDEX IF NOT EXISTS board_pending_article ON board_pending (article_cafe_id, article_id);
+"""
+
+# 한 번에 조회할 키 수 (SQLite 변수 개수 제한 안에서)
+_QUERY_CHUNK = 400
+
+DEDUP_MODES = ("always", "skip", "refresh")
+
+
+@dataclass(frozen=True)
+class DedupPolicy:
+    """mode: always(항상 수집), skip(수집한 적 있으면 건너뜀), refresh(max_age_hours보다 오래된 것만 다시 수집)"""
+    mode: str = "always"
+    max_age_hours: float = 24.0
+
+    def __post_init__(self) -> None:
+        if self.mode not in DEDUP_MODES:
+            raise ValueError(f"Unknown dedup mode: {self.mode}")
+
+    @classmethod
+    def from_env(cls) -> "DedupPolicy":
+        """CAFESCRAPER_DEDUP(always/skip/refresh), CAFESCRAPER_DEDUP_MAX_AGE_HOURS (기본: always)"""
+        return cls(
+            mode=os.getenv("CAFESCRAPER_DEDUP", "always").lower(),
+            max_age_hours=float(os.getenv("CAFESCRAPER_DEDUP_MAX_AGE_HOURS", "24")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "always"
+
+    def should_skip(self, scraped_at: Optional[float], now: float) -> bool:
+        if scraped_at is None or self.mode == "always":
+            return False
+        if self.mode == "skip":
+            return True
+        return now - scraped_at < self.max_age_hours * 3600
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys (false positives only, never false negatives)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(64, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        # 해시 하나를 두 값으로 나눠 k개의 위치를 만듦 (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+def _key(cafe_id: str, article_id: str) -> str:
+    return f"{cafe_id}:{article_id}"
+
+
+class SeenIndex:
+    """SQLite record of scraped articles with an in-memory Bloom filter in front.
+
+    처음 보는 게시글(대부분)은 Bloom 필터에서 바로 걸러져 SQLite를 조회하지 않는다.
+    필터가 용량을 넘기면 두 배 크기로 다시 만든다.
+    """
+
+    def __init__(self, path: str, capacity: int = 100_000) -> None:
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        self._stats = {"lookups": 0, "bloom_negative": 0, "db_hits": 0, "skipped": 0, "marked": 0}
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._rebuild(capacity)
+
+    def _rebuild(self, capacity: int) -> None:
+        """SQLite의 모든 키로 Bloom 필터를 다시 만듦 (잠금을 잡은 상태에서 호출)"""
+        total = self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        bloom = BloomFilter(max(capacity, total * 2))
+        for cafe_id, article_id in self._conn.execute("SELECT cafe_id, article_id FROM seen"):
+            bloom.add(_key(cafe_id, article_id))
+        self._bloom = bloom
+
+    def scraped_times(self, refs: Iterable[tuple[str, str]]) -> dict[tuple[str, str], float]:
+        """(cafe_id, article_id) 목록 중 수집한 적 있는 것의 마지막 수집 시각"""
+        refs = list(dict.fromkeys(refs))
+        with self._lock:
+            self._stats["lookups"] += len(refs)
+            candidates = [ref for ref in refs if _key(*ref) in self._bloom]
+            self._stats["bloom_negative"] += len(refs) - len(candidates)
+            found = {}
+            for start in range(0, len(candidates), _QUERY_CHUNK):
+                chunk = candidates[start:start + _QUERY_CHUNK]
+                placeholders = ", ".join("(?, ?)" for _ in chunk)
+                params = [value for ref in chunk for value in ref]
+                rows = self._conn.execute(
+                    f"SELECT cafe_id, article_id, scraped_at FROM seen WHERE (cafe_id, article_id) IN (VALUES {placeholders})",
+                    params,
+                )
+                for cafe_id, article_id, scraped_at in rows:
+                    found[(cafe_id, article_id)] = scraped_at
+            self._stats["db_hits"] += len(found)
+        return found
+
+    def mark(self, refs: Iterable[tuple[str, str]], scraped_at: Optional[float] = None) -> None:
+        """게시글을 수집 완료로 기록 (이미 있으면 수집 시각만 갱신)"""
+        refs = list(dict.fromkeys(refs))
+        if not refs:
+            return
+        now = scraped_at or time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO seen (cafe_id, article_id, scraped_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT (cafe_id, article_id) DO UPDATE SET scraped_at = excluded.scraped_at",
+                    [(cafe_id, article_id, now) for cafe_id, article_id in refs],
+                )
+                self._conn.executemany(
+                    "DELETE FROM board_pending WHERE article_cafe_id = ? AND article_id = ?",
+                    refs,
+                )
+                self._advance_board_marks()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            for ref in refs:
+                key = _key(*ref)
+                if key not in self._bloom:
+                    self._bloom.add(key)
+            self._stats["marked"] += len(refs)
+            if self._bloom.count > self._bloom.capacity:
+                self._rebuild(self._bloom.capacity * 2)
+
+    def mark_bundles(self, bundles: list[dict]) -> None:
+        """CSV에 기록된 게시글 레코드를 수집 완료로 기록 (오류 레코드와 ID를 모르는 레코드는 제외)"""
+        self.mark(
+            (str(bundle["cafe_id"]), str(bundle["article_id"]))
+            for bundle in bundles
+            if "error" not in bundle and bundle.get("cafe_id") not in (None, "", "unknown") and bundle.get("article_id") not in (None, "", "unknown")
+        )
+
+    def count_skipped(self, count: int) -> None:
+        with self._lock:
+            self._stats["skipped"] += count
+
+    def high_water_mark(self, cafe_id: str, menu_id: str) -> Optional[int]:
+        """게시판에서 지금까지 본 가장 큰 article_id (증분 크롤링 기준, 처음이면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT max_article_id FROM board_marks WHERE cafe_id = ? AND menu_id = ?",
+                (cafe_id, menu_id),
+            ).fetchone()
+        return row[0] if row else None
+
+    def raise_high_water_mark(self, cafe_id: str, menu_id: str, article_id: int) -> None:
+        """기준 article_id를 올림 (더 작은 값으로는 내려가지 않음)"""
+        with self._lock:
+            self._raise_mark(cafe_id, menu_id, article_id)
+
+    def _raise_mark(self, cafe_id: str, menu_id: str, article_id: int) -> None:
+        self._conn.execute(
+            "INSERT INTO board_marks (cafe_id, menu_id, max_article_id, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (cafe_id, menu_id) DO UPDATE SET max_article_id = MAX(max_article_id, excluded.max_article_id), updated_at = excluded.updated_at",
+            (cafe_id, menu_id, article_id, time.time()),
+        )
+
+    def track_board_listing(self, cafe_id: str, menu_id: str, newest: int, pending: Iterable[tuple[str, str]]) -> None:
+        """끝까지 읽은 게시판 목록을 기록 - 기준은 목록의 수집 대상(pending)이 CSV에 기록된 만큼만 올라감
+
+        기준은 아직 기록되지 않은 가장 작은 article_id 아래에 머물고, 모두 기록되면 newest까지 올라간다.
+        실패하거나 중단된 게시글은 다음 실행에서 다시 목록에 나온다. 같은 게시판을 다시 읽으면 이전 목록을 대체한다.
+        """
+        rows = [
+            (cafe_id, menu_id, article_cafe_id, article_id, int(article_id))
+            for article_cafe_id, article_id in dict.fromkeys(pending)
+            if article_id.isdigit()
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM board_pending WHERE cafe_id = ? AND menu_id = ?", (cafe_id, menu_id))
+                self._conn.execute(
+                    "INSERT INTO board_listings (cafe_id, menu_id, newest_article_id, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (cafe_id, menu_id) DO UPDATE SET newest_article_id = excluded.newest_article_id, updated_at = excluded.updated_at",
+                    (cafe_id, menu_id, newest, time.time()),
+                )
+                self._conn.executemany("INSERT OR IGNORE INTO board_pending VALUES (?, ?, ?, ?, ?)", rows)
+                self._advance_board_marks()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _advance_board_marks(self) -> None:
+        """기록 대기 중인 게시판 목록의 기준을 올림 (잠금과 트랜잭션 안에서 호출)"""
+        listings = self._conn.execute(
+            "SELECT l.cafe_id, l.menu_id, l.newest_article_id, MIN(p.article_no) FROM board_listings l "
+            "LEFT JOIN board_pending p ON p.cafe_id = l.cafe_id AND p.menu_id = l.menu_id "
+            "GROUP BY l.cafe_id, l.menu_id"
+        ).fetchall()
+        for cafe_id, menu_id, newest, lowest_pending in listings:
+            if lowest_pending is None:
+                self._raise_mark(cafe_id, menu_id, newest)
+                self._conn.execute("DELETE FROM board_listings WHERE cafe_id = ? AND menu_id = ?", (cafe_id, menu_id))
+            else:
+                self._raise_mark(cafe_id, menu_id, lowest_pending - 1)
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+            boards = self._conn.execute("SELECT COUNT(*) FROM board_marks").fetchone()[0]
+            return {
+                **self._stats,
+                "entries": entries,
+                "board_marks": boards,
+                "bloom_bits": self._bloom.num_bits,
+                "bloom_hashes": self._bloom.num_hashes,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# 프로세스마다 경로별로 하나씩 공유 (워커 프로세스는 처음 사용할 때 따로 엶)
+_indexes: dict[str, SeenIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_seen_index(path: str) -> SeenIndex:
+    path = os.path.abspath(path)
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = _indexes[path] = SeenIndex(path)
+        return index
+
+
+def close_seen_indexes() -> None:
+    with _indexes_lock:
+        for index in _indexes.values():
+            index.close()
+        _indexes.clear()
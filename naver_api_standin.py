@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+네이버 카페 API 대역 서버 - fixtures/naver_api/의 기록된 응답으로 hybrid(HTTP) 수집 경로를 테스트
+사용법: python naver_api_standin.py [포트]
+        CAFESCRAPER_API_BASE=http://127.0.0.1:8765 로 서버를 실행하면 실제 네이버 대신 이 서버를 호출
+"""
+import json
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "naver_api"
+
+# 로그인 쿠키 (없으면 401 - HttpLoginRequired 경로 확인용)
+LOGIN_COOKIE = "NID_AUT"
+# 멤버 전용 게시글 (200 응답이지만 errorCode로 로그인 요구)
+MEMBERS_ONLY_ARTICLE = "1003"
+
+_BOARD_LIST = re.compile(r"^/cafe-web/cafe2/ArticleListV2dot1\.json$")
+_ARTICLE = re.compile(r"^/cafe-web/cafe-articleapi/v[\d.]+/cafes/(\d+)/articles/(\d+)$")
+_COMMENTS = re.compile(r"^/cafe-web/cafe-articleapi/v[\d.]+/cafes/(\d+)/articles/(\d+)/comments/pages/(\d+)$")
+
+
+def _fixture(name: str) -> dict:
+    with open(FIXTURES_DIR / name, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Serve recorded board list / article / comment API responses."""
+
+    # 요청 경로별 호출 수 (테스트에서 페이지네이션 확인용)
+    hits: dict = {}
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        StandinHandler.hits[path] = StandinHandler.hits.get(path, 0) + 1
+
+        if f"{LOGIN_COOKIE}=" not in (self.headers.get("Cookie") or ""):
+            return self._send(401, {"errorCode": "LOGIN_REQUIRED"})
+
+        if _BOARD_LIST.match(path):
+            return self._send(200, _fixture("board_list.json"))
+
+        match = _COMMENTS.match(path)
+        if match:
+            page = int(match.group(3))
+            if page in (1, 2):
+                return self._send(200, _fixture(f"comments_page{page}.json"))
+            return self._send(200, {"result": {"comments": {"hasNext": False, "items": []}}})
+
+        match = _ARTICLE.match(path)
+        if match:
+            if match.group(2) == MEMBERS_ONLY_ARTICLE:
+                return self._send(200, _fixture("members_only.json"))
+            return self._send(200, _fixture("article.json"))
+
+        self._send(404, {"errorCode": "NOT_FOUND"})
+
+    def _send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_standin(port: int = 0) -> tuple[ThreadingHTTPServer, str]:
+    """백그라운드 스레드로 대역 서버 시작 - (서버, API 기본 주소) 반환 (port=0이면 빈 포트 사용)"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), StandinHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    server = ThreadingHTTPServer(("127.0.0.1", port), StandinHandler)
+    print(f"🧪 네이버 API 대역 서버: http://127.0.0.1:{port} (로그인 쿠키: {LOGIN_COOKIE})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+hybrid(HTTP) 수집 경로 테스트 - 로컬 대역 서버(naver_api_standin.py)의 기록된 응답으로 확인
+사용법: python test_http_fetch.py  (또는 python -m pytest test_http_fetch.py)
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add app directory to path
+sys.path.append(str(Path(__file__).parent))
+
+from app.scraper.http_client import HttpFetcher, HttpLoginRequired
+from app.scraper.naver import NaverScraper
+from naver_api_standin import LOGIN_COOKIE, MEMBERS_ONLY_ARTICLE, StandinHandler, start_standin
+
+BOARD_URL = "https://cafe.naver.com/ArticleList.nhn?search.clubid=123&search.menuid=7&clubid=123&menuid=7"
+ARTICLE_URL = "https://cafe.naver.com/ArticleRead.nhn?clubid=123&articleid=1002"
+MEMBERS_ONLY_URL = f"https://cafe.naver.com/ArticleRead.nhn?clubid=123&articleid={MEMBERS_ONLY_ARTICLE}"
+
+server, API_BASE = start_standin()
+
+
+def _sessions_dir(logged_in: bool) -> Path:
+    """브라우저가 저장하는 것과 같은 형식의 쿠키 파일을 둔 세션 디렉터리"""
+    sessions_dir = Path(tempfile.mkdtemp()) / "sessions"
+    sessions_dir.mkdir()
+    if logged_in:
+        cookies = [{"name": LOGIN_COOKIE, "value": "test", "domain": ".naver.com", "path": "/"}]
+        with open(sessions_dir / "naver_cookies.json", "w", encoding="utf-8") as f:
+            json.dump(cookies, f)
+    return sessions_dir
+
+
+def _fetcher(logged_in: bool = True) -> HttpFetcher:
+    return HttpFetcher(_sessions_dir(logged_in) / "naver_cookies.json", api_base=API_BASE, min_interval=0)
+
+
+def _scraper(logged_in: bool = True) -> NaverScraper:
+    sessions_dir = _sessions_dir(logged_in)
+    scraper = NaverScraper(str(sessions_dir), str(sessions_dir.parent / "snapshots"), fetch_mode="hybrid", image_processing="none")
+    scraper._http = HttpFetcher(scraper._cookie_file, api_base=API_BASE, throttle=scraper._throttle, min_interval=0)
+    return scraper
+
+
+def test_board_page():
+    """게시판 목록 API - 브라우저 경로와 같은 형태의 게시글 목록"""
+    articles = _fetcher().fetch_board_page(BOARD_URL, 1)
+    assert [article["article_id"] for article in articles] == ["1002", "1001"]
+    assert articles[0]["article_url"] == ARTICLE_URL
+    assert articles[0]["title"] == "이번 주 모임 공지"
+    assert articles[0]["author_nickname"] == "운영자"
+    assert articles[0]["posted_at"]
+
+
+def test_article_reads_every_comment_page():
+    """게시글 API + 댓글 API 전체 페이지 (삭제된 댓글 제외, 다음 페이지가 없으면 중단)"""
+    StandinHandler.hits.clear()
+    raw = _fetcher().fetch_article(ARTICLE_URL)
+    assert raw["title"] == "이번 주 모임 공지"
+    assert raw["author"] == "운영자"
+    assert "토요일 2시" in raw["content_text"]
+    assert raw["image_sources"] == ["https://cafeptthumb-phinf.pstatic.net/sample.jpg"]
+    assert [comment["author"] for comment in raw["comments"]] == ["새싹회원", "늦은회원"]
+    comment_pages = [path for path in StandinHandler.hits if "/comments/pages/" in path]
+    assert sorted(comment_pages)[-1].endswith("/pages/2") and len(comment_pages) == 2
+
+
+def test_projection_skips_comment_pages():
+    """댓글을 고르지 않으면 댓글 API를 호출하지 않고, 이미지 주소/본문도 만들지 않음"""
+    StandinHandler.hits.clear()
+    raw = _fetcher().fetch_article(ARTICLE_URL, max_images=0, comments=False, content=False)
+    assert raw["title"] == "이번 주 모임 공지"
+    assert raw["comments"] == [] and raw["image_sources"] == [] and raw["content_text"] is None
+    assert not [path for path in StandinHandler.hits if "/comments/pages/" in path]
+    scraper = _scraper()
+    scraper._select_fields({"title"})
+    StandinHandler.hits.clear()
+    assert scraper._scrape_article_http(ARTICLE_URL, None, None)["title"] == "이번 주 모임 공지"
+    assert not [path for path in StandinHandler.hits if "/comments/pages/" in path]
+
+
+def test_requests_are_paced():
+    """요청 간격 제한이 없어도 HTTP 세션은 요청 사이에 min_interval만큼 대기 (게시글 + 댓글 2페이지 = 요청 3개)"""
+    fetcher = HttpFetcher(_sessions_dir(True) / "naver_cookies.json", api_base=API_BASE, min_interval=0.2)
+    start = time.monotonic()
+    fetcher.fetch_article(ARTICLE_URL)
+    assert time.monotonic() - start >= 0.4
+
+
+def test_login_required():
+    """쿠키가 없으면 401 → HttpLoginRequired"""
+    fetcher = _fetcher(logged_in=False)
+    for call in (lambda: fetcher.fetch_article(ARTICLE_URL), lambda: fetcher.fetch_board_page(BOARD_URL, 1)):
+        try:
+            call()
+        except HttpLoginRequired:
+            continue
+        raise AssertionError("HttpLoginRequired not raised")
+    # 200 응답이지만 errorCode로 로그인을 요구하는 멤버 전용 글
+    try:
+        _fetcher().fetch_article(MEMBERS_ONLY_URL)
+    except HttpLoginRequired:
+        return
+    raise AssertionError("HttpLoginRequired not raised for members-only article")
+
+
+def test_scraper_http_success():
+    """hybrid 스크래퍼가 HTTP만으로 게시글 레코드를 완성하고 댓글 필터를 적용"""
+    result = _scraper()._scrape_article_http(ARTICLE_URL, ["늦은"], None)
+    assert result is not None
+    assert (result["cafe_id"], result["article_id"]) == ("123", "1002")
+    assert result["title"] == "이번 주 모임 공지"
+    assert [comment["nickname"] for comment in result["comments"]] == ["늦은회원"]
+    assert result["images_base64"] == []
+
+
+def test_scraper_falls_back_to_browser():
+    """로그인이 필요하면 HTTP 경로가 None을 돌려줘 호출자가 Chrome으로 처리"""
+    scraper = _scraper(logged_in=False)
+    assert scraper._scrape_article_http(ARTICLE_URL, None, None) is None
+    assert scraper._fetch_board_page_http(BOARD_URL, 1) is None
+    assert _scraper()._scrape_article_http(MEMBERS_ONLY_URL, None, None) is None
+    # 숫자 카페 ID가 없는 URL은 HTTP 경로를 쓰지 않음
+    assert _scraper()._scrape_article_http("https://cafe.naver.com/somecafe/1002", None, None) is None
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_") and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    server.shutdown()
+    print(f"📊 {len(tests) - failed}/{len(tests)} 통과")
+    sys.exit(1 if failed else 0)